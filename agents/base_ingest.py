@@ -1,6 +1,10 @@
 """Base abstraction layer for data ingestion agents."""
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Any
+
+# Upper bound on parallel requests one agent makes to its source
+FETCH_CONCURRENCY = 4
 
 
 class BaseIngestAgent(ABC):
@@ -47,3 +51,40 @@ class BaseIngestAgent(ABC):
             }
         """
         pass
+    
+    def _fetch_each(
+        self,
+        fetch: Callable[[str], List[Dict[str, Any]]],
+        keys: List[str],
+        label: str
+    ) -> List[Dict[str, Any]]:
+        """Run fetch for every key in parallel and concatenate the results.
+        
+        Each call is an independent network round-trip, so overlapping them
+        cuts wall time to roughly the slowest request. Results keep the order
+        of keys; a key whose fetch raises is logged and skipped.
+        
+        Args:
+            fetch: Callable returning standardized posts for one key
+            keys: Feed URLs, tags, etc. to fetch
+            label: Human-readable key description for warnings
+        
+        Returns:
+            Posts from all keys that fetched successfully
+        """
+        if not keys:
+            return []
+        
+        all_posts = []
+        workers = min(FETCH_CONCURRENCY, len(keys))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(fetch, key) for key in keys]
+            for key, future in zip(keys, futures):
+                try:
+                    all_posts.extend(future.result())
+                except Exception as e:
+                    print(f"Warning: Failed to fetch {label} '{key}': {e}")
+                    # Continue with other keys
+                    continue
+        
+        return all_posts
@@ -1,8 +1,8 @@
 """File-based data ingestion agent for manual curation."""
 from typing import List, Dict, Any
-import json
 import csv
 import os
+import orjson
 from agents.base_ingest import BaseIngestAgent
 
 
@@ -63,8 +63,8 @@ class FileIngestAgent(BaseIngestAgent):
         Returns:
             List of standardized posts
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(file_path, 'rb') as f:
+            data = orjson.loads(f.read())
         
         if not isinstance(data, list):
             data = [data]
@@ -1,7 +1,7 @@
 """HackerNews data ingestion agent using Algolia API."""
 from typing import List, Dict, Any
-import requests
 from agents.base_ingest import BaseIngestAgent
+from services.http_session import get_http_session
 
 
 class HackerNewsIngestAgent(BaseIngestAgent):
@@ -25,24 +25,11 @@ class HackerNewsIngestAgent(BaseIngestAgent):
         Raises:
             Exception: If HackerNews API is unavailable
         """
-        all_posts = []
-        
-        # Parse story types from config
+        # Parse story types from config and map them to search tags
         story_types = [s.strip().lower() for s in self.settings.hn_story_types.split(',')]
+        tags = [tag for tag in map(self._get_search_tag, story_types) if tag]
         
-        for story_type in story_types:
-            # Map story type to search tag
-            tag = self._get_search_tag(story_type)
-            if not tag:
-                continue
-            
-            try:
-                posts = self._fetch_by_tag(tag)
-                all_posts.extend(posts)
-            except Exception as e:
-                print(f"Warning: Failed to fetch HN posts for tag '{tag}': {e}")
-                # Continue with other tags
-                continue
+        all_posts = self._fetch_each(self._fetch_by_tag, tags, "HN posts for tag")
         
         # Sort by score and limit
         all_posts.sort(key=lambda x: x['score'], reverse=True)
@@ -75,7 +62,7 @@ class HackerNewsIngestAgent(BaseIngestAgent):
             'hitsPerPage': self.settings.hn_post_limit
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        response = get_http_session().get(url, params=params, timeout=10)
         response.raise_for_status()
         
         data = response.json()
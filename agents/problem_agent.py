@@ -1,4 +1,5 @@
 import os
+from typing import List, Optional
 from services.llm_client import LLMClient
 from services.sanitizer import InputSanitizer
 from models.problem import Problem
@@ -33,37 +34,80 @@ def _truncate_preserving_boundary(text: str, max_length: int) -> str:
     return candidate[: best_pos + 1]
 
 
-def extract_problem(post_data: dict, llm_client: LLMClient, sales_feedback_text: str = None) -> dict:
-    sanitizer = InputSanitizer()
-    
-    prompt_path = os.path.join(os.path.dirname(__file__), "..", "prompts", "problem_extraction.txt")
+PROMPT_PATH = os.path.join(os.path.dirname(__file__), "..", "prompts", "problem_extraction.txt")
+
+SALES_FEEDBACK_SUFFIX = "\n\nSALES FEEDBACK:\n{feedback}\n\nConsider recent sales performance when evaluating this problem. Favor topics similar to products that sold well. Be cautious about topics similar to products with zero sales."
+
+# Appended when several posts share one request; each result echoes its
+# post id so the answers can be matched back even if the model reorders them
+BATCH_INSTRUCTIONS = """
+
+BATCH MODE:
+The input above contains several posts, each starting with "Post ID:".
+Evaluate each post independently with the rules and schema above.
+Return a JSON object of the form {"results": [...]} with exactly one
+object per post, each including an extra "id" field set to its Post ID."""
+
+# Output tokens allowed per post, for single and batched extraction
+PROBLEM_MAX_TOKENS = 1500
+
+# (context window, max output tokens) per model, matched by the longest
+# name prefix of the configured model; unknown models get gpt-4's limits
+MODEL_TOKEN_LIMITS = {
+    'gpt-4': (8192, 4096),
+    'gpt-4-32k': (32768, 4096),
+    'gpt-4-turbo': (128000, 4096),
+    'gpt-4o': (128000, 16384),
+    'gpt-3.5-turbo': (16385, 4096),
+}
+DEFAULT_TOKEN_LIMITS = (8192, 4096)
+
+# Headroom for the prompt token estimate (a rough character count when
+# tiktoken is unavailable) and the chat message framing
+PROMPT_TOKEN_MARGIN = 256
+
+
+def _load_prompt_template() -> str:
     try:
-        with open(prompt_path, 'r', encoding='utf-8') as f:
-            prompt_template = f.read()
+        with open(PROMPT_PATH, 'r', encoding='utf-8') as f:
+            return f.read()
     except OSError as e:
-        raise RuntimeError(f"Failed to read problem extraction prompt file at {prompt_path}: {e}") from e
-    
+        raise RuntimeError(f"Failed to read problem extraction prompt file at {PROMPT_PATH}: {e}") from e
+
+
+def _format_post(post_data: dict, sanitizer: InputSanitizer) -> str:
     body_text = post_data.get('body', '')
     # Sanitize Reddit content before processing
     body_text = sanitizer.sanitize_reddit_content(body_text)
     truncated_body = _truncate_preserving_boundary(body_text, 2000)
     
-    reddit_text = f"""
+    return f"""
 Title: {post_data['title']}
 Subreddit: r/{post_data['subreddit']}
 Author: {post_data['author']}
 Score: {post_data['score']}
 Content: {truncated_body}
 """
+
+
+def _token_limits(model: str) -> tuple:
+    """Return (context window, max output tokens) for a model name."""
+    matches = [name for name in MODEL_TOKEN_LIMITS if model.startswith(name)]
+    if not matches:
+        return DEFAULT_TOKEN_LIMITS
+    return MODEL_TOKEN_LIMITS[max(matches, key=len)]
+
+
+def _batch_prompt(prompt_template: str, posts_text: str, sales_feedback_text: Optional[str]) -> str:
+    system_prompt = prompt_template.replace('<<REDDIT_POSTS_AND_COMMENTS>>', posts_text) + BATCH_INSTRUCTIONS
     
-    system_prompt = prompt_template.replace('<<REDDIT_POSTS_AND_COMMENTS>>', reddit_text)
-    
-    # Inject sales feedback if provided
     if sales_feedback_text:
-        system_prompt = system_prompt + f"\n\nSALES FEEDBACK:\n{sales_feedback_text}\n\nConsider recent sales performance when evaluating this problem. Favor topics similar to products that sold well. Be cautious about topics similar to products with zero sales."
-    
-    result = llm_client.call_structured(system_prompt, "", max_tokens=1500)
+        system_prompt = system_prompt + SALES_FEEDBACK_SUFFIX.format(feedback=sales_feedback_text)
     
+    return system_prompt
+
+
+def _to_problem_dict(result: dict) -> dict:
     problem = Problem(
         discard=result.get("discard", True),
         problem_summary=result.get("problem_summary", ""),
@@ -75,3 +119,70 @@ Content: {truncated_body}
     )
     
     return problem.to_dict()
+
+
+def extract_problem(post_data: dict, llm_client: LLMClient, sales_feedback_text: str = None) -> dict:
+    sanitizer = InputSanitizer()
+    prompt_template = _load_prompt_template()
+    reddit_text = _format_post(post_data, sanitizer)
+    
+    system_prompt = prompt_template.replace('<<REDDIT_POSTS_AND_COMMENTS>>', reddit_text)
+    
+    # Inject sales feedback if provided
+    if sales_feedback_text:
+        system_prompt = system_prompt + SALES_FEEDBACK_SUFFIX.format(feedback=sales_feedback_text)
+    
+    # Deterministic so reposted threads are answered from the LLM cache
+    result = llm_client.call_structured(system_prompt, "", max_tokens=PROBLEM_MAX_TOKENS, temperature=0)
+    
+    return _to_problem_dict(result)
+
+
+def extract_problems_batch(posts: List[dict], llm_client: LLMClient,
+                           sales_feedback_text: str = None) -> List[Optional[dict]]:
+    """Extract problems for several posts with a single LLM call.
+    
+    Args:
+        posts: Post dicts as passed to extract_problem
+        llm_client: LLM client
+        sales_feedback_text: Optional sales feedback for conditioning
+    
+    Returns:
+        One problem dict per post, in input order; None for any post the
+        model did not return a result for, or that did not fit in the
+        model's token limits (callers fall back to extract_problem for those)
+    """
+    sanitizer = InputSanitizer()
+    prompt_template = _load_prompt_template()
+    formatted = [f"\nPost ID: {post['id']}{_format_post(post, sanitizer)}" for post in posts]
+    context_tokens, output_tokens = _token_limits(llm_client.model)
+    
+    # Drop posts from the end until the prompt plus every post's output
+    # allowance fits the model; the dropped posts are extracted one by one
+    count = len(posts)
+    while count > 1:
+        system_prompt = _batch_prompt(prompt_template, "".join(formatted[:count]), sales_feedback_text)
+        prompt_tokens = llm_client.cost_governor.estimate_tokens(system_prompt)
+        budget = min(output_tokens, context_tokens - prompt_tokens - PROMPT_TOKEN_MARGIN)
+        if PROBLEM_MAX_TOKENS * count <= budget:
+            break
+        count -= 1
+    if count < 2:
+        return [None] * len(posts)
+    
+    result = llm_client.call_structured(system_prompt, "", max_tokens=PROBLEM_MAX_TOKENS * count, temperature=0)
+    
+    results = result.get("results")
+    if not isinstance(results, list):
+        return [None] * len(posts)
+    
+    by_id = {
+        str(item.get("id")): item
+        for item in results
+        if isinstance(item, dict) and item.get("id") is not None
+    }
+    problems = []
+    for post in posts[:count]:
+        item = by_id.get(str(post['id']))
+        problems.append(_to_problem_dict(item) if item is not None else None)
+    return problems + [None] * (len(posts) - count)
@@ -1,10 +1,11 @@
 """RSS/Atom feed data ingestion agent."""
 from typing import List, Dict, Any
 import hashlib
+import time
 from datetime import datetime
 import xml.etree.ElementTree as ET
-import requests
 from agents.base_ingest import BaseIngestAgent
+from services.http_session import get_http_session
 
 
 class RSSIngestAgent(BaseIngestAgent):
@@ -30,19 +31,8 @@ class RSSIngestAgent(BaseIngestAgent):
             return []
         
         feed_urls = [url.strip() for url in self.settings.rss_feed_urls.split(',')]
-        all_posts = []
-        
-        for feed_url in feed_urls:
-            if not feed_url:
-                continue
-            
-            try:
-                posts = self._fetch_from_feed(feed_url)
-                all_posts.extend(posts)
-            except Exception as e:
-                print(f"Warning: Failed to fetch RSS feed '{feed_url}': {e}")
-                # Continue with other feeds
-                continue
+        feed_urls = [url for url in feed_urls if url]
+        all_posts = self._fetch_each(self._fetch_from_feed, feed_urls, "RSS feed")
         
         # Sort by date (newest first) and limit
         all_posts.sort(key=lambda x: x['created_utc'], reverse=True)
@@ -57,7 +47,7 @@ class RSSIngestAgent(BaseIngestAgent):
         Returns:
             List of standardized posts
         """
-        response = requests.get(feed_url, timeout=10)
+        response = get_http_session().get(feed_url, timeout=10)
         response.raise_for_status()
         
         # Parse XML
@@ -182,7 +172,7 @@ class RSSIngestAgent(BaseIngestAgent):
             Unix timestamp (float), or current time if parsing fails
         """
         if not date_str:
-            return datetime.now().timestamp()
+            return time.time()
         
         # Try common date formats
         formats = [
@@ -200,4 +190,4 @@ class RSSIngestAgent(BaseIngestAgent):
                 continue
         
         # Fallback to current time if parsing fails
-        return datetime.now().timestamp()
+        return time.time()
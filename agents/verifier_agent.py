@@ -1,8 +1,38 @@
 import os
+import re
+from typing import Optional
 from services.llm_client import LLMClient
 from models.verdict import Verdict
 
 
+def _normalize_content(content: str) -> str:
+    """Strip trailing whitespace and collapse runs of blank lines."""
+    lines = [line.rstrip() for line in content.strip().splitlines()]
+    normalized = []
+    for line in lines:
+        if line or (normalized and normalized[-1]):
+            normalized.append(line)
+    return "\n".join(normalized)
+
+
+# The verifier schema puts "pass" first, so a rejection is visible in the
+# first few streamed tokens
+_EARLY_FAIL = re.compile(r'^\s*\{\s*"pass"\s*:\s*false\b')
+
+
+def _early_fail(partial: str) -> Optional[dict]:
+    """Return a failing verdict once the stream has committed to "pass": false."""
+    if _EARLY_FAIL.match(partial):
+        return {
+            "pass": False,
+            "reasons": ["early_cancel"],
+            "missing_elements": [],
+            "generic_language_detected": False,
+            "example_quality_score": 0
+        }
+    return None
+
+
 def verify_content(content: str, llm_client: LLMClient) -> dict:
     prompt_path = os.path.join(os.path.dirname(__file__), "..", "prompts", "verifier.txt")
     try:
@@ -13,7 +43,14 @@ def verify_content(content: str, llm_client: LLMClient) -> dict:
     
     system_prompt = prompt_template
     
-    result = llm_client.call_structured(system_prompt, content, max_tokens=1000)
+    # Deterministic verdicts let the LLM cache answer regeneration attempts
+    # that differ from an earlier draft only in whitespace
+    normalized_content = _normalize_content(content)
+    # Failed attempts only need the verdict, not the full report: stop the
+    # stream at "pass": false instead of paying for the remaining output
+    result = llm_client.call_structured_streaming(
+        system_prompt, normalized_content, _early_fail, max_tokens=1000, temperature=0
+    )
     
     verdict = Verdict(
         pass_=result.get("pass", False),
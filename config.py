@@ -38,6 +38,14 @@ class Settings(BaseSettings):
     
     max_regeneration_attempts: int = 1
     
+    # Number of posts processed concurrently
+    max_concurrency: int = 3
+    # Cap on OpenAI requests started per minute across all workers (0 = no cap)
+    openai_requests_per_minute: int = 0
+    
+    # Reuse responses for identical temperature-0 LLM calls
+    llm_cache_enabled: bool = True
+    
     max_tokens_per_run: int = 50000
     max_usd_per_run: float = 5.0
     max_usd_lifetime: float = 100.0
@@ -45,9 +53,14 @@ class Settings(BaseSettings):
     kill_switch: bool = False
     dry_run: bool = True
     
+    # Logging verbosity (DEBUG, INFO, WARNING, ERROR)
+    log_level: str = "INFO"
+    
     # Dashboard security (optional)
     dashboard_password: str = ""
     dashboard_allowed_ips: str = "127.0.0.1"
+    # One uvicorn worker suits a Pi; use 2 * cores + 1 on bigger hosts
+    dashboard_workers: int = 1
     
     openai_input_token_price: float = 0.00003
     openai_output_token_price: float = 0.00006
@@ -9,29 +9,74 @@ Access at: http://localhost:8000
 
 from fastapi import FastAPI, WebSocket, Request, Depends, HTTPException
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi.responses import HTMLResponse, FileResponse, ORJSONResponse, Response, StreamingResponse
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
 import sqlite3
-import json
+import hashlib
+import gzip
+import orjson
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import Optional
+from functools import lru_cache, wraps
+from typing import Dict, Optional
 import asyncio
+import logging
 import os
 import secrets
+import time
 
 from config import settings
 from services.config_manager import ConfigManager
+from services.logging_setup import LOGGER_NAME, setup_logging
 
-app = FastAPI()
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Endpoints returning plain dicts are serialized by orjson as well
+app = FastAPI(default_response_class=ORJSONResponse)
+
+logger = logging.getLogger(LOGGER_NAME)
 
 # HTTP Basic Auth for dashboard (optional)
 security = HTTPBasic(auto_error=False)
 
-# Initialize ConfigManager
-config_manager = ConfigManager()
+# Created per worker at startup: ConfigManager touches .env, the backup
+# directory and the audit database, none of which should happen at import
+_config_manager: Optional[ConfigManager] = None
+
+
+def get_config_manager() -> ConfigManager:
+    """Return this process's ConfigManager, creating it on first use."""
+    global _config_manager
+    if _config_manager is None:
+        _config_manager = ConfigManager()
+    return _config_manager
+
+
+@lru_cache(maxsize=8)
+def parse_allowed_ips(allowed_ips_str: str) -> frozenset:
+    """Parse a comma-separated IP whitelist into a set of addresses.
+    
+    Args:
+        allowed_ips_str: Value of DASHBOARD_ALLOWED_IPS
+    
+    Returns:
+        Frozenset of stripped, non-empty IP strings
+    """
+    return frozenset(ip.strip() for ip in allowed_ips_str.split(',') if ip.strip())
+
 
 # Security middleware for IP whitelisting
 class IPWhitelistMiddleware(BaseHTTPMiddleware):
@@ -43,11 +88,10 @@ class IPWhitelistMiddleware(BaseHTTPMiddleware):
             # No IP restriction
             return await call_next(request)
         
-        allowed_ips = [ip.strip() for ip in allowed_ips_str.split(',')]
-        client_ip = request.client.host
+        allowed_ips = parse_allowed_ips(allowed_ips_str)
         
         # Allow if client IP is in whitelist
-        if client_ip in allowed_ips or '0.0.0.0' in allowed_ips:
+        if '0.0.0.0' in allowed_ips or request.client.host in allowed_ips:
             return await call_next(request)
         
         return JSONResponse(
@@ -64,6 +108,11 @@ if os.path.exists(static_dir):
     app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
 
+# Encoded once at startup; the password is only read from the environment
+# when the process starts, so there is nothing to re-check per request.
+_DASHBOARD_PASSWORD_BYTES = os.getenv('DASHBOARD_PASSWORD', '').encode('utf-8') or None
+
+
 def verify_dashboard_auth(credentials: Optional[HTTPBasicCredentials] = Depends(security)) -> bool:
     """Verify dashboard authentication if password is set.
     
@@ -76,10 +125,8 @@ def verify_dashboard_auth(credentials: Optional[HTTPBasicCredentials] = Depends(
     Raises:
         HTTPException: If authentication fails
     """
-    dashboard_password = os.getenv('DASHBOARD_PASSWORD', '')
-    
     # No password set - allow access without credentials
-    if not dashboard_password:
+    if _DASHBOARD_PASSWORD_BYTES is None:
         return True
     
     # Password is set but no credentials provided
@@ -91,7 +138,7 @@ def verify_dashboard_auth(credentials: Optional[HTTPBasicCredentials] = Depends(
         )
     
     # Verify password
-    if not secrets.compare_digest(credentials.password, dashboard_password):
+    if not secrets.compare_digest(credentials.password.encode('utf-8'), _DASHBOARD_PASSWORD_BYTES):
         raise HTTPException(
             status_code=401,
             detail="Invalid credentials",
@@ -100,6 +147,88 @@ def verify_dashboard_auth(credentials: Optional[HTTPBasicCredentials] = Depends(
     
     return True
 
+
+def _auth_disabled() -> bool:
+    """Dependency used when no dashboard password is configured."""
+    return True
+
+
+# Without a password there is no need to parse the Authorization header at all
+DASHBOARD_AUTH = verify_dashboard_auth if _DASHBOARD_PASSWORD_BYTES is not None else _auth_disabled
+
+
+def ttl_cache(seconds: float):
+    """Cache a function's result per positional arguments for `seconds`.
+    
+    Args:
+        seconds: How long a computed result stays fresh
+    
+    Returns:
+        Decorator wrapping the function with a time-based cache
+    """
+    def decorator(func):
+        cache = {}
+        
+        @wraps(func)
+        def wrapper(*args):
+            now = time.monotonic()
+            entry = cache.get(args)
+            if entry is None or now >= entry[1]:
+                entry = (func(*args), now + seconds)
+                cache[args] = entry
+            return entry[0]
+        
+        return wrapper
+    return decorator
+
+
+# Last encoded body per endpoint: {endpoint: (payload, body, etag)}
+_etag_memo = {}
+
+
+def encode_payload(endpoint: str, payload) -> tuple:
+    """Serialize payload to JSON bytes plus an ETag, memoized per endpoint.
+    
+    Args:
+        endpoint: Memo key for this endpoint
+        payload: JSON-serializable response data
+    
+    Returns:
+        Tuple of (body bytes, quoted ETag string)
+    """
+    memo = _etag_memo.get(endpoint)
+    if memo is not None and memo[0] is payload:
+        return memo[1], memo[2]
+    
+    body = orjson.dumps(payload)
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    _etag_memo[endpoint] = (payload, body, etag)
+    return body, etag
+
+
+def etag_response(request: Request, endpoint: str, payload) -> Response:
+    """Serialize payload with an ETag, answering 304 if the client has it.
+    
+    Repeated hits on the same cached payload skip both serialization and
+    hashing (see encode_payload).
+    
+    Args:
+        request: Incoming request (checked for If-None-Match)
+        endpoint: Memo key for this endpoint
+        payload: JSON-serializable response data
+    
+    Returns:
+        304 response if unchanged, otherwise JSON response with ETag
+    """
+    body, etag = encode_payload(endpoint, payload)
+    
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if request.headers.get('if-none-match') == etag:
+        return Response(status_code=304, headers=headers)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @contextmanager
 def get_db():
     conn = sqlite3.connect(settings.database_path)
@@ -110,125 +239,362 @@ def get_db():
         conn.close()
 
 
+# SQLite handles a few concurrent WAL readers well; keep dashboard reads off
+# the event loop without spawning more threads than that.
+STATS_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="stats")
+
+
+async def run_in_stats_executor(func, *args):
+    """Run a blocking read helper on the stats thread pool."""
+    return await asyncio.get_running_loop().run_in_executor(STATS_EXECUTOR, func, *args)
+
+
+# How often the dashboard truncates the pipeline's SQLite WAL file
+WAL_CHECKPOINT_INTERVAL_SECONDS = 600
+WAL_CHECKPOINT_RETRIES = 3
+
+_maintenance_task: Optional[asyncio.Task] = None
+
+
+def _wal_size() -> int:
+    """Return the current size of the database WAL file in bytes."""
+    try:
+        return os.path.getsize(settings.database_path + '-wal')
+    except OSError:
+        return 0
+
+
+def optimize_db():
+    """Let SQLite refresh query planner statistics where it deems useful."""
+    if not os.path.exists(settings.database_path):
+        return
+    with get_db() as conn:
+        conn.execute("PRAGMA optimize")
+
+
+def checkpoint_wal() -> int:
+    """Checkpoint and truncate the WAL file.
+    
+    Returns:
+        Number of bytes the WAL file shrank by
+    
+    Raises:
+        sqlite3.OperationalError: If the database is busy
+    """
+    if not os.path.exists(settings.database_path):
+        return 0
+    size_before = _wal_size()
+    with get_db() as conn:
+        busy = conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()[0]
+    if busy:
+        raise sqlite3.OperationalError("database is busy, WAL checkpoint incomplete")
+    return size_before - _wal_size()
+
+
+async def db_maintenance_loop():
+    """Run PRAGMA optimize once, then checkpoint the WAL periodically."""
+    try:
+        await asyncio.to_thread(optimize_db)
+    except sqlite3.Error as e:
+        logger.warning("⚠️  PRAGMA optimize failed: %s", e)
+    
+    while True:
+        await asyncio.sleep(WAL_CHECKPOINT_INTERVAL_SECONDS)
+        for attempt in range(1, WAL_CHECKPOINT_RETRIES + 1):
+            try:
+                reclaimed = await asyncio.to_thread(checkpoint_wal)
+                if reclaimed > 0:
+                    logger.info("🧹 WAL checkpoint reclaimed %.1f KB", reclaimed / 1024)
+                break
+            except sqlite3.OperationalError as e:
+                if attempt == WAL_CHECKPOINT_RETRIES:
+                    logger.warning("⚠️  WAL checkpoint skipped: %s", e)
+                else:
+                    await asyncio.sleep(attempt)
+
+
+@app.on_event("startup")
+async def start_db_maintenance():
+    """Set up per-worker state and start the SQLite maintenance task."""
+    global _maintenance_task
+    # Runs in every worker process, unlike the __main__ block
+    setup_logging()
+    await asyncio.to_thread(get_config_manager)
+    _maintenance_task = asyncio.create_task(db_maintenance_loop())
+
+
+@app.on_event("shutdown")
+async def stop_db_maintenance():
+    """Cancel the background SQLite maintenance task."""
+    if _maintenance_task is not None:
+        _maintenance_task.cancel()
+
+
+def _query_pipeline_stats(conn, hours: int) -> dict:
+    """Query cost and pipeline stats for the last N hours."""
+    # Cost stats - use numeric timestamp comparison
+    cutoff_timestamp = int((datetime.now() - timedelta(hours=hours)).timestamp())
+    
+    cost_result = conn.execute("""
+        SELECT 
+            SUM(usd_cost) as total_cost,
+            SUM(tokens_sent) as total_input_tokens,
+            SUM(tokens_received) as total_output_tokens,
+            COUNT(*) as total_calls
+        FROM cost_tracking
+        WHERE timestamp >= ?
+    """, (cutoff_timestamp,)).fetchone()
+    
+    # Pipeline stats - use numeric timestamp comparison
+    pipeline_result = conn.execute("""
+        SELECT 
+            COUNT(CASE WHEN status = 'completed' THEN 1 END) as completed,
+            COUNT(CASE WHEN status = 'discarded' THEN 1 END) as discarded,
+            COUNT(CASE WHEN status = 'rejected' THEN 1 END) as rejected,
+            COUNT(CASE WHEN status = 'failed' THEN 1 END) as failed
+        FROM pipeline_runs
+        WHERE created_at >= ?
+    """, (cutoff_timestamp,)).fetchone()
+    
+    # Lifetime cost
+    lifetime_result = conn.execute("""
+        SELECT SUM(usd_cost) as lifetime_cost FROM cost_tracking
+    """).fetchone()
+    
+    return {
+        "period_hours": hours,
+        "cost": {
+            "last_period": round(cost_result["total_cost"] or 0, 4),
+            "lifetime": round(lifetime_result["lifetime_cost"] or 0, 2),
+            "max_per_run": settings.max_usd_per_run,
+            "max_lifetime": settings.max_usd_lifetime,
+            "lifetime_remaining": round((settings.max_usd_lifetime - (lifetime_result["lifetime_cost"] or 0)), 2)
+        },
+        "tokens": {
+            "sent": cost_result["total_input_tokens"] or 0,
+            "received": cost_result["total_output_tokens"] or 0
+        },
+        "pipeline": {
+            "completed": pipeline_result["completed"],
+            "discarded": pipeline_result["discarded"],
+            "rejected": pipeline_result["rejected"],
+            "failed": pipeline_result["failed"]
+        }
+    }
+
+
+@ttl_cache(seconds=2)
 def get_pipeline_stats(hours: int = 24):
     """Get pipeline stats for the last N hours."""
     with get_db() as conn:
-        # Cost stats - use numeric timestamp comparison
-        cutoff_timestamp = int((datetime.now() - timedelta(hours=hours)).timestamp())
-        
-        cost_result = conn.execute("""
-            SELECT 
-                SUM(usd_cost) as total_cost,
-                SUM(tokens_sent) as total_input_tokens,
-                SUM(tokens_received) as total_output_tokens,
-                COUNT(*) as total_calls
-            FROM cost_tracking
-            WHERE timestamp >= ?
-        """, (cutoff_timestamp,)).fetchone()
-        
-        # Pipeline stats - use numeric timestamp comparison
-        pipeline_result = conn.execute("""
-            SELECT 
-                COUNT(CASE WHEN status = 'completed' THEN 1 END) as completed,
-                COUNT(CASE WHEN status = 'discarded' THEN 1 END) as discarded,
-                COUNT(CASE WHEN status = 'rejected' THEN 1 END) as rejected,
-                COUNT(CASE WHEN status = 'failed' THEN 1 END) as failed
-            FROM pipeline_runs
-            WHERE created_at >= ?
-        """, (cutoff_timestamp,)).fetchone()
-        
-        # Lifetime cost
-        lifetime_result = conn.execute("""
-            SELECT SUM(usd_cost) as lifetime_cost FROM cost_tracking
-        """).fetchone()
-        
-        return {
-            "period_hours": hours,
-            "cost": {
-                "last_period": round(cost_result["total_cost"] or 0, 4),
-                "lifetime": round(lifetime_result["lifetime_cost"] or 0, 2),
-                "max_per_run": settings.max_usd_per_run,
-                "max_lifetime": settings.max_usd_lifetime,
-                "lifetime_remaining": round((settings.max_usd_lifetime - (lifetime_result["lifetime_cost"] or 0)), 2)
-            },
-            "tokens": {
-                "sent": cost_result["total_input_tokens"] or 0,
-                "received": cost_result["total_output_tokens"] or 0
-            },
-            "pipeline": {
-                "completed": pipeline_result["completed"],
-                "discarded": pipeline_result["discarded"],
-                "rejected": pipeline_result["rejected"],
-                "failed": pipeline_result["failed"]
-            }
+        return _query_pipeline_stats(conn, hours)
+
+
+def _query_recent_activity(conn, limit: int) -> list:
+    """Query the most recent audit log entries."""
+    activities = conn.execute("""
+        SELECT 
+            timestamp,
+            action,
+            post_id,
+            details,
+            error_occurred
+        FROM audit_log
+        ORDER BY timestamp DESC
+        LIMIT ?
+    """, (limit,)).fetchall()
+    
+    return [
+        {
+            "timestamp": row["timestamp"],
+            "action": row["action"],
+            "post_id": row["post_id"],
+            "details": orjson.loads(row["details"]) if row["details"] else {},
+            "error": bool(row["error_occurred"])
         }
+        for row in activities
+    ]
 
 
+@ttl_cache(seconds=2)
 def get_recent_activity(limit: int = 20):
     """Get recent pipeline activity."""
     with get_db() as conn:
-        activities = conn.execute("""
-            SELECT 
-                timestamp,
-                action,
-                post_id,
-                details,
-                error_occurred
-            FROM audit_log
-            ORDER BY timestamp DESC
-            LIMIT ?
-        """, (limit,)).fetchall()
-        
-        return [
-            {
-                "timestamp": row["timestamp"],
-                "action": row["action"],
-                "post_id": row["post_id"],
-                "details": json.loads(row["details"]) if row["details"] else {},
-                "error": bool(row["error_occurred"])
-            }
-            for row in activities
-        ]
+        return _query_recent_activity(conn, limit)
 
 
+def _query_active_posts(conn) -> list:
+    """Query posts that have not reached a terminal status."""
+    posts = conn.execute("""
+        SELECT 
+            p.id,
+            p.title,
+            p.score,
+            p.subreddit,
+            MAX(pr.created_at) as last_activity,
+            pr.stage,
+            pr.status
+        FROM reddit_posts p
+        LEFT JOIN pipeline_runs pr ON p.id = pr.post_id
+        GROUP BY p.id
+        HAVING pr.status != 'completed' AND pr.status != 'discarded' AND pr.status != 'rejected'
+        ORDER BY pr.created_at DESC
+        LIMIT 10
+    """).fetchall()
+    
+    return [
+        {
+            "id": row["id"],
+            "title": row["title"][:80],
+            "score": row["score"],
+            "subreddit": row["subreddit"],
+            "stage": row["stage"],
+            "status": row["status"],
+            "last_activity": row["last_activity"]
+        }
+        for row in posts
+    ]
+
+
+@ttl_cache(seconds=2)
 def get_active_posts():
     """Get posts currently being processed."""
     with get_db() as conn:
-        posts = conn.execute("""
-            SELECT 
-                p.id,
-                p.title,
-                p.score,
-                p.subreddit,
-                MAX(pr.created_at) as last_activity,
-                pr.stage,
-                pr.status
-            FROM reddit_posts p
-            LEFT JOIN pipeline_runs pr ON p.id = pr.post_id
-            GROUP BY p.id
-            HAVING pr.status != 'completed' AND pr.status != 'discarded' AND pr.status != 'rejected'
-            ORDER BY pr.created_at DESC
-            LIMIT 10
-        """).fetchall()
-        
-        return [
-            {
-                "id": row["id"],
-                "title": row["title"][:80],
-                "score": row["score"],
-                "subreddit": row["subreddit"],
-                "stage": row["stage"],
-                "status": row["status"],
-                "last_activity": row["last_activity"]
-            }
-            for row in posts
-        ]
+        return _query_active_posts(conn)
 
 
-@app.get("/", response_class=HTMLResponse)
-async def get_dashboard():
-    """Serve the dashboard HTML."""
-    return """
+@ttl_cache(seconds=2)
+def get_dashboard_snapshot():
+    """Get stats, activity and active posts over a single connection."""
+    with get_db() as conn:
+        return {
+            "stats": _query_pipeline_stats(conn, 24),
+            "activity": _query_recent_activity(conn, 20),
+            "posts": _query_active_posts(conn)
+        }
+
+
+# Raw procfs/sysfs sources for hardware stats (Linux / Raspberry Pi)
+PROC_STAT_PATH = '/proc/stat'
+PROC_MEMINFO_PATH = '/proc/meminfo'
+THERMAL_ZONE_PATH = '/sys/class/thermal/thermal_zone0/temp'
+
+# Last (idle, total) jiffies snapshot, used to compute CPU % as a delta
+_last_cpu_sample = None
+
+
+def _read_cpu_percent() -> Optional[float]:
+    """Compute CPU usage from the delta between two /proc/stat snapshots."""
+    global _last_cpu_sample
+    
+    with open(PROC_STAT_PATH) as f:
+        fields = [int(x) for x in f.readline().split()[1:]]
+    
+    # idle + iowait count as idle time
+    idle = fields[3] + (fields[4] if len(fields) > 4 else 0)
+    total = sum(fields)
+    
+    previous = _last_cpu_sample
+    _last_cpu_sample = (idle, total)
+    
+    if previous is None:
+        # First sample: fall back to the average since boot
+        idle_delta, total_delta = idle, total
+    else:
+        idle_delta, total_delta = idle - previous[0], total - previous[1]
+    
+    if total_delta <= 0:
+        return None
+    return round(100.0 * (1 - idle_delta / total_delta), 1)
+
+
+def _read_memory() -> dict:
+    """Read total/available memory from /proc/meminfo."""
+    meminfo = {}
+    with open(PROC_MEMINFO_PATH) as f:
+        for line in f:
+            key, _, rest = line.partition(':')
+            if key in ('MemTotal', 'MemAvailable'):
+                meminfo[key] = int(rest.split()[0]) * 1024
+                if len(meminfo) == 2:
+                    break
+    
+    total = meminfo.get('MemTotal', 0)
+    available = meminfo.get('MemAvailable', 0)
+    return {
+        "total_mb": round(total / (1024 * 1024), 1),
+        "used_percent": round(100.0 * (total - available) / total, 1) if total else None
+    }
+
+
+def _read_temperature() -> Optional[float]:
+    """Read SoC temperature in Celsius from sysfs, if exposed."""
+    try:
+        with open(THERMAL_ZONE_PATH) as f:
+            return round(int(f.read()) / 1000, 1)
+    except (OSError, ValueError):
+        return None
+
+
+def _read_disk() -> dict:
+    """Get disk usage for the filesystem holding the database."""
+    st = os.statvfs(os.path.dirname(os.path.abspath(settings.database_path)))
+    total = st.f_blocks * st.f_frsize
+    free = st.f_bavail * st.f_frsize
+    return {
+        "total_gb": round(total / (1024 ** 3), 1),
+        "used_percent": round(100.0 * (total - free) / total, 1) if total else None
+    }
+
+
+def _hardware_stats_from_psutil() -> dict:
+    """Fallback hardware stats for non-Linux hosts."""
+    memory = psutil.virtual_memory()
+    disk = psutil.disk_usage(os.path.dirname(os.path.abspath(settings.database_path)))
+    temperature = None
+    sensors = getattr(psutil, 'sensors_temperatures', lambda: {})()
+    for entries in sensors.values():
+        if entries:
+            temperature = round(entries[0].current, 1)
+            break
+    
+    return {
+        "cpu_percent": psutil.cpu_percent(interval=None),
+        "memory": {
+            "total_mb": round(memory.total / (1024 * 1024), 1),
+            "used_percent": memory.percent
+        },
+        "disk": {
+            "total_gb": round(disk.total / (1024 ** 3), 1),
+            "used_percent": disk.percent
+        },
+        "temperature_c": temperature
+    }
+
+
+@ttl_cache(seconds=2)
+def get_hardware_stats():
+    """Get CPU, memory, disk and temperature stats for the host."""
+    if os.path.exists(PROC_STAT_PATH):
+        return {
+            "cpu_percent": _read_cpu_percent(),
+            "memory": _read_memory(),
+            "disk": _read_disk(),
+            "temperature_c": _read_temperature()
+        }
+    
+    if PSUTIL_AVAILABLE:
+        return _hardware_stats_from_psutil()
+    
+    return {
+        "cpu_percent": None,
+        "memory": None,
+        "disk": None,
+        "temperature_c": None
+    }
+
+
+DASHBOARD_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -417,36 +783,16 @@ async def get_dashboard():
             const API_BASE = '/api';
             const REFRESH_INTERVAL = 3000; // 3 seconds
             
-            async function fetchStats() {
+            async function fetchBootstrap() {
                 try {
-                    const response = await fetch(API_BASE + '/stats');
+                    const response = await fetch(API_BASE + '/bootstrap');
                     return await response.json();
                 } catch (e) {
-                    console.error('Error fetching stats:', e);
+                    console.error('Error fetching dashboard data:', e);
                     return null;
                 }
             }
             
-            async function fetchActivity() {
-                try {
-                    const response = await fetch(API_BASE + '/activity');
-                    return await response.json();
-                } catch (e) {
-                    console.error('Error fetching activity:', e);
-                    return [];
-                }
-            }
-            
-            async function fetchPosts() {
-                try {
-                    const response = await fetch(API_BASE + '/posts');
-                    return await response.json();
-                } catch (e) {
-                    console.error('Error fetching posts:', e);
-                    return [];
-                }
-            }
-            
             function formatTime(isoString) {
                 try {
                     const date = new Date(isoString);
@@ -456,109 +802,229 @@ async def get_dashboard():
                 }
             }
             
-            function renderDashboard(stats, activity, posts) {
-                const lifePercent = (stats.cost.lifetime / stats.cost.max_lifetime) * 100;
-                const costWarning = lifePercent > 80 ? 'status-danger' : lifePercent > 50 ? 'status-warning' : 'status-success';
-                
-                const html = `
+            function buildShell() {
+                const content = document.getElementById('content');
+                content.innerHTML = `
                     <div class="grid">
                         <div class="card">
                             <div class="card-title">💰 Lifetime Cost</div>
-                            <div class="card-value">\\$${stats.cost.lifetime.toFixed(2)}</div>
-                            <div class="card-sub">of \\$${stats.cost.max_lifetime.toFixed(2)}</div>
+                            <div class="card-value" id="lifetime-cost"></div>
+                            <div class="card-sub" id="lifetime-max"></div>
                             <div class="cost-bar">
-                                <div class="cost-bar-fill" style="width: ${Math.min(lifePercent, 100)}%"></div>
+                                <div class="cost-bar-fill" id="lifetime-bar"></div>
                             </div>
-                            <span class="status-badge ${costWarning}">
-                                ${lifePercent.toFixed(0)}% used
-                            </span>
+                            <span class="status-badge" id="lifetime-badge"></span>
                         </div>
                         
                         <div class="card">
                             <div class="card-title">📊 Last 24h Cost</div>
-                            <div class="card-value">\\$${stats.cost.last_period.toFixed(4)}</div>
-                            <div class="card-sub">Max per run: \\$${stats.cost.max_per_run}</div>
+                            <div class="card-value" id="period-cost"></div>
+                            <div class="card-sub" id="period-max"></div>
                             <span class="status-badge status-success">Normal</span>
                         </div>
                         
                         <div class="card">
                             <div class="card-title">✅ Completed</div>
-                            <div class="card-value">${stats.pipeline.completed}</div>
+                            <div class="card-value" id="count-completed"></div>
                             <div class="card-sub">Last 24 hours</div>
                         </div>
                         
                         <div class="card">
                             <div class="card-title">⏭️ Discarded</div>
-                            <div class="card-value">${stats.pipeline.discarded}</div>
+                            <div class="card-value" id="count-discarded"></div>
                             <div class="card-sub">Not monetizable</div>
                         </div>
                         
                         <div class="card">
                             <div class="card-title">❌ Rejected</div>
-                            <div class="card-value">${stats.pipeline.rejected}</div>
+                            <div class="card-value" id="count-rejected"></div>
                             <div class="card-sub">Failed quality gates</div>
                         </div>
                         
                         <div class="card">
                             <div class="card-title">⚠️ Failed</div>
-                            <div class="card-value">${stats.pipeline.failed}</div>
+                            <div class="card-value" id="count-failed"></div>
                             <div class="card-sub">Errors</div>
                         </div>
                         
                         <div class="card wide-card">
                             <div class="card-title">📍 Active Posts</div>
-                            ${posts.length > 0 ? `
-                                <table class="posts-table">
-                                    <thead>
-                                        <tr>
-                                            <th>Title</th>
-                                            <th>Score</th>
-                                            <th>Stage</th>
-                                            <th>Status</th>
-                                        </tr>
-                                    </thead>
-                                    <tbody>
-                                        ${posts.map(p => `
-                                            <tr>
-                                                <td class="post-title">${p.title}</td>
-                                                <td>${p.score}</td>
-                                                <td><span class="stage-badge">${p.stage}</span></td>
-                                                <td>${p.status}</td>
-                                            </tr>
-                                        `).join('')}
-                                    </tbody>
-                                </table>
-                            ` : '<p style="color: #999;">No active posts</p>'}
+                            <table class="posts-table" id="posts-table">
+                                <thead>
+                                    <tr>
+                                        <th>Title</th>
+                                        <th>Score</th>
+                                        <th>Stage</th>
+                                        <th>Status</th>
+                                    </tr>
+                                </thead>
+                                <tbody id="posts-body"></tbody>
+                            </table>
+                            <p style="color: #999;" id="posts-empty">No active posts</p>
                         </div>
                         
                         <div class="card wide-card">
                             <div class="card-title">📋 Recent Activity</div>
-                            <div class="activity-list">
-                                ${activity.length > 0 ? activity.map(a => `
-                                    <div class="activity-item ${a.error ? 'activity-error' : ''}">
-                                        <div class="activity-action">${a.action}</div>
-                                        <div class="activity-time">${formatTime(a.timestamp)}</div>
-                                        ${a.post_id ? `<div style="color: #666;">Post: ${a.post_id}</div>` : ''}
-                                    </div>
-                                `).join('') : '<div class="activity-item" style="color: #999;">No recent activity</div>'}
-                            </div>
+                            <div class="activity-list" id="activity-list"></div>
+                            <div class="activity-item" style="color: #999;" id="activity-empty">No recent activity</div>
                         </div>
                     </div>
                 `;
+            }
+            
+            function setText(id, value) {
+                const el = document.getElementById(id);
+                const text = String(value);
+                if (el.textContent !== text) {
+                    el.textContent = text;
+                }
+            }
+            
+            function setVisible(id, visible) {
+                const el = document.getElementById(id);
+                const display = visible ? '' : 'none';
+                if (el.style.display !== display) {
+                    el.style.display = display;
+                }
+            }
+            
+            function buildCell(text, className) {
+                const td = document.createElement('td');
+                if (className === 'stage-badge') {
+                    const badge = document.createElement('span');
+                    badge.className = className;
+                    badge.textContent = text;
+                    td.appendChild(badge);
+                } else {
+                    if (className) td.className = className;
+                    td.textContent = text;
+                }
+                return td;
+            }
+            
+            function renderPosts(posts) {
+                const tbody = document.getElementById('posts-body');
+                const rows = Array.from(tbody.children);
                 
-                document.getElementById('content').innerHTML = html;
+                posts.forEach((p, i) => {
+                    let row = rows[i];
+                    if (!row) {
+                        row = document.createElement('tr');
+                        row.append(buildCell('', 'post-title'), buildCell(''), buildCell('', 'stage-badge'), buildCell(''));
+                        tbody.appendChild(row);
+                    }
+                    const cells = row.children;
+                    const values = [p.title, p.score, p.stage, p.status];
+                    values.forEach((value, j) => {
+                        const target = j === 2 ? cells[j].firstChild : cells[j];
+                        const text = String(value ?? '');
+                        if (target.textContent !== text) target.textContent = text;
+                    });
+                });
+                
+                rows.slice(posts.length).forEach(row => row.remove());
+                setVisible('posts-table', posts.length > 0);
+                setVisible('posts-empty', posts.length === 0);
+            }
+            
+            function activityKey(a) {
+                return a.timestamp + '|' + a.action + '|' + (a.post_id || '');
+            }
+            
+            function buildActivityItem(a) {
+                const item = document.createElement('div');
+                item.className = 'activity-item' + (a.error ? ' activity-error' : '');
+                item.dataset.key = activityKey(a);
+                
+                const action = document.createElement('div');
+                action.className = 'activity-action';
+                action.textContent = a.action;
+                item.appendChild(action);
+                
+                const time = document.createElement('div');
+                time.className = 'activity-time';
+                time.textContent = formatTime(a.timestamp);
+                item.appendChild(time);
+                
+                if (a.post_id) {
+                    const post = document.createElement('div');
+                    post.style.color = '#666';
+                    post.textContent = 'Post: ' + a.post_id;
+                    item.appendChild(post);
+                }
+                return item;
+            }
+            
+            function renderActivity(activity) {
+                const list = document.getElementById('activity-list');
+                const existing = new Map();
+                Array.from(list.children).forEach(el => {
+                    if (existing.has(el.dataset.key)) {
+                        el.remove();
+                    } else {
+                        existing.set(el.dataset.key, el);
+                    }
+                });
+                
+                // Walk the newest-first list, reusing rows that are already rendered
+                let cursor = list.firstChild;
+                activity.forEach(a => {
+                    const key = activityKey(a);
+                    let item = existing.get(key);
+                    if (item) {
+                        existing.delete(key);
+                    } else {
+                        item = buildActivityItem(a);
+                    }
+                    if (item !== cursor) {
+                        list.insertBefore(item, cursor);
+                    } else {
+                        cursor = cursor.nextSibling;
+                    }
+                });
+                
+                // Drop rows that scrolled out of the window
+                existing.forEach(el => el.remove());
+                setVisible('activity-list', activity.length > 0);
+                setVisible('activity-empty', activity.length === 0);
+            }
+            
+            let shellBuilt = false;
+            
+            function renderDashboard(stats, activity, posts) {
+                if (!shellBuilt) {
+                    buildShell();
+                    shellBuilt = true;
+                }
+                
+                const lifePercent = (stats.cost.lifetime / stats.cost.max_lifetime) * 100;
+                const costWarning = lifePercent > 80 ? 'status-danger' : lifePercent > 50 ? 'status-warning' : 'status-success';
+                
+                setText('lifetime-cost', '$' + stats.cost.lifetime.toFixed(2));
+                setText('lifetime-max', 'of $' + stats.cost.max_lifetime.toFixed(2));
+                document.getElementById('lifetime-bar').style.width = Math.min(lifePercent, 100) + '%';
+                document.getElementById('lifetime-badge').className = 'status-badge ' + costWarning;
+                setText('lifetime-badge', lifePercent.toFixed(0) + '% used');
+                
+                setText('period-cost', '$' + stats.cost.last_period.toFixed(4));
+                setText('period-max', 'Max per run: $' + stats.cost.max_per_run);
+                
+                setText('count-completed', stats.pipeline.completed);
+                setText('count-discarded', stats.pipeline.discarded);
+                setText('count-rejected', stats.pipeline.rejected);
+                setText('count-failed', stats.pipeline.failed);
+                
+                renderPosts(posts);
+                renderActivity(activity);
             }
             
             async function updateDashboard() {
-                const [stats, activity, posts] = await Promise.all([
-                    fetchStats(),
-                    fetchActivity(),
-                    fetchPosts()
-                ]);
+                const data = await fetchBootstrap();
                 
-                if (stats && activity !== null && posts !== null) {
-                    renderDashboard(stats, activity, posts);
+                if (data && data.stats) {
+                    renderDashboard(data.stats, data.activity, data.posts);
                 } else {
+                    shellBuilt = false;
                     document.getElementById('content').innerHTML = `
                         <div class="card" style="color: red; text-align: center; padding: 40px;">
                             ⚠️ Failed to load dashboard data. Is the database accessible?
@@ -570,43 +1036,146 @@ async def get_dashboard():
             // Initial load
             updateDashboard();
             
-            // Auto-refresh every 3 seconds
-            setInterval(updateDashboard, REFRESH_INTERVAL);
+            if (window.EventSource) {
+                // Server pushes a new snapshot whenever the data changes;
+                // EventSource reconnects on its own if the stream drops
+                const events = new EventSource(API_BASE + '/stream');
+                events.onmessage = (e) => {
+                    const data = JSON.parse(e.data);
+                    renderDashboard(data.stats, data.activity, data.posts);
+                };
+            } else {
+                // Auto-refresh every 3 seconds
+                setInterval(updateDashboard, REFRESH_INTERVAL);
+            }
         </script>
     </body>
     </html>
+"""
+
+
+def _minify_html(html: str) -> bytes:
+    """Strip indentation and blank lines from inline HTML/CSS/JS."""
+    lines = (line.strip() for line in html.splitlines())
+    return "\n".join(line for line in lines if line).encode("utf-8")
+
+
+# The dashboard page never changes at runtime, so it is minified and
+# compressed once at import and served straight from memory.
+DASHBOARD_BYTES = _minify_html(DASHBOARD_HTML)
+DASHBOARD_GZ = gzip.compress(DASHBOARD_BYTES, 9)
+DASHBOARD_BR = brotli.compress(DASHBOARD_BYTES, quality=11) if BROTLI_AVAILABLE else None
+
+
+def html_response(request: Request, body: bytes, gz: bytes, br: Optional[bytes]) -> Response:
+    """Pick the precompressed variant of a page the client accepts.
+    
+    Args:
+        request: Incoming request (checked for Accept-Encoding)
+        body: Uncompressed HTML bytes
+        gz: Gzip-compressed body
+        br: Brotli-compressed body, or None when brotli is unavailable
+    
+    Returns:
+        HTML response with Content-Encoding set to match the chosen body
+    """
+    accept_encoding = request.headers.get("accept-encoding", "")
+    headers = {"Vary": "Accept-Encoding"}
+    if br is not None and "br" in accept_encoding:
+        headers["Content-Encoding"] = "br"
+        return Response(content=br, media_type="text/html", headers=headers)
+    if "gzip" in accept_encoding:
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=gz, media_type="text/html", headers=headers)
+    return Response(content=body, media_type="text/html", headers=headers)
+
+
+@app.get("/", response_class=HTMLResponse)
+async def get_dashboard(request: Request):
+    """Serve the dashboard HTML, precompressed when the client accepts it."""
+    return html_response(request, DASHBOARD_BYTES, DASHBOARD_GZ, DASHBOARD_BR)
+
+
+@app.get("/api/bootstrap")
+async def bootstrap(request: Request):
+    """Get stats, recent activity and active posts in one response."""
+    return etag_response(request, "bootstrap", await run_in_stats_executor(get_dashboard_snapshot))
+
+
+STREAM_INTERVAL_SECONDS = 3
+STREAM_KEEPALIVE_SECONDS = 15
+
+
+@app.get("/api/stream")
+async def stream(request: Request):
+    """Push dashboard snapshots as Server-Sent Events.
+    
+    An event is only sent when the snapshot changes; otherwise a comment
+    line is written periodically to keep proxies from closing the stream.
+    All clients share the same TTL-cached snapshot.
     """
+    async def events():
+        last_etag = None
+        last_sent = time.monotonic()
+        while not await request.is_disconnected():
+            snapshot = await run_in_stats_executor(get_dashboard_snapshot)
+            body, etag = encode_payload("bootstrap", snapshot)
+            if etag != last_etag:
+                last_etag = etag
+                last_sent = time.monotonic()
+                yield b"data: " + body + b"\n\n"
+            elif time.monotonic() - last_sent >= STREAM_KEEPALIVE_SECONDS:
+                last_sent = time.monotonic()
+                yield b": keepalive\n\n"
+            await asyncio.sleep(STREAM_INTERVAL_SECONDS)
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 
 @app.get("/api/stats")
-async def get_stats():
-    """Get pipeline statistics."""
-    return get_pipeline_stats(hours=24)
+async def get_stats(request: Request):
+    """Get pipeline statistics.
+    
+    Deprecated: the dashboard UI uses /api/bootstrap instead.
+    """
+    return etag_response(request, "stats", await run_in_stats_executor(get_pipeline_stats, 24))
 
 
 @app.get("/api/activity")
-async def get_activity():
-    """Get recent activity."""
-    return get_recent_activity(limit=20)
+async def get_activity(request: Request):
+    """Get recent activity.
+    
+    Deprecated: the dashboard UI uses /api/bootstrap instead.
+    """
+    return etag_response(request, "activity", await run_in_stats_executor(get_recent_activity, 20))
 
 
 @app.get("/api/posts")
-async def get_posts():
-    """Get active posts."""
-    return get_active_posts()
+async def get_posts(request: Request):
+    """Get active posts.
+    
+    Deprecated: the dashboard UI uses /api/bootstrap instead.
+    """
+    return etag_response(request, "posts", await run_in_stats_executor(get_active_posts))
 
 
-@app.get("/config", response_class=HTMLResponse)
-async def get_config_page():
-    """Serve the configuration page."""
-    templates_dir = os.path.join(os.path.dirname(__file__), 'templates')
-    config_html_path = os.path.join(templates_dir, 'config.html')
+@app.get("/api/hardware")
+async def get_hardware(request: Request):
+    """Get host hardware stats.
     
-    if os.path.exists(config_html_path):
-        with open(config_html_path, 'r') as f:
-            return f.read()
-    else:
-        return """
+    The stats are cached for a couple of seconds, so polls inside that
+    window reuse the already-encoded body.
+    """
+    stats = await run_in_stats_executor(get_hardware_stats)
+    return etag_response(request, "hardware", stats)
+
+
+CONFIG_PAGE_PATH = os.path.join(os.path.dirname(__file__), 'templates', 'config.html')
+CONFIG_PAGE_MISSING_HTML = """
         <html>
             <body style="font-family: sans-serif; padding: 40px; text-align: center;">
                 <h1>Configuration Page Not Found</h1>
@@ -617,22 +1186,126 @@ async def get_config_page():
         """
 
 
+def _load_config_page() -> bytes:
+    """Read the configuration page template, or a placeholder if missing."""
+    if os.path.exists(CONFIG_PAGE_PATH):
+        with open(CONFIG_PAGE_PATH, 'rb') as f:
+            return f.read()
+    return CONFIG_PAGE_MISSING_HTML.encode("utf-8")
+
+
+# The template ships with the code, so like the dashboard page it is read
+# and compressed once per worker rather than on every request.
+CONFIG_PAGE_BYTES = _load_config_page()
+CONFIG_PAGE_GZ = gzip.compress(CONFIG_PAGE_BYTES, 9)
+CONFIG_PAGE_BR = brotli.compress(CONFIG_PAGE_BYTES, quality=11) if BROTLI_AVAILABLE else None
+
+
+@app.get("/config", response_class=HTMLResponse)
+async def get_config_page(request: Request):
+    """Serve the configuration page."""
+    return html_response(request, CONFIG_PAGE_BYTES, CONFIG_PAGE_GZ, CONFIG_PAGE_BR)
+
+
+# Config endpoints touch the .env file and, for key tests, remote APIs
+CONFIG_CALL_TIMEOUT_SECONDS = 10
+API_KEY_TEST_TIMEOUT_SECONDS = 20
+
+
+async def run_blocking(func, *args, timeout: Optional[float] = CONFIG_CALL_TIMEOUT_SECONDS, **kwargs):
+    """Run a blocking call in a worker thread with a deadline.
+    
+    The deadline only stops the wait; the thread keeps running. Writes
+    (update_config, restore_backup) therefore pass timeout=None so a slow
+    save is never reported as failed while it is still rewriting .env.
+    
+    Args:
+        func: Synchronous callable
+        *args: Positional arguments for func
+        timeout: Seconds to wait before giving up, or None to wait for completion
+        **kwargs: Keyword arguments for func
+    
+    Returns:
+        Result of func
+    
+    Raises:
+        TimeoutError: If func does not finish within timeout
+    """
+    if timeout is None:
+        return await asyncio.to_thread(func, *args, **kwargs)
+    try:
+        return await asyncio.wait_for(asyncio.to_thread(func, *args, **kwargs), timeout)
+    except asyncio.TimeoutError:
+        raise TimeoutError(f"{func.__name__} timed out after {timeout}s")
+
+
+# Key tests in flight, keyed by a digest of (service, api_key); a second
+# click while the first test is still running awaits the same result
+_key_test_inflight: Dict[str, asyncio.Task] = {}
+
+
+async def run_key_test(service: str, api_key: str) -> tuple:
+    """Test an API key, coalescing concurrent tests of the same key.
+    
+    Args:
+        service: Service name (OPENAI, REDDIT, GUMROAD)
+        api_key: API key to test
+    
+    Returns:
+        Tuple of (is_valid, message) from ConfigManager.test_api_key
+    """
+    digest = hashlib.blake2b(f"{service}\0{api_key}".encode('utf-8'), digest_size=16).hexdigest()
+    task = _key_test_inflight.get(digest)
+    if task is None:
+        task = asyncio.create_task(run_blocking(
+            get_config_manager().test_api_key, service, api_key,
+            timeout=API_KEY_TEST_TIMEOUT_SECONDS
+        ))
+        _key_test_inflight[digest] = task
+        task.add_done_callback(lambda _: _key_test_inflight.pop(digest, None))
+    # Shielded so one client disconnecting does not cancel the others' test
+    return await asyncio.shield(task)
+
+
+def config_errors(key: str, prefix: str = "", as_list: bool = False):
+    """Turn exceptions raised by a config endpoint into its error payload.
+    
+    Args:
+        key: Response field carrying the error ("error", "errors", "message")
+        prefix: Text placed before the exception message
+        as_list: Wrap the message in a list (for "errors" fields)
+    
+    Returns:
+        Decorator for async endpoint functions
+    """
+    def decorator(endpoint):
+        @wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await endpoint(*args, **kwargs)
+            except Exception as e:
+                logger.warning("%s failed: %s", endpoint.__name__, e)
+                message = f"{prefix}{e}"
+                return {"success": False, key: [message] if as_list else message}
+        return wrapper
+    return decorator
+
+
 @app.get("/api/config")
-async def get_config(authenticated: bool = Depends(verify_dashboard_auth)):
+@config_errors("error")
+async def get_config(authenticated: bool = Depends(DASHBOARD_AUTH)):
     """Get current configuration with masked sensitive values.
     
     Returns:
         JSON with configuration organized by category
     """
-    try:
-        config = config_manager.get_current_config()
-        return {"success": True, "config": config}
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    config = await run_blocking(get_config_manager().get_current_config)
+    return {"success": True, "config": config}
 
 
 @app.post("/api/config/update")
-async def update_config(request: Request, authenticated: bool = Depends(verify_dashboard_auth)):
+@config_errors("errors", as_list=True)
+async def update_config(request: Request, authenticated: bool = Depends(DASHBOARD_AUTH)):
     """Update configuration with validation.
     
     Request body format:
@@ -646,23 +1319,20 @@ async def update_config(request: Request, authenticated: bool = Depends(verify_d
     Returns:
         JSON with success status and any errors
     """
-    try:
-        updates = await request.json()
-        client_ip = request.client.host
-        
-        success, messages = config_manager.update_config(updates, user_ip=client_ip)
-        
-        if success:
-            return {"success": True, "messages": messages}
-        else:
-            return {"success": False, "errors": messages}
-            
-    except Exception as e:
-        return {"success": False, "errors": [str(e)]}
+    updates = await request.json()
+    client_ip = request.client.host
+    
+    success, messages = await run_blocking(get_config_manager().update_config, updates, user_ip=client_ip, timeout=None)
+    
+    if success:
+        return {"success": True, "messages": messages}
+    else:
+        return {"success": False, "errors": messages}
 
 
 @app.post("/api/config/test")
-async def test_api_key(request: Request, authenticated: bool = Depends(verify_dashboard_auth)):
+@config_errors("message", prefix="Test error: ")
+async def test_api_key(request: Request, authenticated: bool = Depends(DASHBOARD_AUTH)):
     """Test API key validity before saving.
     
     Query parameters:
@@ -672,38 +1342,33 @@ async def test_api_key(request: Request, authenticated: bool = Depends(verify_da
     Returns:
         JSON with validation result and message
     """
-    try:
-        params = dict(request.query_params)
-        service = params.get('service')
-        api_key = params.get('api_key')
-        
-        if not service or not api_key:
-            return {"success": False, "message": "Missing service or api_key parameter"}
-        
-        is_valid, message = config_manager.test_api_key(service, api_key)
-        
-        return {"success": is_valid, "message": message}
-        
-    except Exception as e:
-        return {"success": False, "message": f"Test error: {str(e)}"}
+    params = dict(request.query_params)
+    service = params.get('service')
+    api_key = params.get('api_key')
+    
+    if not service or not api_key:
+        return {"success": False, "message": "Missing service or api_key parameter"}
+    
+    is_valid, message = await run_key_test(service, api_key)
+    
+    return {"success": is_valid, "message": message}
 
 
 @app.get("/api/config/backups")
-async def list_config_backups(authenticated: bool = Depends(verify_dashboard_auth)):
+@config_errors("error")
+async def list_config_backups(authenticated: bool = Depends(DASHBOARD_AUTH)):
     """List all available configuration backups.
     
     Returns:
         JSON list of backup metadata
     """
-    try:
-        backups = config_manager.list_backups()
-        return {"success": True, "backups": backups}
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    backups = await run_blocking(get_config_manager().list_backups)
+    return {"success": True, "backups": backups}
 
 
 @app.post("/api/config/restore")
-async def restore_config_backup(request: Request, authenticated: bool = Depends(verify_dashboard_auth)):
+@config_errors("message", prefix="Restore error: ")
+async def restore_config_backup(request: Request, authenticated: bool = Depends(DASHBOARD_AUTH)):
     """Restore configuration from a backup file.
     
     Request body:
@@ -714,20 +1379,16 @@ async def restore_config_backup(request: Request, authenticated: bool = Depends(
     Returns:
         JSON with success status and message
     """
-    try:
-        data = await request.json()
-        backup_filename = data.get('backup_filename')
-        client_ip = request.client.host
-        
-        if not backup_filename:
-            return {"success": False, "message": "Missing backup_filename"}
-        
-        success, message = config_manager.restore_backup(backup_filename, user_ip=client_ip)
-        
-        return {"success": success, "message": message}
-        
-    except Exception as e:
-        return {"success": False, "message": f"Restore error: {str(e)}"}
+    data = await request.json()
+    backup_filename = data.get('backup_filename')
+    client_ip = request.client.host
+    
+    if not backup_filename:
+        return {"success": False, "message": "Missing backup_filename"}
+    
+    success, message = await run_blocking(get_config_manager().restore_backup, backup_filename, user_ip=client_ip, timeout=None)
+    
+    return {"success": success, "message": message}
 
 
 if __name__ == "__main__":
@@ -735,4 +1396,12 @@ if __name__ == "__main__":
     print("🚀 Starting Pi-Autopilot Dashboard on http://0.0.0.0:8000")
     print("   Access dashboard at: http://localhost:8000")
     print("   Configuration at: http://localhost:8000/config")
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(
+        "dashboard:app",
+        host="0.0.0.0",
+        port=8000,
+        # uvloop where uvicorn[standard] installed it (not on Windows), else asyncio
+        loop="auto",
+        http="httptools",
+        workers=settings.dashboard_workers
+    )
@@ -1,11 +1,16 @@
 #!/usr/bin/env python3
 
 import os
-import json
+import time
+import asyncio
+import logging
 from datetime import datetime
+from typing import Optional
+
+import orjson
 
 from agents.ingest_factory import IngestFactory
-from agents.problem_agent import extract_problem
+from agents.problem_agent import extract_problem, extract_problems_batch
 from agents.spec_agent import generate_spec
 from agents.content_agent import generate_content
 from agents.verifier_agent import verify_content
@@ -13,105 +18,445 @@ from agents.gumroad_agent import create_listing, upload_to_gumroad
 from services.storage import Storage
 from services.cost_governor import CostGovernor, CostLimitExceeded
 from services.llm_client import LLMClient
+from services.llm_cache import LLMCache
 from services.error_handler import ErrorHandler
 from services.audit_logger import AuditLogger
 from services.backup_manager import BackupManager
 from services.sales_feedback import SalesFeedback
+from services.logging_setup import LOGGER_NAME, setup_logging
 from config import settings
 
+logger = logging.getLogger(LOGGER_NAME)
+
+
+# Maximum number of data sources fetched at the same time
+INGEST_CONCURRENCY = 5
+# How many times a source answering HTTP 429 is retried
+INGEST_RATE_LIMIT_RETRIES = 2
+# Posts sent to the problem extraction prompt in one LLM call
+PROBLEM_BATCH_SIZE = 6
+
+
+def _retry_after_seconds(exception: Exception) -> Optional[float]:
+    """Return the backoff for a rate-limited HTTP error, or None."""
+    response = getattr(exception, 'response', None)
+    if response is None or getattr(response, 'status_code', None) != 429:
+        return None
+    try:
+        return float(response.headers.get('Retry-After', 5))
+    except (TypeError, ValueError):
+        return 5.0
+
+
+async def fetch_source(agent, semaphore: asyncio.BoundedSemaphore) -> list:
+    """Fetch posts from one ingest agent in a worker thread.
+    
+    Agents do blocking network I/O, so each runs in its own thread while the
+    semaphore caps how many are in flight. Rate-limited (429) responses are
+    retried after the server's Retry-After delay.
+    """
+    async with semaphore:
+        for attempt in range(INGEST_RATE_LIMIT_RETRIES + 1):
+            try:
+                return await asyncio.to_thread(agent.fetch_posts)
+            except Exception as e:
+                delay = _retry_after_seconds(e)
+                if delay is None or attempt == INGEST_RATE_LIMIT_RETRIES:
+                    raise
+                logger.info("  → %s rate limited, retrying in %.0fs", agent.source_name, delay)
+                await asyncio.sleep(delay)
+
 
-def save_artifact(post_id: str, stage: str, data: dict) -> str:
-    artifact_dir = os.path.join(settings.artifacts_path, post_id)
-    os.makedirs(artifact_dir, exist_ok=True)
+# Artifact directories already created during this process
+_ARTIFACT_DIRS = set()
+
+
+def _write_artifact(post_id: str, filename: str, payload: bytes, artifacts_path: Optional[str] = None) -> str:
+    # Plain f-strings: post ids and filenames are generated here, never absolute
+    artifact_dir = f"{artifacts_path or settings.artifacts_path}/{post_id}"
+    if artifact_dir not in _ARTIFACT_DIRS:
+        os.makedirs(artifact_dir, exist_ok=True)
+        _ARTIFACT_DIRS.add(artifact_dir)
     
-    filename = f"{stage}_{int(datetime.now().timestamp())}.json"
-    filepath = os.path.join(artifact_dir, filename)
+    filepath = f"{artifact_dir}/{filename}"
     
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2)
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
     
     return filepath
 
 
-def save_content_artifact(post_id: str, content: str) -> str:
-    artifact_dir = os.path.join(settings.artifacts_path, post_id)
-    os.makedirs(artifact_dir, exist_ok=True)
+def save_artifact(post_id: str, stage: str, data: dict, ts: Optional[int] = None,
+                  artifacts_path: Optional[str] = None) -> str:
+    if ts is None:
+        ts = time.time_ns() // 1_000_000_000
+    filename = f"{stage}_{ts}.json"
+    # Artifacts are read by tools, not people; compact JSON is about half the bytes
+    return _write_artifact(post_id, filename, orjson.dumps(data), artifacts_path)
+
+
+def save_content_artifact(post_id: str, content: str, ts: Optional[int] = None,
+                          artifacts_path: Optional[str] = None) -> str:
+    if ts is None:
+        ts = time.time_ns() // 1_000_000_000
+    filename = f"content_{ts}.md"
+    return _write_artifact(post_id, filename, content.encode('utf-8'), artifacts_path)
+
+
+def _spec_rejection(spec_data: dict) -> Optional[tuple]:
+    """Check a generated spec against the build gates.
     
-    filename = f"content_{int(datetime.now().timestamp())}.md"
-    filepath = os.path.join(artifact_dir, filename)
+    Returns:
+        None if the spec should be built, otherwise a tuple of
+        (reason, log message, extra audit details)
+    """
+    if not spec_data.get("build", False):
+        return 'build_false', "Spec build=false", {}
     
-    with open(filepath, 'w') as f:
-        f.write(content)
+    confidence = spec_data.get("confidence", 0)
+    if confidence < 70:
+        return 'low_confidence', "Confidence too low", {'confidence': confidence}
     
-    return filepath
+    deliverable_count = len(spec_data.get("deliverables", []))
+    if deliverable_count < 3:
+        return 'insufficient_deliverables', "Too few deliverables", {'count': deliverable_count}
+    
+    return None
 
 
-def run_pipeline():
+def process_post(post: dict, run_id: str, sales_feedback_text: str, llm_client: LLMClient,
+                 storage: Storage, audit_logger: AuditLogger, error_handler: ErrorHandler,
+                 problem_data: Optional[dict] = None):
+    """Run one post through every pipeline stage.
+    
+    Runs in a worker thread so several posts can wait on the LLM API at the
+    same time. Errors are logged and swallowed; CostLimitExceeded is logged
+    and re-raised so the caller can stop scheduling further posts. Audit
+    events and pipeline_runs rows are buffered and flushed once the post
+    is done.
+    
+    problem_data, when given, is this post's result from a batched problem
+    extraction and replaces the per-post extraction call.
+    """
+    post_id = post['id']
+    logger.info("--- Post: %s ---", post_id)
+    logger.info("[%s] Title: %s...", post_id, post['title'][:60])
+    
+    # Audit events for this post are written in one transaction at the end
+    audit = audit_logger.batch()
+    # pipeline_runs rows likewise, written with the audit events
+    runs = storage.pipeline_run_batch()
+    # JSON artifact stage names are unique per post, so they can share one
+    # timestamp; content files get their own since several are written
+    post_ts = time.time_ns() // 1_000_000_000
+    # Settings read once per post rather than on every loop iteration
+    artifacts_path = settings.artifacts_path
+    max_attempts = settings.max_regeneration_attempts
+    dry_run = settings.dry_run
+    
+    try:
+        logger.info("[%s] Stage: PROBLEM_EXTRACTION", post_id)
+        if problem_data is None:
+            problem_data = extract_problem(post, llm_client, sales_feedback_text)
+        problem_path = save_artifact(post_id, "problem", problem_data, ts=post_ts, artifacts_path=artifacts_path)
+        
+        if problem_data.get("discard", True):
+            logger.info("[%s] DISCARD: Problem not monetizable", post_id)
+            runs.log(post_id, "problem_extraction", "discarded", problem_path)
+            audit.log(
+                action='post_discarded',
+                post_id=post_id,
+                run_id=run_id,
+                details={'stage': 'problem_extraction', 'reason': 'not_monetizable'}
+            )
+            return
+        
+        runs.log(post_id, "problem_extraction", "completed", problem_path)
+        audit.log(
+            action='problem_extracted',
+            post_id=post_id,
+            run_id=run_id,
+            details={
+                'summary': problem_data.get('problem_summary', '')[:100],
+                'urgency_score': problem_data.get('urgency_score', 0)
+            }
+        )
+        logger.info("[%s] Problem: %s...", post_id, problem_data['problem_summary'][:60])
+        
+        logger.info("[%s] Stage: SPEC_GENERATION", post_id)
+        spec_data = generate_spec(problem_data, llm_client, sales_feedback_text)
+        
+        # Cheap field checks run before anything is written: a rejected spec
+        # (the common case) is recorded in pipeline_runs and the audit log
+        # without a full artifact file
+        rejection = _spec_rejection(spec_data)
+        if rejection:
+            reason, log_message, reject_details = rejection
+            logger.info("[%s] REJECT: %s", post_id, log_message)
+            runs.log(post_id, "spec_generation", "rejected", None, reason)
+            audit.log(
+                action='spec_generated',
+                post_id=post_id,
+                run_id=run_id,
+                details={'rejected': True, 'reason': reason, **reject_details}
+            )
+            return
+        
+        confidence = spec_data.get("confidence", 0)
+        spec_path = save_artifact(post_id, "spec", spec_data, ts=post_ts, artifacts_path=artifacts_path)
+        
+        runs.log(post_id, "spec_generation", "completed", spec_path)
+        audit.log(
+            action='spec_generated',
+            post_id=post_id,
+            run_id=run_id,
+            details={
+                'title': spec_data.get('working_title', '')[:80],
+                'price': spec_data.get('price_recommendation', 0),
+                'confidence': confidence
+            }
+        )
+        logger.info("[%s] Spec: %s", post_id, spec_data['working_title'])
+        
+        regeneration_count = 0
+        content_verified = False
+        content = None
+        content_path = None
+        
+        while regeneration_count <= max_attempts and not content_verified:
+            logger.info("[%s] Stage: CONTENT_GENERATION (attempt %s)", post_id, regeneration_count + 1)
+            try:
+                content = generate_content(spec_data, llm_client)
+                content_path = save_content_artifact(post_id, content, artifacts_path=artifacts_path)
+                runs.log(post_id, "content_generation", "completed", content_path)
+                
+                logger.info("[%s] Stage: VERIFICATION", post_id)
+                verdict = verify_content(content, llm_client)
+                verdict_path = save_artifact(post_id, f"verdict_attempt_{regeneration_count + 1}", verdict, ts=post_ts, artifacts_path=artifacts_path)
+                
+                if verdict.get("pass", False):
+                    logger.info("[%s] PASS: Content verified", post_id)
+                    runs.log(post_id, "verification", "passed", verdict_path)
+                    audit.log(
+                        action='content_verified',
+                        post_id=post_id,
+                        run_id=run_id,
+                        details={'attempt': regeneration_count + 1}
+                    )
+                    content_verified = True
+                else:
+                    logger.error("[%s] FAIL: %s", post_id, ', '.join(verdict.get('reasons', [])))
+                    runs.log(post_id, "verification", "failed", verdict_path)
+                    audit.log(
+                        action='content_rejected',
+                        post_id=post_id,
+                        run_id=run_id,
+                        details={'attempt': regeneration_count + 1, 'reasons': verdict.get('reasons', [])}
+                    )
+                    regeneration_count += 1
+            except Exception as e:
+                error_artifact = error_handler.log_error(
+                    post_id=post_id,
+                    stage='content_generation',
+                    exception=e,
+                    context={'attempt': regeneration_count + 1}
+                )
+                error_categorization = error_handler.categorize_error(e)
+                audit.log(
+                    action='error_occurred',
+                    post_id=post_id,
+                    run_id=run_id,
+                    details={'stage': 'content_generation', 'error_type': type(e).__name__, 'transient': error_categorization['is_transient']},
+                    error_occurred=True
+                )
+                if error_categorization['is_transient']:
+                    regeneration_count += 1
+                    if regeneration_count > max_attempts:
+                        raise
+                else:
+                    raise
+        
+        if not content_verified:
+            logger.error("[%s] HARD DISCARD: Max regeneration attempts reached", post_id)
+            runs.log(post_id, "pipeline", "discarded_verification_failed", None, "Max regeneration attempts")
+            audit.log(
+                action='post_discarded',
+                post_id=post_id,
+                run_id=run_id,
+                details={'stage': 'verification', 'reason': 'max_attempts_exceeded'}
+            )
+            return
+        
+        logger.info("[%s] Stage: GUMROAD_LISTING", post_id)
+        listing_text = create_listing(spec_data, content, llm_client)
+        listing_path = save_content_artifact(post_id, listing_text, artifacts_path=artifacts_path)
+        runs.log(post_id, "gumroad_listing", "completed", listing_path)
+        audit.log(
+            action='gumroad_listed',
+            post_id=post_id,
+            run_id=run_id,
+            details={'title': spec_data.get('working_title', '')[:80]}
+        )
+        
+        logger.info("[%s] Stage: GUMROAD_UPLOAD", post_id)
+        upload_result = upload_to_gumroad(spec_data, listing_text, content_path)
+        upload_path = save_artifact(post_id, "gumroad_upload", upload_result, ts=post_ts, artifacts_path=artifacts_path)
+        
+        if upload_result.get("success"):
+            product_url = upload_result.get('product_url')
+            dry_run_prefix = "[DRY RUN] " if dry_run else ""
+            logger.info("[%s] SUCCESS: %sProduct uploaded - %s", post_id, dry_run_prefix, product_url)
+            runs.log(post_id, "gumroad_upload", "completed", upload_path)
+            
+            upload_details = {
+                'product_url': product_url,
+                'price': spec_data.get('price_recommendation'),
+                'dry_run': dry_run
+            }
+            
+            audit.log(
+                action='gumroad_uploaded',
+                post_id=post_id,
+                run_id=run_id,
+                details=upload_details
+            )
+        else:
+            logger.error("[%s] FAIL: Gumroad upload failed", post_id)
+            runs.log(post_id, "gumroad_upload", "failed", upload_path, "Upload failed")
+            audit.log(
+                action='error_occurred',
+                post_id=post_id,
+                run_id=run_id,
+                details={'stage': 'gumroad_upload', 'reason': upload_result.get('error', 'unknown')},
+                error_occurred=True
+            )
+    
+    except CostLimitExceeded as e:
+        logger.error("[%s] COST LIMIT EXCEEDED: %s", post_id, e)
+        runs.log(post_id, "pipeline", "cost_limit_exceeded", None, str(e))
+        audit.log(
+            action='cost_limit_exceeded',
+            post_id=post_id,
+            run_id=run_id,
+            details={'reason': str(e)},
+            cost_limit_exceeded=True
+        )
+        raise
+    
+    except (KeyboardInterrupt, SystemExit):
+        # Allow user interrupts and system exits to propagate
+        raise
+    
+    except Exception as e:
+        logger.error("[%s] ERROR: %s", post_id, e)
+        runs.log(post_id, "pipeline", "error", None, str(e))
+        
+        error_artifact = error_handler.log_error(
+            post_id=post_id,
+            stage='pipeline',
+            exception=e,
+            context={'post_title': post.get('title', '')}
+        )
+        error_categorization = error_handler.categorize_error(e)
+        audit.log(
+            action='error_occurred',
+            post_id=post_id,
+            run_id=run_id,
+            details={'stage': 'pipeline', 'error_type': type(e).__name__, 'transient': error_categorization['is_transient']},
+            error_occurred=True
+        )
+        # Log and move on to the next post on non-transient errors
+        return
+    
+    finally:
+        runs.flush()
+        audit.flush()
+
+
+async def run_pipeline():
     if settings.kill_switch:
-        print("KILL SWITCH ACTIVE - Pipeline execution aborted")
+        logger.error("KILL SWITCH ACTIVE - Pipeline execution aborted")
         return
     
     if settings.dry_run:
-        print("=" * 60)
-        print("DRY RUN MODE ENABLED - No real Gumroad uploads will be made")
-        print("=" * 60)
-        print()
+        logger.info("=" * 60)
+        logger.info("DRY RUN MODE ENABLED - No real Gumroad uploads will be made")
+        logger.info("=" * 60)
     
     cost_governor = CostGovernor()
-    llm_client = LLMClient(cost_governor)
+    llm_cache = LLMCache(settings.database_path) if settings.llm_cache_enabled else None
+    llm_client = LLMClient(cost_governor, cache=llm_cache)
     storage = Storage()
     error_handler = ErrorHandler()
     audit_logger = AuditLogger(settings.database_path)
     backup_manager = BackupManager(settings.database_path)
     sales_feedback = SalesFeedback(storage)
     
-    # Perform daily backup at pipeline start
-    print("=== BACKUP & MAINTENANCE ===")
-    backup_path = backup_manager.backup_database()
-    print(f"Database backed up to: {backup_path}")
-    backup_manager.cleanup_old_backups()
+    # Perform daily backup at pipeline start. The copy runs in a worker
+    # thread while Gumroad sales data is fetched, and finishes before the
+    # first database write below; backup_database applies retention itself.
+    logger.info("=== BACKUP & MAINTENANCE ===")
+    backup_path, sales_data = await asyncio.gather(
+        asyncio.to_thread(backup_manager.backup_database),
+        asyncio.to_thread(sales_feedback.gumroad_client.fetch_sales_data),
+        return_exceptions=True
+    )
+    if isinstance(backup_path, BaseException):
+        raise backup_path
+    logger.info("Database backed up to: %s", backup_path)
     
-    run_id = f"run_{int(datetime.now().timestamp())}"
+    started_at = datetime.now()
+    started_at_iso = started_at.isoformat()
+    run_id = f"run_{int(started_at.timestamp())}"
+    # Run-level audit events are buffered and written once at the end
+    run_audit = audit_logger.batch()
     
     try:
         # Ingest sales data at pipeline start
-        print("=== SALES DATA INGESTION ===")
+        logger.info("=== SALES DATA INGESTION ===")
         try:
-            sales_ingest_result = sales_feedback.ingest_sales_data()
+            if isinstance(sales_data, BaseException):
+                raise sales_data
+            sales_ingest_result = sales_feedback.ingest_sales_data(sales_data)
             if sales_ingest_result["success"]:
-                print(f"Ingested sales data for {sales_ingest_result['products_ingested']} products")
-                audit_logger.log(
+                logger.info("Ingested sales data for %s products", sales_ingest_result['products_ingested'])
+                run_audit.log(
                     action='sales_data_ingested',
                     post_id=None,
                     run_id=run_id,
                     details={
                         'success': True,
                         'products_ingested': sales_ingest_result.get('products_ingested', 0),
-                        'timestamp': datetime.now().isoformat()
+                        'timestamp': started_at_iso
                     }
                 )
             else:
-                print("No sales data available or ingestion failed")
-                audit_logger.log(
+                logger.info("No sales data available or ingestion failed")
+                run_audit.log(
                     action='sales_data_ingested',
                     post_id=None,
                     run_id=run_id,
                     details={
                         'success': False,
                         'message': sales_ingest_result.get('message', 'No sales data available or ingestion failed'),
-                        'timestamp': datetime.now().isoformat()
+                        'timestamp': started_at_iso
                     }
                 )
         except Exception as e:
-            print(f"Sales data ingestion failed: {e}")
-            audit_logger.log(
+            logger.warning("Sales data ingestion failed: %s", e)
+            run_audit.log(
                 action='sales_data_ingested',
                 post_id=None,
                 run_id=run_id,
                 details={
                     'success': False,
                     'error': str(e),
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': started_at_iso
                 }
             )
         
@@ -119,9 +464,9 @@ def run_pipeline():
         try:
             suppression_check = sales_feedback.should_suppress_publishing()
             if suppression_check["suppress"]:
-                print(f"\n=== PUBLISHING SUPPRESSED ===")
-                print(f"Reason: {suppression_check['reason']}")
-                audit_logger.log(
+                logger.info("=== PUBLISHING SUPPRESSED ===")
+                logger.info("Reason: %s", suppression_check['reason'])
+                run_audit.log(
                     action='publishing_suppressed',
                     post_id=None,
                     run_id=run_id,
@@ -130,8 +475,8 @@ def run_pipeline():
                 return
         except Exception as e:
             # Fail safely: on error, allow publishing to continue
-            print(f"Warning: Suppression check failed: {e}. Allowing publishing to continue.")
-            audit_logger.log(
+            logger.warning("Warning: Suppression check failed: %s. Allowing publishing to continue.", e)
+            run_audit.log(
                 action='error_occurred',
                 post_id=None,
                 run_id=run_id,
@@ -141,39 +486,13 @@ def run_pipeline():
         
         # Generate sales feedback summary for agent conditioning
         try:
-            feedback_summary = sales_feedback.generate_feedback_summary()
-            top_categories = sales_feedback.get_top_performing_categories()
-            zero_sale_categories = sales_feedback.get_zero_sale_categories()
-            
-            # Build feedback text with clarity on data availability
-            feedback_lines = [
-                f"Recent Performance (last {settings.sales_lookback_days} days):",
-                f"- Products published: {feedback_summary['products_published']}",
-                f"- Products sold: {feedback_summary['products_sold']}",
-            ]
-            
-            # Add zero-sale info with clarity
-            if feedback_summary.get('products_without_data', 0) > 0:
-                feedback_lines.append(f"- Products without sales data yet: {feedback_summary['products_without_data']}")
-            if feedback_summary['zero_sale_products'] > 0:
-                feedback_lines.append(f"- Products with tracked zero sales: {feedback_summary['zero_sale_products']}")
-            
-            feedback_lines.extend([
-                f"- Total revenue: ${feedback_summary['total_revenue_cents'] / 100:.2f}",
-                f"- Average price: ${feedback_summary['avg_price_cents'] / 100:.2f}",
-                f"- Refund rate: {feedback_summary['refund_rate']:.1%}",
-                "",
-                f"Top-performing categories: {', '.join(top_categories) if top_categories else 'None yet'}",
-                f"Zero-sale categories: {', '.join(zero_sale_categories) if zero_sale_categories else 'None'}",
-            ])
-            
-            sales_feedback_text = "\n".join(feedback_lines)
-            print(sales_feedback_text)
+            sales_feedback_text = sales_feedback.get_feedback_text()
+            logger.info("%s", sales_feedback_text)
         except Exception as e:
             # Fail safely: on error, provide empty sales feedback
-            print(f"Warning: Feedback summary generation failed: {e}. Continuing without sales conditioning.")
+            logger.warning("Warning: Feedback summary generation failed: %s. Continuing without sales conditioning.", e)
             sales_feedback_text = ""
-            audit_logger.log(
+            run_audit.log(
                 action='error_occurred',
                 post_id=None,
                 run_id=run_id,
@@ -181,315 +500,163 @@ def run_pipeline():
                 error_occurred=True
             )
         
-        print("=== DATA INGESTION ===")
+        logger.info("=== DATA INGESTION ===")
         
         # Get all enabled ingest agents from factory
         ingest_factory = IngestFactory(settings)
         ingest_agents = ingest_factory.get_enabled_agents()
         
         if not ingest_agents:
-            print("ERROR: No data sources enabled or configured properly!")
-            print("Check DATA_SOURCES and related credentials in .env file")
+            logger.error("ERROR: No data sources enabled or configured properly!")
+            logger.error("Check DATA_SOURCES and related credentials in .env file")
             return
         
-        print(f"Enabled data sources: {', '.join(agent.source_name for agent in ingest_agents)}")
+        logger.info("Enabled data sources: %s", ', '.join(agent.source_name for agent in ingest_agents))
         
-        # Fetch posts from all enabled sources
-        all_posts = []
+        # Fetch posts from all enabled sources concurrently
         for agent in ingest_agents:
-            try:
-                print(f"Fetching from {agent.source_name}...")
-                posts = agent.fetch_posts()
-                print(f"  → Fetched {len(posts)} posts from {agent.source_name}")
-                
-                # Save posts to storage
-                saved_count = 0
-                post_ids = []
-                for post in posts:
-                    if storage.save_post(post):
-                        saved_count += 1
-                        post_ids.append(post['id'])
-                
-                print(f"  → Saved {saved_count} new posts")
-                
-                # Log ingestion in audit trail
-                for post_id in post_ids:
-                    audit_logger.log(
-                        action='post_ingested',
-                        post_id=post_id,
-                        run_id=run_id,
-                        details={'source': agent.source_name}
-                    )
+            logger.info("Fetching from %s...", agent.source_name)
+        
+        semaphore = asyncio.BoundedSemaphore(INGEST_CONCURRENCY)
+        results = await asyncio.gather(
+            *(fetch_source(agent, semaphore) for agent in ingest_agents),
+            return_exceptions=True
+        )
+        
+        for agent, result in zip(ingest_agents, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
                 
-            except Exception as e:
-                print(f"ERROR: Failed to fetch from {agent.source_name}: {e}")
+                logger.error("ERROR: Failed to fetch from %s: %s", agent.source_name, result)
                 error_artifact = error_handler.log_error(
                     post_id=None,
                     stage='data_ingestion',
-                    exception=e,
+                    exception=result,
                     context={'source': agent.source_name}
                 )
-                audit_logger.log(
+                run_audit.log(
                     action='error_occurred',
                     post_id=None,
                     run_id=run_id,
-                    details={'stage': 'data_ingestion', 'source': agent.source_name, 'error': str(e)},
+                    details={'stage': 'data_ingestion', 'source': agent.source_name, 'error': str(result)},
                     error_occurred=True
                 )
                 # Continue with other sources
                 continue
+            
+            posts = result
+            logger.info("  → Fetched %s posts from %s", len(posts), agent.source_name)
+            
+            # Save posts to storage in a single transaction
+            post_ids = storage.save_posts_bulk(posts)
+            
+            logger.info("  → Saved %s new posts from %s", len(post_ids), agent.source_name)
+            
+            # Log ingestion in audit trail
+            audit_logger.log_batch([
+                {
+                    'action': 'post_ingested',
+                    'post_id': post_id,
+                    'run_id': run_id,
+                    'details': {'source': agent.source_name}
+                }
+                for post_id in post_ids
+            ])
         
-        print("\n=== PROCESSING POSTS ===")
+        logger.info("=== PROCESSING POSTS ===")
         unprocessed_posts = storage.get_unprocessed_posts()
-        print(f"Found {len(unprocessed_posts)} unprocessed posts")
+        logger.info("Found %s unprocessed posts", len(unprocessed_posts))
         
-        for post in unprocessed_posts:
-            post_id = post['id']
-            print(f"\n--- Post: {post_id} ---")
-            print(f"Title: {post['title'][:60]}...")
-            
-            try:
-                print("Stage: PROBLEM_EXTRACTION")
-                problem_data = extract_problem(post, llm_client, sales_feedback_text)
-                problem_path = save_artifact(post_id, "problem", problem_data)
-                
-                if problem_data.get("discard", True):
-                    print("DISCARD: Problem not monetizable")
-                    storage.log_pipeline_run(post_id, "problem_extraction", "discarded", problem_path)
-                    audit_logger.log(
-                        action='post_discarded',
-                        post_id=post_id,
-                        run_id=run_id,
-                        details={'stage': 'problem_extraction', 'reason': 'not_monetizable'}
-                    )
-                    continue
-                
-                storage.log_pipeline_run(post_id, "problem_extraction", "completed", problem_path)
-                audit_logger.log(
-                    action='problem_extracted',
-                    post_id=post_id,
-                    run_id=run_id,
-                    details={
-                        'summary': problem_data.get('problem_summary', '')[:100],
-                        'urgency_score': problem_data.get('urgency_score', 0)
-                    }
-                )
-                print(f"Problem: {problem_data['problem_summary'][:60]}...")
-                
-                print("Stage: SPEC_GENERATION")
-                spec_data = generate_spec(problem_data, llm_client, sales_feedback_text)
-                spec_path = save_artifact(post_id, "spec", spec_data)
-                
-                if not spec_data.get("build", False):
-                    print("REJECT: Spec build=false")
-                    storage.log_pipeline_run(post_id, "spec_generation", "rejected", spec_path)
-                    audit_logger.log(
-                        action='spec_generated',
-                        post_id=post_id,
-                        run_id=run_id,
-                        details={'rejected': True, 'reason': 'build_false'}
-                    )
-                    continue
-                
-                if spec_data.get("confidence", 0) < 70:
-                    print("REJECT: Confidence too low")
-                    storage.log_pipeline_run(post_id, "spec_generation", "rejected", spec_path)
-                    audit_logger.log(
-                        action='spec_generated',
-                        post_id=post_id,
-                        run_id=run_id,
-                        details={'rejected': True, 'reason': 'low_confidence', 'confidence': spec_data.get("confidence", 0)}
-                    )
-                    continue
-                
-                if len(spec_data.get("deliverables", [])) < 3:
-                    print("REJECT: Too few deliverables")
-                    storage.log_pipeline_run(post_id, "spec_generation", "rejected", spec_path)
-                    audit_logger.log(
-                        action='spec_generated',
-                        post_id=post_id,
-                        run_id=run_id,
-                        details={'rejected': True, 'reason': 'insufficient_deliverables', 'count': len(spec_data.get("deliverables", []))}
-                    )
-                    continue
-                
-                storage.log_pipeline_run(post_id, "spec_generation", "completed", spec_path)
-                audit_logger.log(
-                    action='spec_generated',
-                    post_id=post_id,
-                    run_id=run_id,
-                    details={
-                        'title': spec_data.get('working_title', '')[:80],
-                        'price': spec_data.get('price_recommendation', 0),
-                        'confidence': spec_data.get('confidence', 0)
-                    }
-                )
-                print(f"Spec: {spec_data['working_title']}")
-                
-                regeneration_count = 0
-                content_verified = False
-                content = None
-                content_path = None
-                
-                while regeneration_count <= settings.max_regeneration_attempts and not content_verified:
-                    print(f"Stage: CONTENT_GENERATION (attempt {regeneration_count + 1})")
-                    try:
-                        content = generate_content(spec_data, llm_client)
-                        content_path = save_content_artifact(post_id, content)
-                        storage.log_pipeline_run(post_id, "content_generation", "completed", content_path)
-                        
-                        print("Stage: VERIFICATION")
-                        verdict = verify_content(content, llm_client)
-                        verdict_path = save_artifact(post_id, f"verdict_attempt_{regeneration_count + 1}", verdict)
-                        
-                        if verdict.get("pass", False):
-                            print("PASS: Content verified")
-                            storage.log_pipeline_run(post_id, "verification", "passed", verdict_path)
-                            audit_logger.log(
-                                action='content_verified',
-                                post_id=post_id,
-                                run_id=run_id,
-                                details={'attempt': regeneration_count + 1}
-                            )
-                            content_verified = True
-                        else:
-                            print(f"FAIL: {', '.join(verdict.get('reasons', []))}")
-                            storage.log_pipeline_run(post_id, "verification", "failed", verdict_path)
-                            audit_logger.log(
-                                action='content_rejected',
-                                post_id=post_id,
-                                run_id=run_id,
-                                details={'attempt': regeneration_count + 1, 'reasons': verdict.get('reasons', [])}
-                            )
-                            regeneration_count += 1
-                    except Exception as e:
-                        error_artifact = error_handler.log_error(
-                            post_id=post_id,
-                            stage='content_generation',
-                            exception=e,
-                            context={'attempt': regeneration_count + 1}
-                        )
-                        error_categorization = error_handler.categorize_error(e)
-                        audit_logger.log(
-                            action='error_occurred',
-                            post_id=post_id,
-                            run_id=run_id,
-                            details={'stage': 'content_generation', 'error_type': type(e).__name__, 'transient': error_categorization['is_transient']},
-                            error_occurred=True
-                        )
-                        if error_categorization['is_transient']:
-                            regeneration_count += 1
-                            if regeneration_count > settings.max_regeneration_attempts:
-                                raise
-                        else:
-                            raise
-                
-                if not content_verified:
-                    print("HARD DISCARD: Max regeneration attempts reached")
-                    storage.log_pipeline_run(post_id, "pipeline", "discarded_verification_failed", None, "Max regeneration attempts")
-                    audit_logger.log(
-                        action='post_discarded',
-                        post_id=post_id,
-                        run_id=run_id,
-                        details={'stage': 'verification', 'reason': 'max_attempts_exceeded'}
-                    )
-                    continue
-                
-                print("Stage: GUMROAD_LISTING")
-                listing_text = create_listing(spec_data, content, llm_client)
-                listing_path = save_content_artifact(post_id, listing_text)
-                storage.log_pipeline_run(post_id, "gumroad_listing", "completed", listing_path)
-                audit_logger.log(
-                    action='gumroad_listed',
-                    post_id=post_id,
-                    run_id=run_id,
-                    details={'title': spec_data.get('working_title', '')[:80]}
-                )
-                
-                print("Stage: GUMROAD_UPLOAD")
-                upload_result = upload_to_gumroad(spec_data, listing_text, content_path)
-                upload_path = save_artifact(post_id, "gumroad_upload", upload_result)
-                
-                if upload_result.get("success"):
-                    dry_run_prefix = "[DRY RUN] " if settings.dry_run else ""
-                    print(f"SUCCESS: {dry_run_prefix}Product uploaded - {upload_result.get('product_url')}")
-                    storage.log_pipeline_run(post_id, "gumroad_upload", "completed", upload_path)
-                    
-                    upload_details = {
-                        'product_url': upload_result.get('product_url'), 
-                        'price': spec_data.get('price_recommendation'),
-                        'dry_run': settings.dry_run
-                    }
-                    
-                    audit_logger.log(
-                        action='gumroad_uploaded',
-                        post_id=post_id,
-                        run_id=run_id,
-                        details=upload_details
+        # Posts are independent, so run several at once; the cost governor
+        # still sees every call, and a cost limit stops new posts starting
+        semaphore = asyncio.BoundedSemaphore(max(1, settings.max_concurrency))
+        cost_limit_hit = asyncio.Event()
+        # Tasks still waiting for a semaphore slot
+        queued = set()
+        
+        # Problem extraction is short per post, so posts are sent in groups
+        # and each post's downstream stages use its share of the answer
+        problems = {}
+        
+        async def extract_batch(batch: list):
+            async with semaphore:
+                if cost_limit_hit.is_set():
+                    return
+                try:
+                    results = await asyncio.to_thread(
+                        extract_problems_batch, batch, llm_client, sales_feedback_text
                     )
-                else:
-                    print("FAIL: Gumroad upload failed")
-                    storage.log_pipeline_run(post_id, "gumroad_upload", "failed", upload_path, "Upload failed")
-                    audit_logger.log(
-                        action='error_occurred',
-                        post_id=post_id,
-                        run_id=run_id,
-                        details={'stage': 'gumroad_upload', 'reason': upload_result.get('error', 'unknown')},
-                        error_occurred=True
+                except CostLimitExceeded:
+                    cost_limit_hit.set()
+                    return
+                except Exception as e:
+                    # Posts without a batched result are extracted one by one
+                    logger.warning("Batched problem extraction failed: %s", e)
+                    return
+                for post, problem_data in zip(batch, results):
+                    if problem_data is not None:
+                        problems[post['id']] = problem_data
+        
+        batches = [
+            unprocessed_posts[i:i + PROBLEM_BATCH_SIZE]
+            for i in range(0, len(unprocessed_posts), PROBLEM_BATCH_SIZE)
+        ]
+        await asyncio.gather(*(extract_batch(batch) for batch in batches if len(batch) > 1))
+        
+        async def run_post(post: dict):
+            async with semaphore:
+                queued.discard(asyncio.current_task())
+                if cost_limit_hit.is_set():
+                    return
+                try:
+                    await asyncio.to_thread(
+                        process_post, post, run_id, sales_feedback_text,
+                        llm_client, storage, audit_logger, error_handler,
+                        problems.get(post['id'])
                     )
-            
-            except CostLimitExceeded as e:
-                print(f"COST LIMIT EXCEEDED: {str(e)}")
-                storage.log_pipeline_run(post_id, "pipeline", "cost_limit_exceeded", None, str(e))
-                audit_logger.log(
-                    action='cost_limit_exceeded',
-                    post_id=post_id,
-                    run_id=run_id,
-                    details={'reason': str(e)},
-                    cost_limit_exceeded=True
-                )
-                break
-            
-            except (KeyboardInterrupt, SystemExit):
-                # Allow user interrupts and system exits to propagate
-                raise
-            
-            except Exception as e:
-                print(f"ERROR: {str(e)}")
-                storage.log_pipeline_run(post_id, "pipeline", "error", None, str(e))
-                
-                error_artifact = error_handler.log_error(
-                    post_id=post_id,
-                    stage='pipeline',
-                    exception=e,
-                    context={'post_title': post.get('title', '')}
-                )
-                error_categorization = error_handler.categorize_error(e)
-                audit_logger.log(
-                    action='error_occurred',
-                    post_id=post_id,
-                    run_id=run_id,
-                    details={'stage': 'pipeline', 'error_type': type(e).__name__, 'transient': error_categorization['is_transient']},
-                    error_occurred=True
-                )
-                # Log and continue to next post on non-transient errors
-                continue
+                except CostLimitExceeded:
+                    cost_limit_hit.set()
+                    # Queued posts can no longer run; posts already in a
+                    # worker thread finish (or hit the limit) on their own
+                    for task in queued:
+                        task.cancel()
+        
+        # A cost limit hit during extraction means no post gets started
+        posts_to_run = [] if cost_limit_hit.is_set() else unprocessed_posts
+        tasks = [asyncio.create_task(run_post(post)) for post in posts_to_run]
+        queued.update(tasks)
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        if cost_limit_hit.is_set():
+            skipped = len(unprocessed_posts) - len(posts_to_run)
+            skipped += sum(isinstance(result, asyncio.CancelledError) for result in results)
+            logger.error("COST LIMIT REACHED - skipped %s queued posts", skipped)
+        
+        # Allow user interrupts and system exits to propagate
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, asyncio.CancelledError):
+                raise result
     
     except CostLimitExceeded as e:
-        print(f"\nPIPELINE ABORTED: {str(e)}")
+        logger.error("PIPELINE ABORTED: %s", e)
     
     finally:
-        print("\n=== RUN STATISTICS ===")
+        run_audit.flush()
+        cost_governor.flush()
+        logger.info("=== RUN STATISTICS ===")
         stats = cost_governor.get_run_stats()
-        print(f"Tokens sent: {stats['tokens_sent']}")
-        print(f"Tokens received: {stats['tokens_received']}")
-        print(f"Cost: ${stats['cost_usd']:.4f}")
-        print(f"Lifetime cost: ${cost_governor.get_lifetime_cost():.4f}")
+        logger.info("Tokens sent: %s", stats['tokens_sent'])
+        logger.info("Tokens received: %s", stats['tokens_received'])
+        logger.info("Cached prompt tokens: %s", stats['cached_tokens'])
+        logger.info("Cost: $%.4f", stats['cost_usd'])
+        logger.info("Lifetime cost: $%.4f", cost_governor.get_lifetime_cost())
         if stats['aborted']:
-            print(f"ABORTED: {stats['abort_reason']}")
+            logger.error("ABORTED: %s", stats['abort_reason'])
         
-        print("\n=== PIPELINE COMPLETE ===")
+        logger.info("=== PIPELINE COMPLETE ===")
 
 
 if __name__ == "__main__":
-    run_pipeline()
+    setup_logging()
+    asyncio.run(run_pipeline())
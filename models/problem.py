@@ -4,6 +4,8 @@ from typing import List
 
 @dataclass
 class Problem:
+    __slots__ = ('discard', 'problem_summary', 'who_has_it', 'why_it_matters', 'current_bad_solutions', 'urgency_score', 'evidence_quotes')
+    
     discard: bool
     problem_summary: str
     who_has_it: str
@@ -4,6 +4,11 @@ from typing import List
 
 @dataclass
 class ProductSpec:
+    __slots__ = (
+        'build', 'product_type', 'working_title', 'target_buyer', 'job_to_be_done',
+        'why_existing_products_fail', 'deliverables', 'price_recommendation', 'confidence'
+    )
+    
     build: bool
     product_type: str
     working_title: str
@@ -4,6 +4,8 @@ from typing import List
 
 @dataclass
 class Verdict:
+    __slots__ = ('pass_', 'reasons', 'missing_elements', 'generic_language_detected', 'example_quality_score')
+    
     pass_: bool
     reasons: List[str]
     missing_elements: List[str]
@@ -1,11 +1,21 @@
 """Immutable audit trail for all pipeline operations."""
-import json
 import sqlite3
+import threading
 import time
+import weakref
+import orjson
 from typing import List, Dict, Optional
 from datetime import datetime
 from contextlib import contextmanager
 from config import settings
+from services.db import close_connections
+
+
+def _encode_details(details: Optional[Dict]) -> Optional[str]:
+    """Serialize a details dict for the details column (None when empty)."""
+    if not details:
+        return None
+    return orjson.dumps(details, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
 
 
 class AuditLogger:
@@ -32,24 +42,56 @@ class AuditLogger:
         'config_restored': 'Configuration restored from backup',
     }
     
-    def __init__(self):
-        """Initialize audit logger."""
-        self.db_path = settings.database_path
+    _ACTION_NAMES = frozenset(ACTIONS)
+    
+    # Boolean columns that callers can set through keyword flags
+    FLAG_COLUMNS = ('error_occurred', 'cost_limit_exceeded')
+    
+    def __init__(self, db_path: Optional[str] = None):
+        """Initialize audit logger.
+        
+        Args:
+            db_path: SQLite database path (defaults to settings.database_path)
+        """
+        self.db_path = db_path or settings.database_path
+        # One connection per thread, reused across calls; closed when this
+        # logger is garbage collected or the interpreter exits
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        weakref.finalize(self, close_connections, self._connections)
         self._init_audit_table()
     
     @contextmanager
     def _get_conn(self):
-        """Get database connection."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """Get this thread's pooled database connection."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            # WAL (set once in _init_audit_table) only needs fsync at checkpoints
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
         try:
             yield conn
-        finally:
-            conn.close()
+        except Exception:
+            # Leave no half-finished transaction on the reused connection
+            conn.rollback()
+            raise
+    
+    def close(self):
+        """Close every pooled connection opened by this logger."""
+        close_connections(self._connections)
+        self._local = threading.local()
     
     def _init_audit_table(self):
         """Create audit_log table if it doesn't exist."""
         with self._get_conn() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS audit_log (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -58,19 +100,37 @@ class AuditLogger:
                     post_id TEXT,
                     run_id INTEGER,
                     details TEXT,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    error_occurred INTEGER NOT NULL DEFAULT 0,
+                    cost_limit_exceeded INTEGER NOT NULL DEFAULT 0
                 )
             """)
             
-            # Create index for faster queries
+            # Databases created before the flag columns existed
+            existing = {row[1] for row in conn.execute("PRAGMA table_info(audit_log)")}
+            for column in self.FLAG_COLUMNS:
+                if column not in existing:
+                    conn.execute(f"ALTER TABLE audit_log ADD COLUMN {column} INTEGER NOT NULL DEFAULT 0")
+            
+            # Composite indexes match the (filter, ORDER BY timestamp) shape of
+            # the history queries, so rows come back in order without a sort
+            migrating = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_audit_post_id'"
+            ).fetchone() is not None
+            
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_audit_post_id
-                ON audit_log(post_id)
+                CREATE INDEX IF NOT EXISTS idx_audit_post_id_timestamp
+                ON audit_log(post_id, timestamp)
             """)
             
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_audit_action
-                ON audit_log(action)
+                CREATE INDEX IF NOT EXISTS idx_audit_action_timestamp
+                ON audit_log(action, timestamp DESC)
+            """)
+            
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_audit_run_id_timestamp
+                ON audit_log(run_id, timestamp)
             """)
             
             conn.execute("""
@@ -78,10 +138,18 @@ class AuditLogger:
                 ON audit_log(timestamp DESC)
             """)
             
+            if migrating:
+                # Single-column indexes are prefixes of the composite ones;
+                # dropping them saves a b-tree write on every insert
+                conn.execute("DROP INDEX IF EXISTS idx_audit_post_id")
+                conn.execute("DROP INDEX IF EXISTS idx_audit_action")
+                conn.execute("ANALYZE audit_log")
+            
             conn.commit()
     
     def log(self, action: str, post_id: Optional[str] = None, 
-            run_id: Optional[int] = None, details: Optional[Dict] = None) -> bool:
+            run_id: Optional[int] = None, details: Optional[Dict] = None,
+            error_occurred: bool = False, cost_limit_exceeded: bool = False):
         """Log an operation to audit trail.
         
         Args:
@@ -89,31 +157,82 @@ class AuditLogger:
             post_id: Associated Reddit post ID
             run_id: Associated run ID
             details: Additional context as dictionary
+            error_occurred: Mark the entry as an error
+            cost_limit_exceeded: Mark the entry as a cost limit abort
         
         Returns:
-            True if logged successfully
+            Row id of the new entry, or False if it was not logged
         """
-        if action not in self.ACTIONS:
+        if action not in self._ACTION_NAMES:
             return False
         
         try:
             with self._get_conn() as conn:
-                conn.execute("""
-                    INSERT INTO audit_log (timestamp, action, post_id, run_id, details)
-                    VALUES (?, ?, ?, ?, ?)
+                cursor = conn.execute("""
+                    INSERT INTO audit_log (timestamp, action, post_id, run_id, details,
+                                           error_occurred, cost_limit_exceeded)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
                 """, (
                     int(time.time()),
                     action,
                     post_id,
                     run_id,
-                    json.dumps(details) if details else None
+                    _encode_details(details),
+                    int(error_occurred),
+                    int(cost_limit_exceeded)
                 ))
                 conn.commit()
-            return True
+            return cursor.lastrowid
         except Exception as e:
             print(f"Audit log error: {e}")
             return False
     
+    def log_batch(self, events: List[Dict]) -> int:
+        """Log several operations in a single transaction.
+        
+        Args:
+            events: Dicts with 'action' and optional 'post_id', 'run_id',
+                'details', 'error_occurred' and 'cost_limit_exceeded' keys
+                (same meaning as log() arguments), plus an optional
+                'timestamp' (epoch seconds; defaults to now)
+        
+        Returns:
+            Number of events written (unknown actions are skipped)
+        """
+        now = int(time.time())
+        rows = [
+            (
+                event.get('timestamp', now),
+                event['action'],
+                event.get('post_id'),
+                event.get('run_id'),
+                _encode_details(event.get('details')),
+                int(bool(event.get('error_occurred'))),
+                int(bool(event.get('cost_limit_exceeded')))
+            )
+            for event in events
+            if event.get('action') in self._ACTION_NAMES
+        ]
+        if not rows:
+            return 0
+        
+        try:
+            with self._get_conn() as conn:
+                conn.executemany("""
+                    INSERT INTO audit_log (timestamp, action, post_id, run_id, details,
+                                           error_occurred, cost_limit_exceeded)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, rows)
+                conn.commit()
+            return len(rows)
+        except Exception as e:
+            print(f"Audit log error: {e}")
+            return 0
+    
+    def batch(self) -> 'AuditBatch':
+        """Start a buffer of events that are written together on flush()."""
+        return AuditBatch(self)
+    
     def get_post_history(self, post_id: str) -> List[Dict]:
         """Get all operations for a post.
         
@@ -218,7 +337,48 @@ class AuditLogger:
         # Parse details JSON if present
         if data.get('details'):
             try:
-                data['details'] = json.loads(data['details'])
-            except json.JSONDecodeError:
+                data['details'] = orjson.loads(data['details'])
+            except orjson.JSONDecodeError:
                 pass
         return data
+
+
+class AuditBatch:
+    """Buffer audit events in memory and write them in one transaction."""
+    
+    def __init__(self, audit_logger: AuditLogger):
+        """Initialize an empty batch.
+        
+        Args:
+            audit_logger: Logger the buffered events are flushed to
+        """
+        self.audit_logger = audit_logger
+        self.events: List[Dict] = []
+    
+    def log(self, action: str, post_id: Optional[str] = None,
+            run_id: Optional[int] = None, details: Optional[Dict] = None,
+            error_occurred: bool = False, cost_limit_exceeded: bool = False) -> None:
+        """Queue an operation; accepts the same arguments as AuditLogger.log.
+        
+        The timestamp is taken now, not at flush time, so stage timings survive.
+        """
+        self.events.append({
+            'timestamp': int(time.time()),
+            'action': action,
+            'post_id': post_id,
+            'run_id': run_id,
+            'details': details,
+            'error_occurred': error_occurred,
+            'cost_limit_exceeded': cost_limit_exceeded
+        })
+    
+    def flush(self) -> int:
+        """Write queued events and clear the buffer.
+        
+        Returns:
+            Number of events written
+        """
+        if not self.events:
+            return 0
+        events, self.events = self.events, []
+        return self.audit_logger.log_batch(events)
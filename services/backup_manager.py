@@ -1,21 +1,35 @@
 """Database backup manager with retention policy."""
+import gzip
 import shutil
+import sqlite3
 import json
 import os
 import time
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 from config import settings
 
+# Online backup copies this many pages, then yields to writers briefly
+BACKUP_PAGES_PER_STEP = 1000
+BACKUP_STEP_SLEEP_SECONDS = 0.01
+# Mid-level gzip: SQLite pages (mostly text and JSON) shrink several times
+# over without making the hourly backup CPU-bound on a Pi
+BACKUP_COMPRESS_LEVEL = 6
+BACKUP_SUFFIXES = ('.sqlite.gz', '.sqlite')
+
 
 class BackupManager:
     """Manage automated backups with retention policy."""
     
-    def __init__(self):
-        """Initialize backup manager."""
+    def __init__(self, db_path: Optional[str] = None):
+        """Initialize backup manager.
+        
+        Args:
+            db_path: SQLite database to back up (defaults to settings.database_path)
+        """
         self.backup_dir = Path(settings.artifacts_path) / "backups"
-        self.db_path = Path(settings.database_path)
+        self.db_path = Path(db_path or settings.database_path)
         self.retention = {
             'daily': 7,      # Keep 7 daily backups (1 week)
             'weekly': 4,     # Keep 4 weekly backups (1 month)
@@ -23,7 +37,7 @@ class BackupManager:
         }
     
     def backup_database(self) -> str:
-        """Create backup of pipeline.db.
+        """Create a gzip-compressed backup of pipeline.db.
         
         Returns:
             Path to backup file
@@ -32,14 +46,35 @@ class BackupManager:
             self.backup_dir.mkdir(parents=True, exist_ok=True)
             
             timestamp = datetime.now().isoformat().replace(':', '-')
-            backup_path = self.backup_dir / f"pipeline_db_{timestamp}.sqlite"
+            snapshot_path = self.backup_dir / f"pipeline_db_{timestamp}.sqlite"
+            backup_path = self.backup_dir / f"pipeline_db_{timestamp}.sqlite.gz"
             
-            # Copy database file
-            if self.db_path.exists():
-                shutil.copy2(self.db_path, backup_path)
-            else:
-                # Create empty backup if db doesn't exist yet
-                backup_path.touch()
+            try:
+                # Copy through SQLite's online backup API: it reads a consistent
+                # snapshot even while the pipeline is writing, and copies in
+                # steps so writers are never blocked for the whole copy
+                if self.db_path.exists():
+                    src = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+                    dst = sqlite3.connect(str(snapshot_path))
+                    try:
+                        with dst:
+                            src.backup(dst, pages=BACKUP_PAGES_PER_STEP, sleep=BACKUP_STEP_SLEEP_SECONDS)
+                    finally:
+                        dst.close()
+                        src.close()
+                else:
+                    # Create empty backup if db doesn't exist yet
+                    snapshot_path.touch()
+                
+                # Only the compressed file is kept; it is opened 0o600 up
+                # front so the data is never readable by other users
+                fd = os.open(backup_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                with open(fd, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb',
+                                                          compresslevel=BACKUP_COMPRESS_LEVEL) as out, \
+                        open(snapshot_path, 'rb') as snapshot:
+                    shutil.copyfileobj(snapshot, out, length=1024 * 1024)
+            finally:
+                snapshot_path.unlink(missing_ok=True)
             
             # Set restrictive permissions
             os.chmod(backup_path, 0o600)
@@ -51,17 +86,22 @@ class BackupManager:
         except Exception as e:
             raise RuntimeError(f"Backup failed: {e}") from e
     
-    def restore_database(self, backup_path: str) -> bool:
+    def restore_database(self, backup_path: str) -> Dict:
         """Restore database from backup file.
         
+        Accepts compressed (.sqlite.gz) backups and older uncompressed
+        (.sqlite) ones.
+        
         Args:
             backup_path: Path to backup file
         
         Returns:
-            True if successful
+            Dictionary with 'success' plus 'restored_from' and 'timestamp',
+            or 'error' on failure
         """
+        backup_file = Path(backup_path)
+        restore_path = self.db_path.parent / f"{self.db_path.name}.restore"
         try:
-            backup_file = Path(backup_path)
             if not backup_file.exists():
                 raise FileNotFoundError(f"Backup file not found: {backup_path}")
             
@@ -70,13 +110,34 @@ class BackupManager:
                 recovery_backup = self.db_path.parent / f"{self.db_path.name}.recovery"
                 shutil.copy2(self.db_path, recovery_backup)
             
-            # Restore from backup
-            shutil.copy2(backup_file, self.db_path)
+            if backup_file.name.endswith('.gz'):
+                with gzip.open(backup_file, 'rb') as src, open(restore_path, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, length=1024 * 1024)
+                source_path = restore_path
+            else:
+                source_path = backup_file
+            
+            # Restore through the backup API as well, so a WAL-mode database
+            # and its -wal file stay consistent
+            src = sqlite3.connect(f"file:{source_path}?mode=ro", uri=True)
+            dst = sqlite3.connect(str(self.db_path))
+            try:
+                with dst:
+                    src.backup(dst)
+            finally:
+                dst.close()
+                src.close()
             os.chmod(self.db_path, 0o600)
             
-            return True
+            return {
+                'success': True,
+                'restored_from': str(backup_file),
+                'timestamp': datetime.now().isoformat()
+            }
         except Exception as e:
-            raise RuntimeError(f"Restore failed: {e}") from e
+            return {'success': False, 'error': f"Restore failed: {e}"}
+        finally:
+            restore_path.unlink(missing_ok=True)
     
     def cleanup_old_backups(self) -> int:
         """Apply retention policy and delete old backups.
@@ -84,24 +145,37 @@ class BackupManager:
         Returns:
             Number of backups deleted
         """
-        if not self.backup_dir.exists():
-            return 0
-        
-        backups = sorted(
-            self.backup_dir.glob('pipeline_db_*.sqlite'),
-            key=lambda p: p.stat().st_mtime,
-            reverse=True
-        )
-        
         deleted = 0
-        for i, backup in enumerate(backups):
+        for i, (path, _) in enumerate(self._scan_backups()):
             # Keep most recent N backups based on age
             if i >= self.retention['daily']:
-                backup.unlink()
+                os.unlink(path)
                 deleted += 1
         
         return deleted
     
+    def _scan_backups(self) -> List[Tuple[str, os.stat_result]]:
+        """List backup files with their stat info, newest first.
+        
+        One scandir pass with a single stat per file, instead of globbing
+        and re-statting each path for every sort key and size lookup.
+        
+        Returns:
+            List of (path, stat_result) tuples sorted by mtime descending
+        """
+        try:
+            with os.scandir(self.backup_dir) as it:
+                backups = [
+                    (entry.path, entry.stat(follow_symlinks=False))
+                    for entry in it
+                    if entry.name.startswith('pipeline_db_') and entry.name.endswith(BACKUP_SUFFIXES)
+                ]
+        except FileNotFoundError:
+            return []
+        
+        backups.sort(key=lambda b: b[1].st_mtime, reverse=True)
+        return backups
+    
     def get_backup_status(self) -> Dict:
         """Get backup status and statistics.
         
@@ -111,26 +185,23 @@ class BackupManager:
         if not self.backup_dir.exists():
             return {
                 'backup_dir': str(self.backup_dir),
-                'backup_count': 0,
+                'total_backups': 0,
                 'total_size_mb': 0,
-                'last_backup': None,
+                'latest_backup': None,
                 'status': 'No backups yet'
             }
         
-        backups = list(self.backup_dir.glob('pipeline_db_*.sqlite'))
-        total_size = sum(b.stat().st_size for b in backups) / (1024 * 1024)
-        last_backup = max(
-            (b.stat().st_mtime for b in backups),
-            default=None
-        )
+        backups = self._scan_backups()
+        total_size = sum(st.st_size for _, st in backups) / (1024 * 1024)
+        latest_backup = backups[0][1].st_mtime if backups else None
         
         return {
             'backup_dir': str(self.backup_dir),
-            'backup_count': len(backups),
+            'total_backups': len(backups),
             'total_size_mb': round(total_size, 2),
-            'last_backup': (
-                datetime.fromtimestamp(last_backup).isoformat()
-                if last_backup else None
+            'latest_backup': (
+                datetime.fromtimestamp(latest_backup).isoformat()
+                if latest_backup else None
             ),
             'status': 'OK' if len(backups) > 0 else 'WARNING: No backups'
         }
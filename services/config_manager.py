@@ -2,18 +2,282 @@
 Configuration manager for web-based API key and settings management.
 Handles secure storage, validation, backup, and testing of configuration.
 """
+import hashlib
 import os
 import re
+import shutil
 import stat
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FutureTimeoutError
 from pathlib import Path
-from typing import Dict, Tuple, List, Optional
+from typing import Any, Callable, Dict, Tuple, List, Optional
 from datetime import datetime
-from dotenv import set_key, dotenv_values
-import requests
-import praw
+from functools import lru_cache
+from dotenv import dotenv_values
+from dotenv.parser import parse_stream
 from services.audit_logger import AuditLogger
 
 
+# Seconds to wait for Reddit when testing credentials
+REDDIT_TEST_TIMEOUT = 10
+# praw clients kept for reuse; the least recently tested set is evicted first
+REDDIT_CLIENT_CACHE_SIZE = 4
+# Repeat tests of the same key within this many seconds reuse the last result
+KEY_TEST_DEBOUNCE_SECONDS = 1.0
+# Buffer size for the .env rewrite, large enough to take the file in one write
+ENV_WRITE_BUFFER = 64 * 1024
+# Chunk size for the userspace copy when copy_file_range isn't available
+COPY_BUFFER = 256 * 1024
+
+# praw (and its prawcore/update_checker imports) is only needed for the
+# Reddit credential test, so it is imported on first use
+_praw = None
+
+
+def _get_praw():
+    """Import praw once and return the module."""
+    global _praw
+    if _praw is None:
+        import praw
+        _praw = praw
+    return _praw
+
+# One KEY=value line as this manager writes it: bare, or single/double
+# quoted on one line; anything else falls back to python-dotenv
+_ENV_LINE = re.compile(
+    r"""(?:export\s+)?([A-Za-z_][A-Za-z0-9_.]*)\s*=\s*"""
+    r"""(?:'((?:[^'\\]|\\.)*)'|"((?:[^"\\$]|\\.)*)"|([^'"\s#$\\][^\s#$\\]*)?)"""
+    r"""(?:\s+#.*)?"""
+)
+_SINGLE_QUOTE_ESCAPES = re.compile(r"\\([\\'])")
+
+
+def _fast_parse_env(path: Path) -> Optional[Dict[str, str]]:
+    """Parse a simple .env file in one pass.
+    
+    Handles comments, blank lines, optional 'export', bare values and
+    single-quoted values (the form _apply_updates writes). Double-quoted
+    values are accepted only without escapes or interpolation.
+    
+    Args:
+        path: .env file to read
+    
+    Returns:
+        Dict of keys to values, or None if any line needs the full
+        python-dotenv parser (multiline values, escapes in double quotes,
+        ${VAR} interpolation)
+    """
+    values = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith('#'):
+            continue
+        match = _ENV_LINE.fullmatch(stripped)
+        if match is None:
+            return None
+        key, single, double, bare = match.groups()
+        if single is not None:
+            values[key] = _SINGLE_QUOTE_ESCAPES.sub(r'\1', single)
+        elif double is not None:
+            if '\\' in double:
+                return None
+            values[key] = double
+        else:
+            values[key] = bare or ''
+    return values
+
+
+def _mask(value: str) -> str:
+    """Mask a non-empty secret; not memoized, so raw secrets are never kept as cache keys."""
+    if len(value) < 8:
+        return '***'
+    return ''.join((value[:3], '...', value[-4:]))
+
+
+@lru_cache(maxsize=256)
+def _mtime_iso(mtime: float) -> str:
+    """Format a backup mtime; memoized since listings repeat the same files."""
+    return datetime.fromtimestamp(mtime).isoformat()
+
+
+# ^.{N}$, ^.{N,}$ and ^.{N,M}$ -- pure length rules (REDDIT_USER_AGENT)
+_LENGTH_PATTERN = re.compile(r'\^\.\{(\d+)(?:(,)(\d*))?\}\$')
+
+
+class _LengthPattern:
+    """Regex stand-in for ^.{N,M}$: a length check plus a newline scan.
+    
+    Roughly twice as fast as the regex engine. Prefix/charset patterns stay
+    compiled regexes; str.startswith + str.isalnum and set-subset checks
+    both measured slower than re's fullmatch for them.
+    """
+    
+    __slots__ = ('pattern', '_min_len', '_max_len')
+    
+    def __init__(self, pattern: str, min_len: int, max_len: Optional[int]):
+        self.pattern = pattern
+        self._min_len = min_len
+        self._max_len = max_len
+    
+    def fullmatch(self, value: str) -> bool:
+        length = len(value)
+        if length < self._min_len or (self._max_len is not None and length > self._max_len):
+            return False
+        # '.' matches anything but a newline
+        return '\n' not in value
+
+
+def _compile_pattern(pattern: str):
+    """Compile a schema pattern, using _LengthPattern when it fits.
+    
+    Returns:
+        Object whose fullmatch(value) is truthy exactly when re.fullmatch
+        of the pattern would match
+    """
+    m = _LENGTH_PATTERN.fullmatch(pattern)
+    if m:
+        min_len, comma, max_len = m.groups()
+        if not comma:
+            max_len = min_len
+        return _LengthPattern(pattern, int(min_len), int(max_len) if max_len else None)
+    return re.compile(pattern)
+
+
+def _copy_file_data(fsrc, fdst):
+    """Copy the rest of fsrc into fdst, in-kernel where the OS allows it.
+    
+    copy_file_range moves the bytes without a trip through userspace (a
+    reflink on copy-on-write filesystems); a .env fits in one call. If it's
+    missing or refused (old kernel, cross-filesystem), the copy carries on
+    from the current offsets with a COPY_BUFFER-sized loop.
+    
+    Args:
+        fsrc: Unbuffered source file object
+        fdst: Unbuffered destination file object
+    """
+    if hasattr(os, 'copy_file_range'):
+        src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+        remaining = os.fstat(src_fd).st_size
+        try:
+            while remaining > 0:
+                copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+            return
+        except OSError:
+            pass
+    shutil.copyfileobj(fsrc, fdst, length=COPY_BUFFER)
+
+
+def _build_validator(category: str, key: str, schema: Dict) -> Callable[[Any], Optional[str]]:
+    """Specialize the validation rules of one schema field into a closure.
+    
+    Returns:
+        Function taking a submitted value and returning an error message,
+        or None when the value is valid
+    """
+    pattern = schema.get('_re')
+    
+    if category == 'api_keys':
+        required = schema.get('required', False)
+        
+        def validate(value):
+            if required and not value:
+                return f"{key} is required"
+            if value and pattern is not None and not pattern.fullmatch(value):
+                return f"{key} format is invalid"
+            return None
+    
+    elif category == 'toggles':
+        def validate(value):
+            return None if isinstance(value, bool) else f"{key} must be a boolean"
+    
+    elif schema.get('type') in ('int', 'float'):
+        if schema['type'] == 'int':
+            expected, type_error = int, f"{key} must be an integer"
+        else:
+            expected, type_error = (int, float), f"{key} must be a number"
+        # Bounds and messages are read from the schema once, not per call
+        lo, hi = schema.get('min'), schema.get('max')
+        lo_error, hi_error = f"{key} must be >= {lo}", f"{key} must be <= {hi}"
+        
+        def validate(value):
+            if not isinstance(value, expected):
+                return type_error
+            if lo is not None and value < lo:
+                return lo_error
+            if hi is not None and value > hi:
+                return hi_error
+            return None
+    
+    elif 'type' not in schema and pattern is not None:
+        def validate(value):
+            return None if pattern.fullmatch(str(value)) else f"{key} format is invalid"
+    
+    else:
+        def validate(value):
+            return None
+    
+    return validate
+
+
+# .env spellings of a true toggle
+_TRUTHY = frozenset(('true', '1', 'yes'))
+
+
+def _build_coercer(category: str, schema: Dict) -> Callable[[Any], Any]:
+    """Specialize the .env-string to display-value conversion of one field."""
+    if category == 'toggles':
+        default = schema.get('default', False)
+        
+        def coerce(value):
+            if isinstance(value, bool):
+                return value
+            if isinstance(value, str):
+                return value.lower() in _TRUTHY
+            return default
+    
+    elif category in ('cost_limits', 'pipeline') and schema.get('type') == 'int':
+        default = schema.get('default', 0)
+        
+        def coerce(value):
+            return int(value) if value else default
+    
+    elif category in ('cost_limits', 'pipeline') and schema.get('type') == 'float':
+        default = schema.get('default', 0.0)
+        
+        def coerce(value):
+            return float(value) if value else default
+    
+    else:
+        def coerce(value):
+            return value
+    
+    return coerce
+
+
+def _field_metadata(category: str, schema: Dict) -> Dict:
+    """Static part of a field's get_current_config entry."""
+    if category == 'api_keys':
+        return {
+            'description': schema.get('description', ''),
+            'required': schema.get('required', False),
+            'masked': schema.get('masked', False)
+        }
+    if category == 'toggles':
+        return {'description': schema.get('description', '')}
+    return {
+        'description': schema.get('description', ''),
+        'min': schema.get('min'),
+        'max': schema.get('max')
+    }
+
+
 class ConfigValidationError(Exception):
     """Raised when configuration validation fails."""
     def __init__(self, message, errors=None):
@@ -120,6 +384,37 @@ class ConfigManager:
         }
     }
     
+    # Flat tables derived from CONFIG_SCHEMA by _compile_schema
+    _VALIDATORS: Dict[Tuple[str, str], Callable[[Any], Optional[str]]] = {}
+    _FIELDS: List[Tuple[str, str, Any, bool, Callable[[Any], Any], Dict]] = []
+    
+    @classmethod
+    def _compile_schema(cls):
+        """Specialize CONFIG_SCHEMA into flat lookup tables once at import.
+        
+        Every 'pattern' is compiled into a sibling '_re' entry; validation
+        uses its fullmatch, which also rejects a trailing newline that '$'
+        would let through re.match. Pure length patterns get a
+        _LengthPattern instead of a regex. _VALIDATORS maps
+        (category, key) to a validator closure, and _FIELDS lists, per
+        field, what get_current_config needs to render it.
+        """
+        cls._VALIDATORS = {}
+        cls._FIELDS = []
+        for category, fields in cls.CONFIG_SCHEMA.items():
+            for key, schema in fields.items():
+                if 'pattern' in schema:
+                    schema['_re'] = _compile_pattern(schema['pattern'])
+                cls._VALIDATORS[(category, key)] = _build_validator(category, key, schema)
+                cls._FIELDS.append((
+                    category,
+                    key,
+                    schema.get('default', ''),
+                    category == 'api_keys' and schema.get('masked', False),
+                    _build_coercer(category, schema),
+                    _field_metadata(category, schema)
+                ))
+    
     def __init__(self, env_path: str = '.env'):
         """Initialize ConfigManager.
         
@@ -130,83 +425,88 @@ class ConfigManager:
         self.backup_dir = Path('./config_backups')
         self.backup_dir.mkdir(exist_ok=True)
         self.audit_logger = AuditLogger()
+        # Parsed .env and the (mtime_ns, size) it was parsed at
+        self._env_cache: Optional[Dict] = None
+        self._env_stamp: Optional[Tuple[int, int]] = None
+        # Rendered get_current_config result and the .env stamp it was built from
+        self._config_snapshot: Optional[Dict] = None
+        self._config_snapshot_stamp: Optional[Tuple[int, int]] = None
+        # Backup listing (newest first) and the backup_dir mtime_ns it was read at
+        self._backup_index: Optional[List[Tuple[str, os.stat_result]]] = None
+        self._backup_index_stamp: Optional[int] = None
+        # praw clients keyed by a digest of (client_id, client_secret,
+        # user_agent), least recently used first
+        self._reddit_clients: Dict[str, Any] = {}
+        # Recent key test results: (service, key digest) -> (monotonic time, result)
+        self._last_test: Dict[Tuple[str, str], Tuple[float, Tuple[bool, str]]] = {}
+        # Serializes update_config/restore_backup: the dashboard runs them in
+        # worker threads, and each one backs up, rotates and rewrites .env
+        self._write_lock = threading.Lock()
         
         # Ensure .env file exists
         if not self.env_path.exists():
-            self.env_path.touch()
+            os.close(os.open(self.env_path, os.O_WRONLY | os.O_CREAT, stat.S_IRUSR | stat.S_IWUSR))
         
         # Set secure permissions
         self._set_secure_permissions(self.env_path)
     
+    def _env_file_stamp(self) -> Optional[Tuple[int, int]]:
+        """Return .env's (mtime_ns, size), or None if it doesn't exist."""
+        try:
+            st = self.env_path.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+    
+    def _load_env(self) -> Dict:
+        """Return the parsed .env, re-reading it only when the file changed.
+        
+        Returns:
+            Dict of .env keys to values
+        """
+        stamp = self._env_file_stamp()
+        if self._env_cache is None or stamp != self._env_stamp:
+            if stamp is None:
+                self._env_cache = {}
+            else:
+                parsed = _fast_parse_env(self.env_path)
+                self._env_cache = parsed if parsed is not None else dotenv_values(str(self.env_path))
+            self._env_stamp = stamp
+        return dict(self._env_cache)
+    
     def get_current_config(self) -> Dict:
         """Get current configuration with masked sensitive values.
         
+        The rendered result is kept until .env changes; callers get a copy,
+        so a poll with no changes costs one stat and a small dict copy.
+        
         Returns:
             Dict with configuration organized by category
         """
-        # Load current .env values
-        env_values = dotenv_values(str(self.env_path))
-        
-        config = {
-            'api_keys': {},
-            'toggles': {},
-            'cost_limits': {},
-            'pipeline': {}
-        }
-        
-        # Process each category
-        for category, fields in self.CONFIG_SCHEMA.items():
-            for key, schema in fields.items():
-                value = env_values.get(key, schema.get('default', ''))
-                
-                if category == 'api_keys':
-                    # Mask sensitive API keys
-                    if schema.get('masked') and value:
-                        display_value = self._mask_value(value)
-                    else:
-                        display_value = value
-                    
-                    config[category][key] = {
-                        'value': display_value,
-                        'description': schema.get('description', ''),
-                        'required': schema.get('required', False),
-                        'masked': schema.get('masked', False)
-                    }
-                
-                elif category == 'toggles':
-                    # Convert string to boolean
-                    if isinstance(value, bool):
-                        bool_value = value
-                    elif isinstance(value, str):
-                        bool_value = value.lower() in ('true', '1', 'yes')
-                    else:
-                        bool_value = schema.get('default', False)
-                    
-                    config[category][key] = {
-                        'value': bool_value,
-                        'description': schema.get('description', '')
-                    }
-                
-                elif category in ('cost_limits', 'pipeline'):
-                    # Keep numeric/string values
-                    if 'type' in schema:
-                        if schema['type'] == 'int':
-                            typed_value = int(value) if value else schema.get('default', 0)
-                        elif schema['type'] == 'float':
-                            typed_value = float(value) if value else schema.get('default', 0.0)
-                        else:
-                            typed_value = value
-                    else:
-                        typed_value = value
-                    
-                    config[category][key] = {
-                        'value': typed_value,
-                        'description': schema.get('description', ''),
-                        'min': schema.get('min'),
-                        'max': schema.get('max')
-                    }
+        stamp = self._env_file_stamp()
+        if self._config_snapshot is None or stamp != self._config_snapshot_stamp:
+            # Load current .env values
+            env_values = self._load_env()
+            
+            config = {category: {} for category in self.CONFIG_SCHEMA}
+            
+            for category, key, default, masked, coerce, metadata in self._FIELDS:
+                value = env_values.get(key, default)
+                # Mask sensitive API keys
+                if masked and value:
+                    display_value = self._mask_value(value)
+                else:
+                    display_value = coerce(value)
+                config[category][key] = {'value': display_value, **metadata}
+            
+            self._config_snapshot = config
+            self._config_snapshot_stamp = self._env_stamp
         
-        return config
+        # Entries hold only scalars, so two levels of copying are enough
+        return {
+            category: {key: dict(entry) for key, entry in fields.items()}
+            for category, fields in self._config_snapshot.items()
+        }
     
     def update_config(self, updates: Dict, user_ip: str = None) -> Tuple[bool, List[str]]:
         """Update configuration with validation and backup.
@@ -218,53 +518,58 @@ class ConfigManager:
         Returns:
             Tuple of (success, errors_or_warnings)
         """
-        errors = []
-        
-        try:
-            # Validate all updates
-            self._validate_updates(updates)
-            
-            # Create backup before making changes
-            backup_path = self._create_backup()
+        with self._write_lock:
+            errors = []
             
             try:
-                # Apply updates
-                self._apply_updates(updates)
+                # Validate all updates
+                self._validate_updates(updates)
                 
-                # Log successful update (with masked values)
-                masked_updates = self._mask_updates(updates)
-                self.audit_logger.log(
-                    action='config_updated',
-                    post_id=None,
-                    run_id=None,
-                    details={
-                        'updates': masked_updates,
-                        'user_ip': user_ip,
-                        'backup_path': str(backup_path),
-                        'timestamp': datetime.now().isoformat()
-                    }
-                )
+                # Create backup before making changes
+                backup_path = self._create_backup()
                 
-                # Rotate old backups
-                self._rotate_backups()
-                
-                return True, ["Configuration updated successfully"]
+                try:
+                    # Apply updates
+                    self._apply_updates(updates)
+                    
+                    # Log successful update (with masked values)
+                    masked_updates = self._mask_updates(updates)
+                    self.audit_logger.log(
+                        action='config_updated',
+                        post_id=None,
+                        run_id=None,
+                        details={
+                            'updates': masked_updates,
+                            'user_ip': user_ip,
+                            'backup_path': str(backup_path),
+                            'timestamp': datetime.now().isoformat()
+                        }
+                    )
+                    
+                    # Rotate old backups
+                    self._rotate_backups()
+                    
+                    return True, ["Configuration updated successfully"]
                 
+                except Exception as e:
+                    # Rollback on failure
+                    self._restore_backup(backup_path)
+                    errors.append(f"Update failed, restored from backup: {str(e)}")
+                    return False, errors
+            
+            except ConfigValidationError as e:
+                return False, e.errors
             except Exception as e:
-                # Rollback on failure
-                self._restore_backup(backup_path)
-                errors.append(f"Update failed, restored from backup: {str(e)}")
+                errors.append(f"Unexpected error: {str(e)}")
                 return False, errors
-                
-        except ConfigValidationError as e:
-            return False, e.errors
-        except Exception as e:
-            errors.append(f"Unexpected error: {str(e)}")
-            return False, errors
     
     def test_api_key(self, service: str, api_key: str) -> Tuple[bool, str]:
         """Test API key validity with actual API calls.
         
+        A key tested again within KEY_TEST_DEBOUNCE_SECONDS gets the previous
+        result instead of another live request, so bursts of clicks cost one
+        call against the provider's quota.
+        
         Args:
             service: Service name (OPENAI, REDDIT, GUMROAD)
             api_key: API key to test
@@ -274,6 +579,31 @@ class ConfigManager:
         """
         service = service.upper()
         
+        # Keyed by a digest so the raw secret is never held as a dict key
+        cache_key = (service, hashlib.blake2b(api_key.encode('utf-8'), digest_size=8).hexdigest())
+        now = time.monotonic()
+        recent = self._last_test.get(cache_key)
+        if recent is not None and now - recent[0] < KEY_TEST_DEBOUNCE_SECONDS:
+            return recent[1]
+        
+        result = self._run_key_test(service, api_key)
+        self._last_test = {
+            key: entry for key, entry in self._last_test.items()
+            if now - entry[0] < KEY_TEST_DEBOUNCE_SECONDS
+        }
+        self._last_test[cache_key] = (time.monotonic(), result)
+        return result
+    
+    def _run_key_test(self, service: str, api_key: str) -> Tuple[bool, str]:
+        """Dispatch a key test to the service-specific checker.
+        
+        Args:
+            service: Upper-cased service name
+            api_key: API key to test
+        
+        Returns:
+            Tuple of (is_valid, message)
+        """
         try:
             if service == 'OPENAI':
                 return self._test_openai_key(api_key)
@@ -286,24 +616,67 @@ class ConfigManager:
         except Exception as e:
             return False, f"Test failed: {str(e)}"
     
+    def test_api_keys(self, creds: Dict[str, str]) -> Dict[str, Tuple[bool, str]]:
+        """Test several API keys at once.
+        
+        Each test is an independent network round-trip, so they run in
+        parallel and the total wait is the slowest test, not the sum.
+        
+        Args:
+            creds: Mapping of service name (OPENAI, REDDIT, GUMROAD) to key
+        
+        Returns:
+            Mapping of service name to (is_valid, message)
+        """
+        if not creds:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=len(creds)) as executor:
+            futures = {
+                executor.submit(self.test_api_key, service, api_key): service
+                for service, api_key in creds.items()
+            }
+            return {futures[future]: future.result() for future in as_completed(futures)}
+    
     def list_backups(self) -> List[Dict]:
         """List all available configuration backups.
         
         Returns:
             List of backup metadata dicts
         """
-        backups = []
-        
-        for backup_file in sorted(self.backup_dir.glob('env_backup_*.txt'), reverse=True):
-            stat_info = backup_file.stat()
-            backups.append({
-                'filename': backup_file.name,
-                'path': str(backup_file),
-                'created_at': datetime.fromtimestamp(stat_info.st_mtime).isoformat(),
+        return [
+            {
+                'filename': name,
+                'path': str(self.backup_dir / name),
+                'created_at': _mtime_iso(stat_info.st_mtime),
                 'size_bytes': stat_info.st_size
-            })
+            }
+            for name, stat_info in self._scan_backups()
+        ]
+    
+    def _scan_backups(self) -> List[Tuple[str, os.stat_result]]:
+        """List backup files with their stat info, newest first.
         
-        return backups
+        The listing is cached and only re-read when backup_dir's mtime
+        changes, which happens whenever a backup is added or removed by
+        this or any other process.
+        
+        Returns:
+            List of (filename, stat_result) tuples
+        """
+        stamp = self.backup_dir.stat().st_mtime_ns
+        if self._backup_index is None or stamp != self._backup_index_stamp:
+            with os.scandir(self.backup_dir) as it:
+                entries = [
+                    (entry.name, entry.stat())
+                    for entry in it
+                    if entry.name.startswith('env_backup_') and entry.name.endswith('.txt')
+                ]
+            # Timestamped names sort chronologically
+            entries.sort(reverse=True)
+            self._backup_index = entries
+            self._backup_index_stamp = stamp
+        return self._backup_index
     
     def restore_backup(self, backup_filename: str, user_ip: str = None) -> Tuple[bool, str]:
         """Restore configuration from a backup file.
@@ -315,35 +688,36 @@ class ConfigManager:
         Returns:
             Tuple of (success, message)
         """
-        backup_path = self.backup_dir / backup_filename
-        
-        if not backup_path.exists():
-            return False, f"Backup file not found: {backup_filename}"
-        
-        try:
-            # Create a backup of current state before restoring
-            current_backup = self._create_backup()
-            
-            # Restore from backup
-            self._restore_backup(backup_path)
+        with self._write_lock:
+            backup_path = self.backup_dir / backup_filename
             
-            # Log restoration
-            self.audit_logger.log(
-                action='config_restored',
-                post_id=None,
-                run_id=None,
-                details={
-                    'restored_from': backup_filename,
-                    'current_backup': str(current_backup),
-                    'user_ip': user_ip,
-                    'timestamp': datetime.now().isoformat()
-                }
-            )
+            if not backup_path.exists():
+                return False, f"Backup file not found: {backup_filename}"
             
-            return True, f"Configuration restored from {backup_filename}"
+            try:
+                # Create a backup of current state before restoring
+                current_backup = self._create_backup()
+                
+                # Restore from backup
+                self._restore_backup(backup_path)
+                
+                # Log restoration
+                self.audit_logger.log(
+                    action='config_restored',
+                    post_id=None,
+                    run_id=None,
+                    details={
+                        'restored_from': backup_filename,
+                        'current_backup': str(current_backup),
+                        'user_ip': user_ip,
+                        'timestamp': datetime.now().isoformat()
+                    }
+                )
+                
+                return True, f"Configuration restored from {backup_filename}"
             
-        except Exception as e:
-            return False, f"Restore failed: {str(e)}"
+            except Exception as e:
+                return False, f"Restore failed: {str(e)}"
     
     def _validate_updates(self, updates: Dict):
         """Validate all update values.
@@ -361,50 +735,15 @@ class ConfigManager:
                 errors.append(f"Unknown configuration category: {category}")
                 continue
             
-            schema_category = self.CONFIG_SCHEMA[category]
-            
             for key, value in fields.items():
-                if key not in schema_category:
+                validate = self._VALIDATORS.get((category, key))
+                if validate is None:
                     errors.append(f"Unknown configuration key: {key}")
                     continue
                 
-                schema = schema_category[key]
-                
-                # Validate API keys
-                if category == 'api_keys':
-                    if schema.get('required') and not value:
-                        errors.append(f"{key} is required")
-                    elif value and 'pattern' in schema:
-                        if not re.match(schema['pattern'], value):
-                            errors.append(f"{key} format is invalid")
-                
-                # Validate toggles
-                elif category == 'toggles':
-                    if not isinstance(value, bool):
-                        errors.append(f"{key} must be a boolean")
-                
-                # Validate numeric ranges
-                elif category in ('cost_limits', 'pipeline'):
-                    if 'type' in schema:
-                        if schema['type'] == 'int':
-                            if not isinstance(value, int):
-                                errors.append(f"{key} must be an integer")
-                            elif 'min' in schema and value < schema['min']:
-                                errors.append(f"{key} must be >= {schema['min']}")
-                            elif 'max' in schema and value > schema['max']:
-                                errors.append(f"{key} must be <= {schema['max']}")
-                        
-                        elif schema['type'] == 'float':
-                            if not isinstance(value, (int, float)):
-                                errors.append(f"{key} must be a number")
-                            elif 'min' in schema and value < schema['min']:
-                                errors.append(f"{key} must be >= {schema['min']}")
-                            elif 'max' in schema and value > schema['max']:
-                                errors.append(f"{key} must be <= {schema['max']}")
-                    
-                    elif 'pattern' in schema:
-                        if not re.match(schema['pattern'], str(value)):
-                            errors.append(f"{key} format is invalid")
+                error = validate(value)
+                if error:
+                    errors.append(error)
         
         if errors:
             raise ConfigValidationError("Validation failed", errors)
@@ -415,16 +754,18 @@ class ConfigManager:
         Returns:
             Path to backup file
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        # Local time, same as datetime.now(), without building a datetime
+        timestamp = time.strftime('%Y%m%d_%H%M%S')
         backup_filename = f'env_backup_{timestamp}.txt'
         backup_path = self.backup_dir / backup_filename
         
-        # Copy current .env to backup
+        # Copy current .env to backup (owner read/write only)
         if self.env_path.exists():
-            backup_path.write_text(self.env_path.read_text())
-        
-        # Set secure permissions (owner read/write only)
-        self._set_secure_permissions(backup_path)
+            self._copy_secure(self.env_path, backup_path)
+        else:
+            self._set_secure_permissions(backup_path)
+        # Don't rely on directory mtime resolution for our own writes
+        self._backup_index = None
         
         # Log backup creation
         self.audit_logger.log(
@@ -448,23 +789,27 @@ class ConfigManager:
         if not backup_path.exists():
             raise FileNotFoundError(f"Backup not found: {backup_path}")
         
-        # Read backup content
-        backup_content = backup_path.read_text()
-        
-        # Write to .env atomically (write to temp, then rename)
+        # Write to .env atomically (copy to temp, then rename)
         temp_path = self.env_path.parent / f'.env.tmp.{os.getpid()}'
-        temp_path.write_text(backup_content)
-        self._set_secure_permissions(temp_path)
+        self._copy_secure(backup_path, temp_path)
         
         # Atomic rename
         temp_path.replace(self.env_path)
+        self._env_cache = None
+        self._config_snapshot = None
     
     def _apply_updates(self, updates: Dict):
         """Apply validated updates to .env file.
         
+        All keys are rewritten in one pass over the file and written
+        atomically (temp file, fsync, rename), instead of one full
+        read/rewrite per key. Comments, ordering and untouched lines are
+        kept as they are.
+        
         Args:
             updates: Dictionary of updates organized by category
         """
+        new_lines = {}
         for category, fields in updates.items():
             for key, value in fields.items():
                 # Convert booleans to string
@@ -473,11 +818,51 @@ class ConfigManager:
                 else:
                     str_value = str(value)
                 
-                # Use python-dotenv's set_key for atomic writes
-                set_key(str(self.env_path), key, str_value)
+                # Single-quoted like dotenv's set_key; the parser decodes \\ and \'
+                escaped = str_value.replace('\\', '\\\\').replace("'", "\\'")
+                new_lines[key] = f"{key}='{escaped}'\n"
         
-        # Ensure secure permissions after updates
-        self._set_secure_permissions(self.env_path)
+        if not new_lines:
+            return
+        
+        out = []
+        written = set()
+        missing_newline = False
+        if self.env_path.exists():
+            with open(self.env_path, 'r', encoding='utf-8') as source:
+                for binding in parse_stream(source):
+                    # Every occurrence is rewritten: dotenv uses the last one
+                    if binding.key in new_lines:
+                        out.append(new_lines[binding.key])
+                        written.add(binding.key)
+                    else:
+                        out.append(binding.original.string)
+                    missing_newline = not binding.original.string.endswith('\n')
+        # Keys not yet in the file are appended
+        appended = [line for key, line in new_lines.items() if key not in written]
+        if appended and missing_newline:
+            out.append('\n')
+        out.extend(appended)
+        
+        # Unique temp file in the same directory (created 0600) so the
+        # replace below stays atomic and no two writers share a path
+        fd, temp_name = tempfile.mkstemp(prefix='.env.tmp.', dir=self.env_path.parent)
+        temp_path = Path(temp_name)
+        try:
+            # Encode up front and hand the whole file over in one write
+            with open(fd, 'wb', buffering=ENV_WRITE_BUFFER) as dest:
+                dest.write(''.join(out).encode('utf-8'))
+                dest.flush()
+                os.fsync(dest.fileno())
+            
+            # Ensure secure permissions, then swap in atomically
+            self._set_secure_permissions(temp_path)
+            temp_path.replace(self.env_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+        self._env_cache = None
+        self._config_snapshot = None
     
     def _rotate_backups(self, keep_count: int = 7):
         """Delete old backups, keeping only the most recent N.
@@ -485,11 +870,10 @@ class ConfigManager:
         Args:
             keep_count: Number of backups to keep
         """
-        backups = sorted(self.backup_dir.glob('env_backup_*.txt'), reverse=True)
-        
         # Delete backups beyond keep_count
-        for old_backup in backups[keep_count:]:
-            old_backup.unlink()
+        for name, _ in self._scan_backups()[keep_count:]:
+            (self.backup_dir / name).unlink(missing_ok=True)
+        self._backup_index = None
     
     def _mask_value(self, value: str) -> str:
         """Mask sensitive values to show only first 3 and last 4 chars.
@@ -500,10 +884,7 @@ class ConfigManager:
         Returns:
             Masked value
         """
-        if not value or len(value) < 8:
-            return '***'
-        
-        return f"{value[:3]}...{value[-4:]}"
+        return _mask(value) if value else '***'
     
     def _mask_updates(self, updates: Dict) -> Dict:
         """Mask sensitive values in updates dict.
@@ -512,32 +893,53 @@ class ConfigManager:
             updates: Dictionary of updates
         
         Returns:
-            Dictionary with masked sensitive values
+            Dictionary with masked sensitive values. Only api_keys gets a
+            new dict; other categories are passed through as-is since the
+            result is only serialized into the audit log.
         """
-        masked = {}
+        masked = dict(updates)
         
-        for category, fields in updates.items():
-            masked[category] = {}
-            
-            if category == 'api_keys':
-                schema_category = self.CONFIG_SCHEMA[category]
-                for key, value in fields.items():
-                    if key in schema_category and schema_category[key].get('masked'):
-                        masked[category][key] = self._mask_value(str(value))
-                    else:
-                        masked[category][key] = value
-            else:
-                masked[category] = fields.copy()
+        if 'api_keys' in masked:
+            schema_category = self.CONFIG_SCHEMA['api_keys']
+            masked['api_keys'] = {
+                key: self._mask_value(str(value)) if schema_category.get(key, {}).get('masked') else value
+                for key, value in masked['api_keys'].items()
+            }
         
         return masked
     
+    def _copy_secure(self, src: Path, dst: Path):
+        """Copy a file byte-for-byte into dst, which ends up 0o600.
+        
+        dst is created 0o600, or fchmod'ed on the open descriptor if it
+        already existed with another mode, before any data lands, so
+        callers need no separate chmod. The bytes are copied by
+        _copy_file_data and never decoded.
+        
+        Args:
+            src: File to copy
+            dst: Destination path (created or truncated)
+        """
+        secure_mode = stat.S_IRUSR | stat.S_IWUSR
+        with open(src, 'rb', buffering=0) as fsrc:
+            fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, secure_mode)
+            with open(fd, 'wb', buffering=0) as fdst:
+                if stat.S_IMODE(os.fstat(fd).st_mode) != secure_mode:
+                    os.fchmod(fd, secure_mode)
+                _copy_file_data(fsrc, fdst)
+    
     def _set_secure_permissions(self, file_path: Path):
         """Set file permissions to 0o600 (owner read/write only).
         
+        Files this class creates already start out as 0o600, so the chmod
+        is only issued when the current mode differs.
+        
         Args:
             file_path: Path to file
         """
-        os.chmod(file_path, stat.S_IRUSR | stat.S_IWUSR)
+        secure_mode = stat.S_IRUSR | stat.S_IWUSR
+        if stat.S_IMODE(os.stat(file_path).st_mode) != secure_mode:
+            os.chmod(file_path, secure_mode)
     
     def _test_openai_key(self, api_key: str) -> Tuple[bool, str]:
         """Test OpenAI API key.
@@ -548,8 +950,11 @@ class ConfigManager:
         Returns:
             Tuple of (is_valid, message)
         """
+        import requests
+        from services.http_session import get_http_session
+        
         try:
-            response = requests.get(
+            response = get_http_session().get(
                 'https://api.openai.com/v1/models',
                 headers={'Authorization': f'Bearer {api_key}'},
                 timeout=10
@@ -561,7 +966,7 @@ class ConfigManager:
                 return False, "✗ Invalid OpenAI API key"
             else:
                 return False, f"✗ OpenAI API returned status {response.status_code}"
-                
+        
         except requests.exceptions.Timeout:
             return False, "✗ OpenAI API request timed out"
         except Exception as e:
@@ -578,27 +983,45 @@ class ConfigManager:
         Returns:
             Tuple of (is_valid, message)
         """
+        praw = _get_praw()
+        
         try:
             # Load current config to get client_id and user_agent
-            env_values = dotenv_values(str(self.env_path))
+            env_values = self._load_env()
             client_id = env_values.get('REDDIT_CLIENT_ID')
             user_agent = env_values.get('REDDIT_USER_AGENT', 'Pi-Autopilot/2.0')
             
             if not client_id:
                 return False, "✗ REDDIT_CLIENT_ID not configured"
             
-            # Test authentication
-            reddit = praw.Reddit(
-                client_id=client_id,
-                client_secret=client_secret,
-                user_agent=user_agent
-            )
+            # Building a praw client is slow, so reuse one per credential set;
+            # keyed by a digest so the raw secret is never held as a dict key
+            client_key = hashlib.sha256(
+                '\0'.join((client_id, client_secret, user_agent)).encode('utf-8')
+            ).hexdigest()
+            reddit = self._reddit_clients.pop(client_key, None)
+            if reddit is None:
+                reddit = praw.Reddit(
+                    client_id=client_id,
+                    client_secret=client_secret,
+                    user_agent=user_agent
+                )
+            self._reddit_clients[client_key] = reddit
+            while len(self._reddit_clients) > REDDIT_CLIENT_CACHE_SIZE:
+                del self._reddit_clients[next(iter(self._reddit_clients))]
             
-            # Try to access user info (will fail if auth is invalid)
-            _ = reddit.user.me()
+            # Try to access user info (will fail if auth is invalid); bounded
+            # so a stalled connection can't hang the caller
+            executor = ThreadPoolExecutor(max_workers=1)
+            try:
+                executor.submit(reddit.user.me).result(timeout=REDDIT_TEST_TIMEOUT)
+            finally:
+                executor.shutdown(wait=False)
             
             return True, "✓ Reddit API credentials are valid"
-            
+        
+        except FutureTimeoutError:
+            return False, f"✗ Reddit API did not respond within {REDDIT_TEST_TIMEOUT}s"
         except praw.exceptions.ResponseException as e:
             return False, f"✗ Invalid Reddit credentials: {str(e)}"
         except Exception as e:
@@ -613,8 +1036,11 @@ class ConfigManager:
         Returns:
             Tuple of (is_valid, message)
         """
+        import requests
+        from services.http_session import get_http_session
+        
         try:
-            response = requests.get(
+            response = get_http_session().get(
                 'https://api.gumroad.com/v2/user',
                 params={'access_token': access_token},
                 timeout=10
@@ -630,8 +1056,11 @@ class ConfigManager:
                 return False, "✗ Invalid Gumroad access token"
             else:
                 return False, f"✗ Gumroad API returned status {response.status_code}"
-                
+        
         except requests.exceptions.Timeout:
             return False, "✗ Gumroad API request timed out"
         except Exception as e:
             return False, f"✗ Error testing Gumroad token: {str(e)}"
+
+
+ConfigManager._compile_schema()
@@ -1,6 +1,9 @@
 """Configuration validation module for Pi-Autopilot."""
 import re
-from typing import List, Tuple
+from typing import FrozenSet, List, Tuple
+
+# Compiled once here instead of per subreddit on every validation
+_SUBREDDIT_NAME = re.compile(r'[a-zA-Z0-9_-]{2,}')
 
 
 class ConfigValidationError(Exception):
@@ -30,6 +33,9 @@ class ConfigValidator:
         'reddit_client_id': r'^[a-zA-Z0-9_-]{20,}$',
         'reddit_client_secret': r'^[a-zA-Z0-9_-]{20,}$',
     }
+    _COMPILED_API_KEY_PATTERNS = {
+        field: re.compile(pattern) for field, pattern in API_KEY_PATTERNS.items()
+    }
     
     def __init__(self, config=None):
         """Initialize validator with optional config override."""
@@ -40,10 +46,17 @@ class ConfigValidator:
         else:
             self.config = config
         self.errors: List[str] = []
+        # DATA_SOURCES parsed once per validate_all, in order and as a set
+        self._sources: List[str] = []
+        self._source_set: FrozenSet[str] = frozenset()
     
     def validate_all(self) -> Tuple[bool, List[str]]:
         """Run all validations and return (is_valid, errors)."""
         self.errors = []
+        self._sources = [
+            s.strip().lower() for s in str(self.config.data_sources or '').split(',') if s.strip()
+        ]
+        self._source_set = frozenset(self._sources)
         
         self._validate_required_fields()
         self._validate_data_sources()
@@ -78,7 +91,7 @@ class ConfigValidator:
             self.errors.append("No data sources configured. Set DATA_SOURCES in .env")
             return
         
-        sources = [s.strip().lower() for s in str(self.config.data_sources).split(',') if s.strip()]
+        sources = self._sources
         
         if not sources:
             self.errors.append("No valid data sources configured. Set DATA_SOURCES in .env")
@@ -95,7 +108,7 @@ class ConfigValidator:
                 )
         
         # Validate source-specific requirements
-        if 'reddit' in sources:
+        if 'reddit' in self._source_set:
             for field in self.REDDIT_FIELDS:
                 value = getattr(self.config, field, None)
                 if not value or not str(value).strip():
@@ -105,13 +118,13 @@ class ConfigValidator:
             # Validate subreddit list
             self._validate_subreddit_list()
         
-        if 'rss' in sources:
+        if 'rss' in self._source_set:
             if not self.config.rss_feed_urls or not str(self.config.rss_feed_urls).strip():
                 self.errors.append(
                     "RSS source enabled but rss_feed_urls not configured"
                 )
         
-        if 'file' in sources:
+        if 'file' in self._source_set:
             if not self.config.file_ingest_paths or not str(self.config.file_ingest_paths).strip():
                 self.errors.append(
                     "File source enabled but file_ingest_paths not configured"
@@ -119,16 +132,15 @@ class ConfigValidator:
     
     def _validate_api_key_formats(self):
         """Check API key formats match expected patterns."""
+        reddit_enabled = 'reddit' in self._source_set
         for field, pattern in self.API_KEY_PATTERNS.items():
             value = getattr(self.config, field, None)
             
             # Skip Reddit credential validation if reddit not in data sources
-            if field in self.REDDIT_FIELDS:
-                sources = [s.strip().lower() for s in self.config.data_sources.split(',')]
-                if 'reddit' not in sources:
-                    continue
+            if field in self.REDDIT_FIELDS and not reddit_enabled:
+                continue
             
-            if value and not re.match(pattern, str(value)):
+            if value and not self._COMPILED_API_KEY_PATTERNS[field].match(str(value)):
                 self.errors.append(
                     f"Invalid format for {field}. "
                     f"Expected pattern: {pattern}"
@@ -177,13 +189,15 @@ class ConfigValidator:
             self.errors.append("Reddit enabled but no subreddits configured")
             return
         
-        subreddits = [
-            s.strip() for s in self.config.reddit_subreddits.split(',')
-        ]
-        
-        for sub in subreddits:
-            if sub and not re.match(r'^[a-zA-Z0-9_-]{2,}$', sub):
+        # One pass: validate each name and note whether any was given
+        named = False
+        for raw in self.config.reddit_subreddits.split(','):
+            sub = raw.strip()
+            if not sub:
+                continue
+            named = True
+            if not _SUBREDDIT_NAME.fullmatch(sub):
                 self.errors.append(f"Invalid subreddit name: {sub}")
         
-        if not subreddits or all(not s for s in subreddits):
+        if not named:
             self.errors.append("No valid subreddits configured")
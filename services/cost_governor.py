@@ -1,9 +1,13 @@
 import sqlite3
-import json
 import os
 import time
+import threading
+import weakref
+import orjson
 from contextlib import contextmanager
+from typing import List
 from config import settings
+from services.db import close_connections
 
 try:
     import tiktoken
@@ -11,17 +15,66 @@ try:
 except ImportError:
     TIKTOKEN_AVAILABLE = False
 
+# record_usage rows are written in one transaction once this many are
+# pending, or once this many seconds have passed since the last write
+USAGE_FLUSH_ROWS = 16
+USAGE_FLUSH_SECONDS = 5.0
+# Once lifetime spend passes this fraction of MAX_USD_LIFETIME, each limit
+# check writes buffered rows first so the cap's history survives a crash
+LIFETIME_FLUSH_FRACTION = 0.9
+
+_INSERT_USAGE = """
+    INSERT INTO cost_tracking (run_id, tokens_sent, tokens_received, usd_cost, timestamp, model)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+
+def _write_pending_usage(db_path: str, pending: List[tuple]):
+    """Write usage rows still buffered when a governor is collected or at exit."""
+    if not pending:
+        return
+    conn = sqlite3.connect(db_path)
+    try:
+        with conn:
+            conn.executemany(_INSERT_USAGE, pending)
+        pending.clear()
+    finally:
+        conn.close()
+
 
 class CostGovernor:
     def __init__(self):
         self.db_path = settings.database_path
         self.run_id = time.time_ns()
+        # One connection per thread, reused across calls; closed when this
+        # governor is garbage collected or the interpreter exits
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        weakref.finalize(self, close_connections, self._connections)
         self._init_db()
+        # Lifetime spend, summed once here and kept current by record_usage
+        # so the per-call limit check doesn't rescan cost_tracking
+        with self._get_conn() as conn:
+            self._lifetime_cost = conn.execute(
+                "SELECT COALESCE(SUM(usd_cost), 0.0) FROM cost_tracking"
+            ).fetchone()[0]
         self.run_tokens_sent = 0
         self.run_tokens_received = 0
         self.run_cost = 0.0
+        # Prompt tokens the provider served from its prefix cache
+        self.run_cached_tokens = 0
         self.aborted = False
         self.abort_reason = None
+        # Posts are processed in worker threads; keep run totals consistent
+        self._lock = threading.RLock()
+        # Each thread's in-flight call: the (input tokens, output tokens, cost)
+        # estimate that check_limits_before_call added to the totals
+        self._reservations = threading.local()
+        # Usage rows not yet written to cost_tracking (see flush)
+        self._pending_usage: List[tuple] = []
+        self._last_flush = time.monotonic()
+        weakref.finalize(self, _write_pending_usage, self.db_path, self._pending_usage)
         
         # Initialize tiktoken encoder if available
         if TIKTOKEN_AVAILABLE:
@@ -35,15 +88,35 @@ class CostGovernor:
     
     @contextmanager
     def _get_conn(self):
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """Get this thread's pooled database connection."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            # WAL (set once in _init_db) only needs fsync at checkpoints
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
         try:
             yield conn
-        finally:
-            conn.close()
+        except Exception:
+            # Leave no half-finished transaction on the reused connection
+            conn.rollback()
+            raise
+    
+    def close(self):
+        """Write buffered usage, then close every pooled connection."""
+        self.flush()
+        close_connections(self._connections)
+        self._local = threading.local()
     
     def _init_db(self):
         with self._get_conn() as conn:
+            # journal_mode persists in the database file, so every later
+            # short-lived connection opens in WAL mode
+            conn.execute("PRAGMA journal_mode=WAL")
+            
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS cost_tracking (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -56,6 +129,12 @@ class CostGovernor:
                     abort_reason TEXT
                 )
             """)
+            # Same covering index Storage creates; the startup lifetime SUM
+            # scans it instead of the table
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_cost_tracking_timestamp_totals "
+                "ON cost_tracking(timestamp, usd_cost, tokens_sent, tokens_received)"
+            )
             conn.commit()
     
     def estimate_tokens(self, text: str) -> int:
@@ -72,11 +151,39 @@ class CostGovernor:
         return input_cost + output_cost
     
     def get_lifetime_cost(self) -> float:
-        with self._get_conn() as conn:
-            row = conn.execute("SELECT SUM(usd_cost) as total FROM cost_tracking").fetchone()
-            return row["total"] if row["total"] else 0.0
+        return self._lifetime_cost
     
     def check_limits_before_call(self, estimated_input_tokens: int, estimated_output_tokens: int):
+        """Check the limits and reserve the estimate for this thread's call.
+        
+        The estimate is added to the run and lifetime totals straight away,
+        so concurrent calls cannot each pass against the same remaining
+        budget. record_usage replaces the reservation with the actual usage;
+        release_reservation drops it if the call fails.
+        """
+        with self._lock:
+            # A thread makes one call at a time; anything still reserved
+            # belongs to a call that never recorded usage
+            self._release()
+            self._check_limits(estimated_input_tokens, estimated_output_tokens)
+    
+    def release_reservation(self):
+        """Drop this thread's reserved estimate after a failed call."""
+        with self._lock:
+            self._release()
+    
+    def _release(self):
+        reservation = getattr(self._reservations, 'current', None)
+        if reservation is None:
+            return
+        self._reservations.current = None
+        input_tokens, output_tokens, cost = reservation
+        self.run_tokens_sent -= input_tokens
+        self.run_tokens_received -= output_tokens
+        self.run_cost -= cost
+        self._lifetime_cost -= cost
+    
+    def _check_limits(self, estimated_input_tokens: int, estimated_output_tokens: int):
         if self.aborted:
             raise CostLimitExceeded(self.abort_reason)
         
@@ -94,28 +201,73 @@ class CostGovernor:
             self._write_abort_record()
             raise CostLimitExceeded(self.abort_reason)
         
-        lifetime_cost = self.get_lifetime_cost()
+        lifetime_cost = self._lifetime_cost
+        if self._pending_usage and lifetime_cost + estimated_cost >= settings.max_usd_lifetime * LIFETIME_FLUSH_FRACTION:
+            self.flush()
         if lifetime_cost + estimated_cost > settings.max_usd_lifetime:
             self.abort_reason = f"MAX_USD_LIFETIME exceeded: {lifetime_cost + estimated_cost:.4f} > {settings.max_usd_lifetime}"
             self.aborted = True
             self._write_abort_record()
             raise CostLimitExceeded(self.abort_reason)
+        
+        self.run_tokens_sent += estimated_input_tokens
+        self.run_tokens_received += estimated_output_tokens
+        self.run_cost += estimated_cost
+        self._lifetime_cost += estimated_cost
+        self._reservations.current = (estimated_input_tokens, estimated_output_tokens, estimated_cost)
     
     def record_usage(self, input_tokens: int, output_tokens: int):
         cost = self.estimate_cost(input_tokens, output_tokens)
+        row = (self.run_id, input_tokens, output_tokens, cost, int(time.time()), settings.openai_model)
         
-        self.run_tokens_sent += input_tokens
-        self.run_tokens_received += output_tokens
-        self.run_cost += cost
+        with self._lock:
+            self._release()
+            self.run_tokens_sent += input_tokens
+            self.run_tokens_received += output_tokens
+            self.run_cost += cost
+            self._lifetime_cost += cost
+            self._pending_usage.append(row)
+            due = (
+                len(self._pending_usage) >= USAGE_FLUSH_ROWS
+                or time.monotonic() - self._last_flush >= USAGE_FLUSH_SECONDS
+            )
         
-        with self._get_conn() as conn:
-            conn.execute("""
-                INSERT INTO cost_tracking (run_id, tokens_sent, tokens_received, usd_cost, timestamp, model)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (self.run_id, input_tokens, output_tokens, cost, int(time.time()), settings.openai_model))
-            conn.commit()
+        if due:
+            self.flush()
+    
+    def flush(self):
+        """Write buffered usage rows to cost_tracking in one transaction.
+        
+        Limits are enforced from the in-memory totals, but other readers
+        (the dashboard, a restarted or concurrent governor) only see rows
+        once flushed, and rows still pending are lost if the process is
+        killed. Called automatically by record_usage, by limit checks once
+        lifetime spend nears MAX_USD_LIFETIME, before an abort record, at
+        the end of a run, and when the governor is collected or the
+        interpreter exits.
+        """
+        with self._lock:
+            rows = self._pending_usage[:]
+            self._pending_usage.clear()
+            self._last_flush = time.monotonic()
+        
+        if rows:
+            with self._get_conn() as conn:
+                conn.executemany(_INSERT_USAGE, rows)
+                conn.commit()
+    
+    def record_cached_tokens(self, cached_tokens: int):
+        """Add prompt tokens reported as cache hits to the run total.
+        
+        Args:
+            cached_tokens: usage.prompt_tokens_details.cached_tokens from a response
+        """
+        with self._lock:
+            self.run_cached_tokens += cached_tokens
     
     def _write_abort_record(self):
+        # Persist the spend that led here before the abort marker
+        self.flush()
         with self._get_conn() as conn:
             conn.execute("""
                 INSERT INTO cost_tracking (run_id, tokens_sent, tokens_received, usd_cost, timestamp, model, abort_reason)
@@ -125,21 +277,22 @@ class CostGovernor:
         
         os.makedirs(settings.artifacts_path, exist_ok=True)
         abort_file = f"{settings.artifacts_path}/abort_{self.run_id}.json"
-        with open(abort_file, 'w') as f:
-            json.dump({
+        with open(abort_file, 'wb') as f:
+            f.write(orjson.dumps({
                 "run_id": self.run_id,
                 "abort_reason": self.abort_reason,
                 "run_tokens_sent": self.run_tokens_sent,
                 "run_tokens_received": self.run_tokens_received,
                 "run_cost": self.run_cost,
                 "timestamp": int(time.time())
-            }, f, indent=2)
+            }, option=orjson.OPT_INDENT_2))
     
     def get_run_stats(self) -> dict:
         return {
             "run_id": self.run_id,
             "tokens_sent": self.run_tokens_sent,
             "tokens_received": self.run_tokens_received,
+            "cached_tokens": self.run_cached_tokens,
             "cost_usd": self.run_cost,
             "aborted": self.aborted,
             "abort_reason": self.abort_reason
@@ -0,0 +1,9 @@
+"""Shared helpers for the services' pooled SQLite connections."""
+import sqlite3
+from typing import List
+
+
+def close_connections(connections: List[sqlite3.Connection]):
+    """Close pooled connections; safe to call more than once."""
+    while connections:
+        connections.pop().close()
@@ -1,6 +1,7 @@
 """Structured error logging to artifacts."""
-import json
+import orjson
 import os
+import re
 import time
 import traceback
 from typing import Tuple
@@ -28,6 +29,13 @@ class ErrorHandler:
         'FileNotFoundError',
     )
     
+    # Exact type names hit the sets; the patterns keep the old substring
+    # match for subclasses such as APITimeoutError.
+    _TRANSIENT_SET = frozenset(TRANSIENT_ERRORS)
+    _FATAL_SET = frozenset(FATAL_ERRORS)
+    _TRANSIENT_RE = re.compile('|'.join(map(re.escape, TRANSIENT_ERRORS)))
+    _FATAL_RE = re.compile('|'.join(map(re.escape, FATAL_ERRORS)))
+    
     def __init__(self):
         """Initialize error handler."""
         self.error_dir = os.path.join(settings.artifacts_path, 'errors')
@@ -75,15 +83,17 @@ class ErrorHandler:
         """
         error_type = type(error).__name__
         
-        # Check transient errors
-        for transient in self.TRANSIENT_ERRORS:
-            if transient in error_type or transient in str(error):
-                return True, 'transient'
+        if error_type in self._TRANSIENT_SET:
+            return True, 'transient'
+        if error_type in self._FATAL_SET:
+            return False, 'fatal'
         
-        # Check fatal errors
-        for fatal in self.FATAL_ERRORS:
-            if fatal in error_type:
-                return False, 'fatal'
+        # Fall back to substring matches on the type name only; the message
+        # is not rendered, since exceptions can carry large payloads
+        if self._TRANSIENT_RE.search(error_type):
+            return True, 'transient'
+        if self._FATAL_RE.search(error_type):
+            return False, 'fatal'
         
         # Default to fatal
         return False, 'unknown'
@@ -105,8 +115,8 @@ class ErrorHandler:
         filename = f"error_{timestamp}.json"
         filepath = os.path.join(post_dir, filename)
         
-        with open(filepath, 'w') as f:
-            json.dump(error_data, f, indent=2, default=str)
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(error_data, default=str, option=orjson.OPT_INDENT_2))
         
         # Restrict permissions
         os.chmod(filepath, 0o600)
@@ -1,5 +1,6 @@
 import requests
 from config import settings
+from services.http_session import get_http_session
 from services.retry_handler import RetryHandler
 
 
@@ -9,6 +10,7 @@ class GumroadClient:
         self.base_url = "https://api.gumroad.com/v2"
         self.retry_handler = RetryHandler()
         self.dry_run = settings.dry_run
+        self.session = get_http_session()
     
     def create_product(self, name: str, description: str, price_cents: int, custom_permalink: str = None):
         if not isinstance(price_cents, int) or price_cents <= 0:
@@ -36,7 +38,7 @@ class GumroadClient:
             data["custom_permalink"] = custom_permalink
         
         def make_api_call():
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/products",
                 data=data,
                 timeout=30
@@ -72,7 +74,7 @@ class GumroadClient:
             return []
         
         def make_api_call():
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/products",
                 params={"access_token": self.access_token},
                 timeout=30
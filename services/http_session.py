@@ -0,0 +1,24 @@
+"""Shared HTTP session for outbound API calls."""
+from functools import lru_cache
+import requests
+from requests.adapters import HTTPAdapter
+
+# Enough keep-alive sockets per host for the concurrent post workers and
+# ingest agents to reuse connections instead of re-handshaking TLS
+HTTP_POOL_MAXSIZE = 50
+
+
+@lru_cache(maxsize=1)
+def get_http_session() -> requests.Session:
+    """Return the process-wide pooled session.
+    
+    Returns:
+        requests.Session with a keep-alive connection pool mounted for
+        http and https
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=HTTP_POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
@@ -0,0 +1,83 @@
+"""Exact-match cache for deterministic LLM responses."""
+import hashlib
+import json
+import sqlite3
+import time
+from typing import List, Dict, Optional
+from contextlib import contextmanager
+from config import settings
+
+
+class LLMCache:
+    """Store LLM responses keyed by a hash of the full request.
+    
+    Only deterministic requests (temperature 0) should be cached; the
+    caller is responsible for that check.
+    """
+    
+    def __init__(self, db_path: Optional[str] = None):
+        """Initialize LLM cache.
+        
+        Args:
+            db_path: SQLite database path (defaults to settings.database_path)
+        """
+        self.db_path = db_path or settings.database_path
+        self._init_cache_table()
+    
+    @contextmanager
+    def _get_conn(self):
+        """Get database connection."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            yield conn
+        finally:
+            conn.close()
+    
+    def _init_cache_table(self):
+        """Create llm_cache table if it doesn't exist."""
+        with self._get_conn() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    created_at INTEGER NOT NULL
+                )
+            """)
+            conn.commit()
+    
+    @staticmethod
+    def make_key(model: str, messages: List[Dict], **params) -> str:
+        """Build a cache key from everything that affects the response.
+        
+        Args:
+            model: Model name
+            messages: Chat messages sent to the model
+            **params: Other request parameters (max_tokens, response_format, ...)
+        
+        Returns:
+            Hex SHA-256 digest of the canonical request
+        """
+        payload = json.dumps(
+            {"model": model, "messages": messages, "params": params},
+            sort_keys=True,
+            separators=(',', ':')
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None on a miss."""
+        with self._get_conn() as conn:
+            row = conn.execute(
+                "SELECT response FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+    
+    def set(self, key: str, model: str, response: str):
+        """Store a response under key, replacing any previous entry."""
+        with self._get_conn() as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO llm_cache (key, model, response, created_at)
+                VALUES (?, ?, ?, ?)
+            """, (key, model, response, int(time.time())))
+            conn.commit()
@@ -1,18 +1,48 @@
-import json
+import orjson
+from typing import Callable, Optional
 from openai import OpenAI
 from config import settings
 from services.cost_governor import CostGovernor
+from services.llm_cache import LLMCache
+from services.rate_limiter import RateLimiter
 from services.retry_handler import RetryHandler
 
 
 class LLMClient:
-    def __init__(self, cost_governor: CostGovernor):
+    def __init__(self, cost_governor: CostGovernor, cache: Optional[LLMCache] = None):
         self.client = OpenAI(api_key=settings.openai_api_key)
         self.model = settings.openai_model
         self.cost_governor = cost_governor
         self.retry_handler = RetryHandler()
+        self.cache = cache
+        self.rate_limiter = RateLimiter(settings.openai_requests_per_minute)
     
-    def call_structured(self, system_prompt: str, user_content: str, max_tokens: int = 2000) -> dict:
+    def _cache_key(self, messages: list, temperature: float, **params) -> Optional[str]:
+        # Only deterministic calls are safe to replay from the cache
+        if self.cache is None or temperature != 0:
+            return None
+        return LLMCache.make_key(self.model, messages, **params)
+    
+    def _record_usage(self, usage):
+        self.cost_governor.record_usage(usage.prompt_tokens, usage.completion_tokens)
+        # Reported when the provider reuses a cached prompt prefix
+        details = getattr(usage, 'prompt_tokens_details', None)
+        cached_tokens = getattr(details, 'cached_tokens', None)
+        if isinstance(cached_tokens, int) and cached_tokens > 0:
+            self.cost_governor.record_cached_tokens(cached_tokens)
+    
+    def call_structured(self, system_prompt: str, user_content: str, max_tokens: int = 2000,
+                        temperature: float = 0.7) -> dict:
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_content}
+        ]
+        cache_key = self._cache_key(messages, temperature, max_tokens=max_tokens, response_format="json_object")
+        if cache_key:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return orjson.loads(cached)
+        
         combined_input = system_prompt + user_content
         estimated_input_tokens = self.cost_governor.estimate_tokens(combined_input)
         estimated_output_tokens = max_tokens
@@ -20,27 +50,43 @@ class LLMClient:
         self.cost_governor.check_limits_before_call(estimated_input_tokens, estimated_output_tokens)
         
         def make_api_call():
+            self.rate_limiter.acquire()
             return self.client.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_content}
-                ],
-                temperature=0.7,
+                messages=messages,
+                temperature=temperature,
                 max_tokens=max_tokens,
                 response_format={"type": "json_object"}
             )
         
-        response = self.retry_handler.with_retry(make_api_call, api_type='openai')
+        try:
+            response = self.retry_handler.with_retry(make_api_call, api_type='openai')
+        except Exception:
+            # The call failed; free the estimate reserved for it
+            self.cost_governor.release_reservation()
+            raise
         
-        actual_input_tokens = response.usage.prompt_tokens
-        actual_output_tokens = response.usage.completion_tokens
+        self._record_usage(response.usage)
         
-        self.cost_governor.record_usage(actual_input_tokens, actual_output_tokens)
+        content = response.choices[0].message.content
+        result = orjson.loads(content)
+        if cache_key:
+            self.cache.set(cache_key, self.model, content)
         
-        return json.loads(response.choices[0].message.content)
+        return result
     
-    def call_text(self, system_prompt: str, user_content: str, max_tokens: int = 3000) -> str:
+    def call_text(self, system_prompt: str, user_content: str, max_tokens: int = 3000,
+                  temperature: float = 0.7) -> str:
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_content}
+        ]
+        cache_key = self._cache_key(messages, temperature, max_tokens=max_tokens)
+        if cache_key:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         combined_input = system_prompt + user_content
         estimated_input_tokens = self.cost_governor.estimate_tokens(combined_input)
         estimated_output_tokens = max_tokens
@@ -48,21 +94,100 @@ class LLMClient:
         self.cost_governor.check_limits_before_call(estimated_input_tokens, estimated_output_tokens)
         
         def make_api_call():
+            self.rate_limiter.acquire()
             return self.client.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_content}
-                ],
-                temperature=0.7,
+                messages=messages,
+                temperature=temperature,
                 max_tokens=max_tokens
             )
         
-        response = self.retry_handler.with_retry(make_api_call, api_type='openai')
+        try:
+            response = self.retry_handler.with_retry(make_api_call, api_type='openai')
+        except Exception:
+            # The call failed; free the estimate reserved for it
+            self.cost_governor.release_reservation()
+            raise
+        
+        self._record_usage(response.usage)
+        
+        content = response.choices[0].message.content
+        if cache_key:
+            self.cache.set(cache_key, self.model, content)
+        
+        return content
+    
+    def call_structured_streaming(self, system_prompt: str, user_content: str,
+                                  early_result: Callable[[str], Optional[dict]],
+                                  max_tokens: int = 2000, temperature: float = 0.7) -> dict:
+        """Stream a JSON completion, stopping as soon as the answer is known.
+        
+        early_result is called with the text received so far after every
+        chunk; when it returns a dict the stream is closed, no further output
+        tokens are generated, and that dict is the result.
+        """
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_content}
+        ]
+        cache_key = self._cache_key(messages, temperature, max_tokens=max_tokens, response_format="json_object")
+        if cache_key:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return orjson.loads(cached)
+        
+        combined_input = system_prompt + user_content
+        estimated_input_tokens = self.cost_governor.estimate_tokens(combined_input)
+        estimated_output_tokens = max_tokens
+        
+        self.cost_governor.check_limits_before_call(estimated_input_tokens, estimated_output_tokens)
+        
+        def make_api_call():
+            self.rate_limiter.acquire()
+            stream = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                response_format={"type": "json_object"},
+                stream=True,
+                # Passed through extra_body so older SDK pins accept it
+                extra_body={"stream_options": {"include_usage": True}}
+            )
+            parts = []
+            usage = None
+            try:
+                for chunk in stream:
+                    if chunk.usage is not None:
+                        usage = chunk.usage
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if not delta:
+                        continue
+                    parts.append(delta)
+                    early = early_result("".join(parts))
+                    if early is not None:
+                        return "".join(parts), early, None
+            finally:
+                stream.close()
+            return "".join(parts), None, usage
+        
+        try:
+            text, early, usage = self.retry_handler.with_retry(make_api_call, api_type='openai')
+        except Exception:
+            # The call failed; free the estimate reserved for it
+            self.cost_governor.release_reservation()
+            raise
         
-        actual_input_tokens = response.usage.prompt_tokens
-        actual_output_tokens = response.usage.completion_tokens
+        if usage is not None:
+            self._record_usage(usage)
+        else:
+            # Usage is only reported at the end of a completed stream
+            self.cost_governor.record_usage(estimated_input_tokens, self.cost_governor.estimate_tokens(text))
         
-        self.cost_governor.record_usage(actual_input_tokens, actual_output_tokens)
+        result = early if early is not None else orjson.loads(text)
+        if cache_key:
+            self.cache.set(cache_key, self.model, text if early is None else orjson.dumps(early).decode('utf-8'))
         
-        return response.choices[0].message.content
+        return result
@@ -0,0 +1,41 @@
+"""Non-blocking logging shared by the pipeline and the dashboard."""
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+from config import settings
+
+LOGGER_NAME = "pi_autopilot"
+
+_listener: Optional[QueueListener] = None
+
+
+def setup_logging() -> logging.Logger:
+    """Route the application logger through a queue to a background thread.
+    
+    Callers only enqueue records; formatting and the write to stderr happen
+    on the listener thread, so a slow terminal or journald never stalls the
+    pipeline or the event loop. Safe to call more than once.
+    
+    Returns:
+        The configured application logger
+    """
+    global _listener
+    logger = logging.getLogger(LOGGER_NAME)
+    if _listener is not None:
+        return logger
+    
+    log_queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    
+    _listener = QueueListener(log_queue, stream_handler)
+    _listener.start()
+    atexit.register(_listener.stop)
+    
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(settings.log_level.upper())
+    # Output is handled here; don't repeat it through the root logger
+    logger.propagate = False
+    return logger
@@ -0,0 +1,48 @@
+"""Request pacing for rate-limited APIs."""
+import threading
+import time
+from typing import Callable
+
+
+class RateLimiter:
+    """Space calls evenly so no more than max_per_minute start each minute.
+    
+    Thread-safe: concurrent workers each reserve the next free slot and
+    sleep until it arrives, so a burst of parallel posts is smoothed out
+    instead of tripping the provider's rate limit and backing off.
+    """
+    
+    def __init__(self, max_per_minute: int,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        """Initialize rate limiter.
+        
+        Args:
+            max_per_minute: Allowed calls per minute (0 or less disables pacing)
+            clock: Monotonic time source
+            sleep: Function used to wait for a slot
+        """
+        self.interval = 60.0 / max_per_minute if max_per_minute > 0 else 0.0
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+    
+    def acquire(self) -> float:
+        """Block until the caller may start a request.
+        
+        Returns:
+            Seconds spent waiting
+        """
+        if not self.interval:
+            return 0.0
+        
+        with self._lock:
+            now = self._clock()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        
+        wait = slot - now
+        if wait > 0:
+            self._sleep(wait)
+        return wait
@@ -1,11 +1,67 @@
 """Sales feedback service for analyzing product performance and guiding future decisions."""
+import os
 import time
-from typing import Dict, List
+from datetime import date
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from services.storage import Storage
 from services.gumroad_client import GumroadClient
 from services.sanitizer import InputSanitizer
 from config import settings
 
+# Subdirectory of artifacts_path holding the daily feedback text
+FEEDBACK_CACHE_DIR = "_cache"
+
+# Prompt feedback layout; the optional lines are rendered separately and
+# spliced in, and a missing key renders as an empty string
+FEEDBACK_TMPL = (
+    "Recent Performance (last {days} days):\n"
+    "- Products published: {products_published}\n"
+    "- Products sold: {products_sold}\n"
+    "{without_data_line}"
+    "{zero_sale_line}"
+    "- Total revenue: ${total_revenue:.2f}\n"
+    "- Average price: ${avg_price:.2f}\n"
+    "- Refund rate: {refund_rate:.1%}\n"
+    "\n"
+    "Top-performing categories: {top_categories}\n"
+    "Zero-sale categories: {zero_sale_categories}"
+)
+WITHOUT_DATA_TMPL = "- Products without sales data yet: {0}\n"
+ZERO_SALE_TMPL = "- Products with tracked zero sales: {0}\n"
+
+
+class _BlankMissing(dict):
+    """format_map namespace that renders unknown keys as empty strings."""
+    
+    def __missing__(self, key):
+        return ""
+
+
+@lru_cache(maxsize=32)
+def _render_feedback(
+    lookback_days: int,
+    summary_items: Tuple,
+    top_categories: Tuple[str, ...],
+    zero_sale_categories: Tuple[str, ...]
+) -> str:
+    """Render FEEDBACK_TMPL; memoized on the hashable snapshot contents."""
+    summary = dict(summary_items)
+    without_data = summary.get('products_without_data', 0)
+    zero_sale = summary['zero_sale_products']
+    return FEEDBACK_TMPL.format_map(_BlankMissing(
+        days=lookback_days,
+        products_published=summary['products_published'],
+        products_sold=summary['products_sold'],
+        without_data_line=WITHOUT_DATA_TMPL.format(without_data) if without_data > 0 else "",
+        zero_sale_line=ZERO_SALE_TMPL.format(zero_sale) if zero_sale > 0 else "",
+        total_revenue=summary['total_revenue_cents'] / 100,
+        avg_price=summary['avg_price_cents'] / 100,
+        refund_rate=summary['refund_rate'],
+        top_categories=', '.join(top_categories) if top_categories else 'None yet',
+        zero_sale_categories=', '.join(zero_sale_categories) if zero_sale_categories else 'None',
+    ))
+
 
 class SalesFeedback:
     """Analyze sales data and generate feedback for product selection."""
@@ -21,16 +77,21 @@ class SalesFeedback:
         self.gumroad_client = gumroad_client or GumroadClient()
         self.sanitizer = InputSanitizer()
     
-    def ingest_sales_data(self) -> Dict:
+    def ingest_sales_data(self, sales_data: Optional[List[Dict]] = None) -> Dict:
         """Fetch sales data from Gumroad and persist to database.
         
+        Args:
+            sales_data: Result of GumroadClient.fetch_sales_data if the caller
+                already fetched it (fetched here when None)
+        
         Returns:
             Dictionary with ingestion results:
             - success: Whether ingestion succeeded
             - products_ingested: Number of products processed
             - timestamp: When data was fetched
         """
-        sales_data = self.gumroad_client.fetch_sales_data()
+        if sales_data is None:
+            sales_data = self.gumroad_client.fetch_sales_data()
         
         if not sales_data:
             return {
@@ -84,6 +145,11 @@ class SalesFeedback:
         # Get uploaded products from the period
         uploaded_products = self.storage.get_recent_uploaded_products(limit=1000)
         
+        return self._summarize(sales_metrics, uploaded_products, lookback_days)
+    
+    @staticmethod
+    def _summarize(sales_metrics: List[Dict], uploaded_products: List[Dict], lookback_days: int) -> Dict:
+        """Compute the feedback summary from already-fetched rows."""
         # Filter uploaded products to the lookback period
         cutoff_timestamp = int(time.time() - (lookback_days * 86400))
         recent_uploads = [p for p in uploaded_products if p['created_at'] >= cutoff_timestamp]
@@ -144,7 +210,10 @@ class SalesFeedback:
             lookback_days = settings.sales_lookback_days
         
         sales_metrics = self.storage.get_sales_metrics_since(lookback_days)
-        
+        return self._top_categories(sales_metrics, limit)
+    
+    def _top_categories(self, sales_metrics: List[Dict], limit: int) -> List[str]:
+        """Pick the best-selling product names from already-fetched rows."""
         # Sort by sales count and take top performers
         sorted_products = sorted(sales_metrics, key=lambda x: x["sales_count"], reverse=True)
         top_products = sorted_products[:limit]
@@ -166,13 +235,103 @@ class SalesFeedback:
             lookback_days = settings.sales_lookback_days
         
         sales_metrics = self.storage.get_sales_metrics_since(lookback_days)
-        
+        return self._zero_sale_categories(sales_metrics, limit)
+    
+    def _zero_sale_categories(self, sales_metrics: List[Dict], limit: int) -> List[str]:
+        """Pick zero-sale product names from already-fetched rows."""
         # Get products with zero sales
         zero_sale_products = [p for p in sales_metrics if p["sales_count"] == 0]
         
         # Sanitize product names for LLM prompt inclusion
         return [self.sanitizer.sanitize_for_llm(p["product_name"]) for p in zero_sale_products[:limit]]
     
+    def get_feedback_snapshot(self, lookback_days: int = None, limit: int = 5) -> Dict:
+        """Get summary, top and zero-sale categories from a single read.
+        
+        Equivalent to calling generate_feedback_summary,
+        get_top_performing_categories and get_zero_sale_categories, but
+        the sales metrics are queried once and shared.
+        
+        Args:
+            lookback_days: Number of days to look back
+            limit: Maximum number of categories per list
+        
+        Returns:
+            Dictionary with 'summary', 'top_categories' and
+            'zero_sale_categories'
+        """
+        if lookback_days is None:
+            lookback_days = settings.sales_lookback_days
+        
+        sales_metrics = self.storage.get_sales_metrics_since(lookback_days)
+        uploaded_products = self.storage.get_recent_uploaded_products(limit=1000)
+        
+        return {
+            "summary": self._summarize(sales_metrics, uploaded_products, lookback_days),
+            "top_categories": self._top_categories(sales_metrics, limit),
+            "zero_sale_categories": self._zero_sale_categories(sales_metrics, limit)
+        }
+    
+    @staticmethod
+    def format_feedback_text(snapshot: Dict, lookback_days: int) -> str:
+        """Render a feedback snapshot as text for agent prompts.
+        
+        Args:
+            snapshot: Result of get_feedback_snapshot
+            lookback_days: Period the snapshot covers
+        
+        Returns:
+            Multi-line performance summary
+        """
+        return _render_feedback(
+            lookback_days,
+            tuple(sorted(snapshot["summary"].items())),
+            tuple(snapshot["top_categories"]),
+            tuple(snapshot["zero_sale_categories"])
+        )
+    
+    def get_feedback_text(self, lookback_days: int = None) -> str:
+        """Get the prompt feedback text, computed at most once per day.
+        
+        The text is cached under artifacts/_cache keyed by date and
+        lookback period, so every run that day (and every prompt built from
+        it) sees byte-identical feedback.
+        
+        Args:
+            lookback_days: Number of days to look back
+        
+        Returns:
+            Multi-line performance summary
+        """
+        if lookback_days is None:
+            lookback_days = settings.sales_lookback_days
+        
+        cache_dir = os.path.join(settings.artifacts_path, FEEDBACK_CACHE_DIR)
+        cache_name = f"feedback_{date.today().isoformat()}_{lookback_days}d.txt"
+        cache_path = os.path.join(cache_dir, cache_name)
+        
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
+            pass
+        
+        text = self.format_feedback_text(self.get_feedback_snapshot(lookback_days), lookback_days)
+        
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to a temp file and rename so readers never see a partial file
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, cache_path)
+        
+        # Drop earlier days' entries
+        for name in os.listdir(cache_dir):
+            if name.startswith("feedback_") and name != cache_name and not name.endswith(".tmp"):
+                os.remove(os.path.join(cache_dir, name))
+        
+        return text
+    
     def should_suppress_publishing(self) -> Dict:
         """Determine if publishing should be suppressed based on recent performance.
         
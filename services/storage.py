@@ -96,15 +96,22 @@ class Storage:
                 )
             """)
             
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_audit_post_id ON audit_log(post_id)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_audit_action ON audit_log(action)")
+            # Same composite indexes AuditLogger creates (see _init_audit_table)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_audit_post_id_timestamp ON audit_log(post_id, timestamp)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_audit_action_timestamp ON audit_log(action, timestamp DESC)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_audit_timestamp_desc ON audit_log(timestamp DESC)")
             
             # Add performance indexes for frequently queried columns
             conn.execute("CREATE INDEX IF NOT EXISTS idx_pipeline_runs_post_id ON pipeline_runs(post_id)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_pipeline_runs_status ON pipeline_runs(status)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_pipeline_runs_created_at ON pipeline_runs(created_at)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_cost_tracking_timestamp ON cost_tracking(timestamp)")
+            # Covers the dashboard's per-period totals and the lifetime SUM, so
+            # neither touches the table rows; supersedes the timestamp-only index
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_cost_tracking_timestamp_totals "
+                "ON cost_tracking(timestamp, usd_cost, tokens_sent, tokens_received)"
+            )
+            conn.execute("DROP INDEX IF EXISTS idx_cost_tracking_timestamp")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_reddit_posts_timestamp ON reddit_posts(timestamp)")
             
             conn.execute("""
@@ -126,35 +133,75 @@ class Storage:
             
             conn.commit()
     
+    @staticmethod
+    def _post_row(post_data: dict) -> tuple:
+        # Convert created_utc to timestamp for backward compatibility
+        timestamp = int(post_data.get("created_utc", post_data.get("timestamp", time.time())))
+        
+        # Extract subreddit from source or set default
+        subreddit = post_data.get("subreddit", post_data.get("source", "unknown"))
+        
+        return (
+            post_data["id"],
+            post_data["title"],
+            post_data.get("body", ""),
+            timestamp,
+            subreddit,
+            post_data.get("author", "unknown"),
+            post_data.get("score", 0),
+            post_data.get("url", ""),
+            json.dumps(post_data),
+            post_data.get("source", "unknown")
+        )
+    
     def save_post(self, post_data: dict):
         with self._get_conn() as conn:
             try:
-                # Convert created_utc to timestamp for backward compatibility
-                timestamp = int(post_data.get("created_utc", post_data.get("timestamp", time.time())))
-                
-                # Extract subreddit from source or set default
-                subreddit = post_data.get("subreddit", post_data.get("source", "unknown"))
-                
                 conn.execute("""
                     INSERT INTO reddit_posts (id, title, body, timestamp, subreddit, author, score, url, raw_json, source)
                     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    post_data["id"],
-                    post_data["title"],
-                    post_data.get("body", ""),
-                    timestamp,
-                    subreddit,
-                    post_data.get("author", "unknown"),
-                    post_data.get("score", 0),
-                    post_data.get("url", ""),
-                    json.dumps(post_data),
-                    post_data.get("source", "unknown")
-                ))
+                """, self._post_row(post_data))
                 conn.commit()
                 return True
             except sqlite3.IntegrityError:
                 return False
     
+    def save_posts_bulk(self, posts: list) -> list:
+        """Insert many posts in one transaction, skipping ones already stored.
+        
+        Args:
+            posts: Posts in the standardized ingest format
+        
+        Returns:
+            IDs of the posts that were newly inserted, in input order
+        """
+        # Keep the first occurrence of any ID repeated within the batch
+        unique = {}
+        for post in posts:
+            unique.setdefault(post["id"], post)
+        if not unique:
+            return []
+        
+        ids = list(unique)
+        with self._get_conn() as conn:
+            existing = set()
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT id FROM reddit_posts WHERE id IN ({placeholders})", chunk
+                ).fetchall()
+                existing.update(row["id"] for row in rows)
+            
+            new_ids = [post_id for post_id in ids if post_id not in existing]
+            conn.executemany("""
+                INSERT OR IGNORE INTO reddit_posts (id, title, body, timestamp, subreddit, author, score, url, raw_json, source)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, [self._post_row(unique[post_id]) for post_id in new_ids])
+            conn.commit()
+        
+        return new_ids
+    
     def get_post(self, post_id: str):
         with self._get_conn() as conn:
             row = conn.execute("SELECT * FROM reddit_posts WHERE id = ?", (post_id,)).fetchone()
@@ -185,6 +232,30 @@ class Storage:
             """, (post_id, stage, status, artifact_path, error_message))
             conn.commit()
     
+    def log_pipeline_runs_bulk(self, rows: list) -> int:
+        """Insert many pipeline_runs rows in one transaction.
+        
+        Args:
+            rows: (post_id, stage, status, artifact_path, error_message,
+                created_at) tuples
+        
+        Returns:
+            Number of rows written
+        """
+        if not rows:
+            return 0
+        with self._get_conn() as conn:
+            conn.executemany("""
+                INSERT INTO pipeline_runs (post_id, stage, status, artifact_path, error_message, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, rows)
+            conn.commit()
+        return len(rows)
+    
+    def pipeline_run_batch(self) -> 'PipelineRunBatch':
+        """Start a buffer of pipeline_runs rows written together on flush()."""
+        return PipelineRunBatch(self)
+    
     def get_pipeline_runs(self, post_id: str):
         with self._get_conn() as conn:
             rows = conn.execute("""
@@ -227,3 +298,32 @@ class Storage:
                 LIMIT ?
             """, (limit,)).fetchall()
             return [dict(row) for row in rows]
+
+
+class PipelineRunBatch:
+    """Buffer pipeline_runs rows in memory and write them in one transaction."""
+    
+    def __init__(self, storage: Storage):
+        """Initialize an empty batch.
+        
+        Args:
+            storage: Storage the buffered rows are flushed to
+        """
+        self.storage = storage
+        self.rows = []
+    
+    def log(self, post_id: str, stage: str, status: str, artifact_path: str = None, error_message: str = None):
+        """Queue a row; accepts the same arguments as Storage.log_pipeline_run.
+        
+        created_at is taken now, not at flush time, so stage timings survive.
+        """
+        self.rows.append((post_id, stage, status, artifact_path, error_message, int(time.time())))
+    
+    def flush(self) -> int:
+        """Write queued rows and clear the buffer.
+        
+        Returns:
+            Number of rows written
+        """
+        rows, self.rows = self.rows, []
+        return self.storage.log_pipeline_runs_bulk(rows)
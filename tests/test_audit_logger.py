@@ -2,6 +2,7 @@ import pytest
 import tempfile
 import sqlite3
 from pathlib import Path
+from unittest.mock import patch
 from services.audit_logger import AuditLogger
 
 
@@ -219,3 +220,68 @@ class TestAuditLogger:
         recorded_actions = [entry['action'] for entry in history]
         for action, _ in stages:
             assert action in recorded_actions
+
+
+class TestAuditLoggerBatch:
+    """Test suite for batched audit writes."""
+    
+    @pytest.fixture
+    def batch_logger(self, tmp_path, monkeypatch):
+        """Create an AuditLogger pointed at a temp DB via settings."""
+        import config
+        monkeypatch.setattr(config.settings, 'database_path', str(tmp_path / 'audit.db'))
+        return AuditLogger()
+    
+    def test_log_batch_writes_all_events(self, batch_logger):
+        """Test that log_batch stores every known event."""
+        written = batch_logger.log_batch([
+            {'action': 'post_ingested', 'post_id': 'p1', 'run_id': 1, 'details': {'source': 'rss'}},
+            {'action': 'post_ingested', 'post_id': 'p2', 'run_id': 1},
+            {'action': 'not_a_real_action', 'post_id': 'p3'},
+        ])
+        
+        assert written == 2
+        assert batch_logger.get_post_history('p1')[0]['details'] == {'source': 'rss'}
+        assert len(batch_logger.get_post_history('p2')) == 1
+        assert batch_logger.get_post_history('p3') == []
+    
+    def test_batch_defers_writes_until_flush(self, batch_logger):
+        """Test that AuditBatch only writes on flush."""
+        audit = batch_logger.batch()
+        audit.log('problem_extracted', post_id='p1', run_id=1, details={'urgency_score': 5})
+        audit.log('error_occurred', post_id='p1', run_id=1, error_occurred=True)
+        
+        assert batch_logger.get_post_history('p1') == []
+        assert audit.flush() == 2
+        assert len(batch_logger.get_post_history('p1')) == 2
+        assert audit.flush() == 0
+    
+    def test_batch_persists_flags(self, batch_logger):
+        """Test that flags passed to AuditBatch.log reach their columns."""
+        audit = batch_logger.batch()
+        audit.log('cost_limit_exceeded', post_id='p1', run_id=1, cost_limit_exceeded=True)
+        audit.flush()
+        
+        entry = batch_logger.get_post_history('p1')[0]
+        assert entry['cost_limit_exceeded'] == 1
+        assert entry['error_occurred'] == 0
+    
+    def test_batch_keeps_time_of_each_event(self, batch_logger):
+        """Test that buffered events keep the time they were logged, not flush time."""
+        audit = batch_logger.batch()
+        with patch('services.audit_logger.time.time', return_value=1000):
+            audit.log('problem_extracted', post_id='p1', run_id=1)
+        with patch('services.audit_logger.time.time', return_value=2000):
+            audit.log('spec_generated', post_id='p1', run_id=1)
+        with patch('services.audit_logger.time.time', return_value=3000):
+            audit.flush()
+        
+        history = batch_logger.get_post_history('p1')
+        assert [entry['timestamp'] for entry in history] == [1000, 2000]
+    
+    def test_database_uses_wal(self, batch_logger):
+        """Test that the audit database is switched to WAL mode."""
+        conn = sqlite3.connect(batch_logger.db_path)
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        conn.close()
+        assert mode == 'wal'
@@ -0,0 +1,279 @@
+"""Tests for config_manager module."""
+import re
+import threading
+import time
+import pytest
+from unittest.mock import Mock, patch
+from dotenv import dotenv_values
+from services.config_manager import ConfigManager, ConfigValidationError, _compile_pattern, _fast_parse_env, _mask
+
+
+@pytest.fixture
+def config_manager(tmp_path, monkeypatch):
+    """Create a ConfigManager over a temporary .env and backup directory."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr('services.config_manager.AuditLogger', Mock)
+    env_path = tmp_path / '.env'
+    env_path.write_text('REDDIT_CLIENT_ID=abcdefghijklmnop\nMAX_USD_PER_RUN=5.0\n')
+    return ConfigManager(str(env_path))
+
+
+@pytest.mark.unit
+class TestConfigManager:
+    """Test suite for ConfigManager class."""
+    
+    def test_rejects_value_with_trailing_newline(self, config_manager):
+        """Test that patterns must match the whole value."""
+        with pytest.raises(ConfigValidationError):
+            config_manager._validate_updates({'api_keys': {'OPENAI_API_KEY': 'sk-' + 'a' * 40 + '\n'}})
+    
+    def test_env_reparsed_only_when_file_changes(self, config_manager, monkeypatch):
+        """Test that .env is parsed once until it is modified."""
+        calls = []
+        def counting_parse(path):
+            calls.append(path)
+            return _fast_parse_env(path)
+        
+        monkeypatch.setattr('services.config_manager._fast_parse_env', counting_parse)
+        
+        config_manager.get_current_config()
+        config_manager.get_current_config()
+        assert len(calls) == 1
+        
+        success, _ = config_manager.update_config({'cost_limits': {'MAX_USD_PER_RUN': 7.5}})
+        assert success
+        config = config_manager.get_current_config()
+        assert config['cost_limits']['MAX_USD_PER_RUN']['value'] == 7.5
+        assert len(calls) == 2
+    
+    def test_apply_updates_rewrites_file_once(self, config_manager):
+        """Test that all updates land in one pass, keeping other lines."""
+        config_manager.env_path.write_text('# comment\nREDDIT_CLIENT_ID=abcdefghijklmnop\nKEEP=me')
+        
+        config_manager._apply_updates({
+            'api_keys': {'REDDIT_CLIENT_ID': "it's\\new"},
+            'pipeline': {'REDDIT_POST_LIMIT': 25},
+            'toggles': {'KILL_SWITCH': True}
+        })
+        
+        text = config_manager.env_path.read_text()
+        assert text.startswith('# comment\n')
+        assert 'KEEP=me\n' in text
+        values = dotenv_values(str(config_manager.env_path))
+        assert values['REDDIT_CLIENT_ID'] == "it's\\new"
+        assert values['REDDIT_POST_LIMIT'] == '25'
+        assert values['KILL_SWITCH'] == 'true'
+        assert values['KEEP'] == 'me'
+        assert config_manager.env_path.stat().st_mode & 0o777 == 0o600
+    
+    def test_update_rewrites_every_occurrence_of_a_key(self, config_manager):
+        """Test a key set twice in .env takes the new value at both lines."""
+        config_manager.env_path.write_text("MAX_USD_PER_RUN=5.0\nFOO=1\nMAX_USD_PER_RUN=7.0\n")
+        
+        success, _ = config_manager.update_config({'cost_limits': {'MAX_USD_PER_RUN': 9.0}})
+        
+        assert success
+        text = config_manager.env_path.read_text()
+        assert text.count("MAX_USD_PER_RUN='9.0'\n") == 2
+        assert 'FOO=1\n' in text
+        assert dotenv_values(str(config_manager.env_path))['MAX_USD_PER_RUN'] == '9.0'
+    
+    def test_concurrent_updates_are_serialized(self, config_manager, monkeypatch):
+        """Test that saves from several threads never rewrite .env at the same time."""
+        apply_updates = config_manager._apply_updates
+        active = []
+        overlaps = []
+        
+        def tracked_apply(updates):
+            active.append(1)
+            overlaps.append(len(active))
+            time.sleep(0.01)
+            apply_updates(updates)
+            active.pop()
+        
+        monkeypatch.setattr(config_manager, '_apply_updates', tracked_apply)
+        
+        results = []
+        threads = [
+            threading.Thread(target=lambda v=v: results.append(
+                config_manager.update_config({'cost_limits': {'MAX_USD_PER_RUN': v}})
+            ))
+            for v in (1.5, 2.5, 3.5, 4.5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert all(success for success, _ in results)
+        assert max(overlaps) == 1
+        assert dotenv_values(str(config_manager.env_path))['MAX_USD_PER_RUN'] in {'1.5', '2.5', '3.5', '4.5'}
+        assert not list(config_manager.env_path.parent.glob('.env.tmp.*'))
+    
+    def test_api_keys_tested_in_parallel(self, config_manager, monkeypatch):
+        """Test that several key tests overlap instead of running in turn."""
+        barrier = threading.Barrier(3, timeout=5)
+        
+        def fake_test(service, api_key):
+            # Only returns once all three tests are running at the same time
+            barrier.wait()
+            return True, f"{service} ok"
+        
+        monkeypatch.setattr(config_manager, 'test_api_key', fake_test)
+        
+        results = config_manager.test_api_keys({'OPENAI': 'a', 'REDDIT': 'b', 'GUMROAD': 'c'})
+        
+        assert results == {
+            'OPENAI': (True, 'OPENAI ok'),
+            'REDDIT': (True, 'REDDIT ok'),
+            'GUMROAD': (True, 'GUMROAD ok')
+        }
+    
+    def test_fast_env_parser_matches_dotenv(self, tmp_path):
+        """Test the fast .env parser agrees with python-dotenv or defers to it."""
+        env_path = tmp_path / 'simple.env'
+        env_path.write_text(
+            "# keys\nexport OPENAI_API_KEY='sk-abc'\nKILL_SWITCH=true # off\n"
+            "REDDIT_USER_AGENT='it\\'s an agent'\nEMPTY=\n"
+        )
+        assert _fast_parse_env(env_path) == dotenv_values(str(env_path))
+        
+        env_path.write_text("HOME_DIR=${HOME}/pi\n")
+        assert _fast_parse_env(env_path) is None
+    
+    def test_rotate_backups_keeps_newest(self, config_manager):
+        """Test that rotation keeps the newest backups and the listing follows."""
+        for day in range(1, 6):
+            (config_manager.backup_dir / f'env_backup_2026010{day}_120000.txt').write_text('A=1\n')
+        assert len(config_manager.list_backups()) == 5
+        
+        config_manager._rotate_backups(keep_count=2)
+        
+        names = [b['filename'] for b in config_manager.list_backups()]
+        assert names == ['env_backup_20260105_120000.txt', 'env_backup_20260104_120000.txt']
+    
+    def test_mask_value(self, config_manager):
+        """Test masking keeps the first 3 and last 4 characters only."""
+        assert config_manager._mask_value('sk-abcdefghijkl') == 'sk-...ijkl'
+        assert config_manager._mask_value('short') == '***'
+        assert config_manager._mask_value('') == '***'
+        # Raw secrets must not be retained in a memoization cache
+        assert not hasattr(_mask, 'cache_info')
+    
+    def test_secure_permissions_skip_chmod_when_already_600(self, config_manager, monkeypatch):
+        """Test chmod is only called when the mode is not already 0o600."""
+        import os
+        path = config_manager.env_path
+        assert (os.stat(path).st_mode & 0o777) == 0o600
+        
+        calls = []
+        real_chmod = os.chmod
+        monkeypatch.setattr(os, 'chmod', lambda p, m: (calls.append(p), real_chmod(p, m)))
+        config_manager._set_secure_permissions(path)
+        assert calls == []
+        
+        real_chmod(path, 0o644)
+        config_manager._set_secure_permissions(path)
+        assert len(calls) == 1
+        assert (os.stat(path).st_mode & 0o777) == 0o600
+    
+    def test_reddit_client_reused_per_credentials(self, config_manager, monkeypatch):
+        """Test the praw client is built once per credential set."""
+        config_manager.env_path.write_text("REDDIT_CLIENT_ID=abc\n")
+        
+        with patch('praw.Reddit') as reddit_cls:
+            assert config_manager._test_reddit_key('secret')[0] is True
+            assert config_manager._test_reddit_key('secret')[0] is True
+            assert reddit_cls.call_count == 1
+            
+            config_manager._test_reddit_key('other-secret')
+            assert reddit_cls.call_count == 2
+    
+    def test_reddit_client_cache_bounded_and_digest_keyed(self, config_manager, monkeypatch):
+        """Test cached praw clients are capped and never keyed by raw secrets."""
+        monkeypatch.setattr('services.config_manager.REDDIT_CLIENT_CACHE_SIZE', 2)
+        config_manager.env_path.write_text("REDDIT_CLIENT_ID=abc\n")
+        
+        with patch('praw.Reddit'):
+            for secret in ('secret-1', 'secret-2', 'secret-3'):
+                config_manager._test_reddit_key(secret)
+        
+        assert len(config_manager._reddit_clients) == 2
+        assert not any('secret' in key for key in config_manager._reddit_clients)
+    
+    def test_current_config_snapshot_reused_until_env_changes(self, config_manager):
+        """Test the rendered config is reused and callers get independent copies."""
+        first = config_manager.get_current_config()
+        first['cost_limits']['MAX_USD_PER_RUN']['value'] = 'mutated'
+        
+        with patch.object(config_manager, '_load_env', side_effect=AssertionError):
+            second = config_manager.get_current_config()
+        assert second['cost_limits']['MAX_USD_PER_RUN']['value'] != 'mutated'
+        
+        success, _ = config_manager.update_config({'cost_limits': {'MAX_USD_PER_RUN': 3.5}})
+        assert success
+        assert config_manager.get_current_config()['cost_limits']['MAX_USD_PER_RUN']['value'] == 3.5
+    
+    def test_config_updated_audit_details_include_timestamp(self, config_manager):
+        """Test the config_updated audit entry keeps its timestamp field."""
+        success, _ = config_manager.update_config({'cost_limits': {'MAX_USD_PER_RUN': 3.5}})
+        assert success
+        
+        updated = [
+            call.kwargs for call in config_manager.audit_logger.log.call_args_list
+            if call.kwargs.get('action') == 'config_updated'
+        ]
+        assert 'timestamp' in updated[-1]['details']
+    
+    def test_mask_updates_masks_only_secret_keys(self, config_manager):
+        """Test api key values are masked without touching the input."""
+        updates = {
+            'api_keys': {'OPENAI_API_KEY': 'sk-abcdefghijkl'},
+            'cost_limits': {'MAX_USD_PER_RUN': 5.0}
+        }
+        masked = config_manager._mask_updates(updates)
+        assert masked['api_keys']['OPENAI_API_KEY'] == 'sk-...ijkl'
+        assert masked['cost_limits'] == {'MAX_USD_PER_RUN': 5.0}
+        assert updates['api_keys']['OPENAI_API_KEY'] == 'sk-abcdefghijkl'
+    
+    def test_length_pattern_matches_regex(self):
+        """Test the ^.{N,M}$ stand-in agrees with re.fullmatch."""
+        for pattern in [r'^.{5,}$', r'^.{2,6}$', r'^.{5}$']:
+            fast = _compile_pattern(pattern)
+            assert not isinstance(fast, re.Pattern)
+            for value in ['', 'a', 'abcd', 'abcde', 'abc\nde', 'abcdef\n', 'abcdefg', 'Pi-Autopilot/2.0']:
+                assert bool(fast.fullmatch(value)) == bool(re.fullmatch(pattern, value)), (pattern, value)
+        
+        assert isinstance(_compile_pattern(r'^sk-[a-zA-Z0-9]{32,}$'), re.Pattern)
+    
+    def test_repeat_key_test_is_debounced(self, config_manager, monkeypatch):
+        """Test a key retested within the debounce window reuses the result."""
+        clock = [100.0]
+        monkeypatch.setattr('services.config_manager.time.monotonic', lambda: clock[0])
+        openai_test = Mock(return_value=(True, 'ok'))
+        monkeypatch.setattr(config_manager, '_test_openai_key', openai_test)
+        
+        assert config_manager.test_api_key('openai', 'sk-key') == (True, 'ok')
+        assert config_manager.test_api_key('OPENAI', 'sk-key') == (True, 'ok')
+        assert openai_test.call_count == 1
+        
+        config_manager.test_api_key('OPENAI', 'sk-other')
+        assert openai_test.call_count == 2
+        
+        clock[0] += 5
+        config_manager.test_api_key('OPENAI', 'sk-key')
+        assert openai_test.call_count == 3
+    
+    def test_copy_secure_copies_bytes_and_forces_600(self, config_manager, tmp_path):
+        """Test _copy_secure copies exactly and tightens an existing dst's mode."""
+        import os
+        src = tmp_path / 'src.env'
+        src.write_bytes(b"KEY='caf\xc3\xa9'\n" * 5000)
+        dst = tmp_path / 'dst.env'
+        dst.write_bytes(b'old contents that are longer than nothing')
+        os.chmod(dst, 0o644)
+        
+        config_manager._copy_secure(src, dst)
+        
+        assert dst.read_bytes() == src.read_bytes()
+        assert (os.stat(dst).st_mode & 0o777) == 0o600
@@ -2,6 +2,7 @@
 import pytest
 import sqlite3
 import os
+import threading
 import tempfile
 from unittest.mock import patch, MagicMock
 from services.cost_governor import CostGovernor, CostLimitExceeded
@@ -32,12 +33,13 @@ def cost_governor(temp_db, monkeypatch):
     
     governor = CostGovernor()
     yield governor
+    governor.close()
 
 
 @pytest.mark.unit
 class TestCostGovernor:
     """Test suite for CostGovernor class."""
-
+    
     def test_token_estimation(self, cost_governor):
         """Test token estimation accuracy."""
         text = "This is a test string for token estimation."
@@ -45,7 +47,7 @@ class TestCostGovernor:
         # Should return a positive integer
         assert tokens > 0
         assert isinstance(tokens, int)
-
+    
     def test_cost_estimation(self, cost_governor):
         """Test cost calculation."""
         input_tokens = 1000
@@ -55,7 +57,7 @@ class TestCostGovernor:
         # Expected: 1000 * 0.00003 + 500 * 0.00006 = 0.03 + 0.03 = 0.06
         expected_cost = 0.06
         assert abs(cost - expected_cost) < 0.0001
-
+    
     def test_record_usage(self, cost_governor):
         """Test that usage recording updates run totals and database."""
         cost_governor.record_usage(1000, 500)
@@ -67,7 +69,7 @@ class TestCostGovernor:
         # Verify database record
         lifetime_cost = cost_governor.get_lifetime_cost()
         assert lifetime_cost > 0
-
+    
     def test_per_run_token_limit(self, cost_governor):
         """Test that per-run token limit is enforced."""
         # Try to exceed max_tokens_per_run (10000)
@@ -76,7 +78,7 @@ class TestCostGovernor:
         
         assert "MAX_TOKENS_PER_RUN exceeded" in str(exc_info.value)
         assert cost_governor.aborted is True
-
+    
     def test_per_run_usd_limit(self, cost_governor):
         """Test that per-run USD limit is enforced."""
         # Set cost to near limit
@@ -89,7 +91,7 @@ class TestCostGovernor:
         
         assert "MAX_USD_PER_RUN exceeded" in str(exc_info.value)
         assert cost_governor.aborted is True
-
+    
     def test_lifetime_usd_limit(self, cost_governor):
         """Test that lifetime USD limit is enforced."""
         # Add historical cost to database
@@ -100,7 +102,7 @@ class TestCostGovernor:
             cost_governor.check_limits_before_call(10000, 10000)  # Would add ~0.9 USD
         
         assert "MAX_USD_LIFETIME exceeded" in str(exc_info.value)
-
+    
     def test_abort_persists_across_calls(self, cost_governor):
         """Test that abort state persists."""
         # Trigger abort
@@ -112,7 +114,7 @@ class TestCostGovernor:
         # Subsequent call should also raise
         with pytest.raises(CostLimitExceeded):
             cost_governor.check_limits_before_call(100, 100)
-
+    
     def test_get_run_stats(self, cost_governor):
         """Test run statistics retrieval."""
         cost_governor.record_usage(1000, 500)
@@ -123,7 +125,7 @@ class TestCostGovernor:
         assert stats['tokens_received'] == 500
         assert stats['cost_usd'] > 0
         assert stats['aborted'] is False
-
+    
     def test_abort_creates_file(self, cost_governor):
         """Test that abort creates artifact file."""
         try:
@@ -135,7 +137,7 @@ class TestCostGovernor:
         abort_file = f"{tempfile.gettempdir()}/abort_{cost_governor.run_id}.json"
         assert os.path.exists(abort_file)
         os.unlink(abort_file)
-
+    
     def test_multiple_recordings(self, cost_governor):
         """Test multiple usage recordings accumulate correctly."""
         cost_governor.record_usage(1000, 500)
@@ -149,7 +151,14 @@ class TestCostGovernor:
         lifetime_cost = cost_governor.get_lifetime_cost()
         expected_cost = cost_governor.estimate_cost(2250, 1125)
         assert abs(lifetime_cost - expected_cost) < 0.0001
-
+    
+    def test_cached_tokens_in_run_stats(self, cost_governor):
+        """Test that cached prompt tokens accumulate into run stats."""
+        cost_governor.record_cached_tokens(1024)
+        cost_governor.record_cached_tokens(512)
+        
+        assert cost_governor.get_run_stats()["cached_tokens"] == 1536
+    
     def test_successful_call_within_limits(self, cost_governor):
         """Test that calls within limits succeed."""
         # Should not raise
@@ -159,3 +168,113 @@ class TestCostGovernor:
         # Should still be operational
         assert cost_governor.aborted is False
         cost_governor.check_limits_before_call(100, 100)
+    
+    def test_database_uses_wal(self, cost_governor):
+        """Test the cost database is switched to WAL journaling."""
+        with cost_governor._get_conn() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+    
+    def test_connection_reused_within_thread(self, cost_governor):
+        """Test calls on one thread share a single pooled connection."""
+        with cost_governor._get_conn() as first:
+            pass
+        cost_governor.record_usage(100, 50)
+        with cost_governor._get_conn() as second:
+            assert second is first
+        assert len(cost_governor._connections) == 1
+    
+    def test_lifetime_cost_loaded_once_and_kept_current(self, cost_governor):
+        """Test lifetime cost is summed at startup and updated in memory."""
+        cost_governor.record_usage(1000, 500)
+        expected = cost_governor.estimate_cost(1000, 500)
+        assert abs(cost_governor.get_lifetime_cost() - expected) < 1e-9
+        
+        # Buffered rows are not visible to another governor until flushed
+        unflushed = CostGovernor()
+        assert unflushed.get_lifetime_cost() == 0.0
+        unflushed.close()
+        
+        # A new governor picks up the persisted history
+        cost_governor.flush()
+        restarted = CostGovernor()
+        assert abs(restarted.get_lifetime_cost() - expected) < 1e-9
+        restarted.close()
+    
+    def test_usage_rows_written_in_batches(self, cost_governor):
+        """Test usage rows are buffered and written together on flush."""
+        def row_count():
+            conn = sqlite3.connect(cost_governor.db_path)
+            try:
+                return conn.execute("SELECT COUNT(*) FROM cost_tracking").fetchone()[0]
+            finally:
+                conn.close()
+        
+        cost_governor.record_usage(100, 50)
+        cost_governor.record_usage(100, 50)
+        assert row_count() == 0
+        
+        cost_governor.flush()
+        assert row_count() == 2
+    
+    def test_limit_check_flushes_near_lifetime_cap(self, cost_governor, monkeypatch):
+        """Test buffered usage is written once lifetime spend nears the cap."""
+        import config
+        
+        def row_count():
+            conn = sqlite3.connect(cost_governor.db_path)
+            try:
+                return conn.execute("SELECT COUNT(*) FROM cost_tracking").fetchone()[0]
+            finally:
+                conn.close()
+        
+        cost_governor.record_usage(1000, 500)
+        cost_governor.check_limits_before_call(10, 10)
+        assert row_count() == 0
+        
+        # 0.06 spent against a 0.065 cap is past the flush threshold
+        monkeypatch.setattr(config.settings, 'max_usd_lifetime', 0.065)
+        cost_governor.check_limits_before_call(10, 10)
+        assert row_count() == 1
+    
+    def test_reservation_replaced_by_actual_usage(self, cost_governor):
+        """Test a checked call's estimate counts until its usage is recorded."""
+        cost_governor.check_limits_before_call(1000, 1000)
+        assert cost_governor.get_run_stats()['tokens_sent'] == 1000
+        
+        cost_governor.record_usage(800, 200)
+        stats = cost_governor.get_run_stats()
+        assert stats['tokens_sent'] == 800
+        assert stats['tokens_received'] == 200
+        assert abs(stats['cost_usd'] - cost_governor.estimate_cost(800, 200)) < 1e-9
+        
+        cost_governor.check_limits_before_call(500, 500)
+        cost_governor.release_reservation()
+        assert cost_governor.get_run_stats()['tokens_sent'] == 800
+    
+    def test_concurrent_checks_cannot_overshoot_run_budget(self, cost_governor):
+        """Test concurrent calls cannot all pass against the same remaining budget."""
+        import config
+        
+        # Each call is estimated at 0.09 USD against a 1.0 USD run cap
+        workers = 20
+        barrier = threading.Barrier(workers, timeout=5)
+        passed = []
+        
+        def call():
+            barrier.wait()
+            try:
+                cost_governor.check_limits_before_call(1000, 1000)
+                passed.append(True)
+            except CostLimitExceeded:
+                pass
+        
+        threads = [threading.Thread(target=call) for _ in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        estimate = cost_governor.estimate_cost(1000, 1000)
+        assert len(passed) * estimate <= config.settings.max_usd_per_run
+        assert cost_governor.get_run_stats()['cost_usd'] <= config.settings.max_usd_per_run
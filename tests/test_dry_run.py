@@ -53,7 +53,7 @@ class TestDryRunMode:
             assert client.dry_run is False
             
             # Mock the actual API call
-            with patch('services.gumroad_client.requests.post') as mock_post:
+            with patch.object(client.session, 'post') as mock_post:
                 mock_response = MagicMock()
                 mock_response.json.return_value = {
                     "success": True,
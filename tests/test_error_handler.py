@@ -55,6 +55,14 @@ class TestErrorHandler:
         categorization = error_handler.categorize_error(error)
         assert categorization['is_transient'] is False
     
+    def test_categorize_error_matches_type_name_not_message(self, error_handler):
+        """Test that subclass names match and messages are not scanned."""
+        class APITimeoutError(Exception):
+            pass
+        
+        assert error_handler.categorize_error(APITimeoutError()) == (True, 'transient')
+        assert error_handler.categorize_error(Exception("Timeout")) == (False, 'unknown')
+    
     def test_log_error_saves_artifact(self, error_handler, temp_artifacts_dir, monkeypatch):
         """Test that log_error saves artifact to filesystem."""
         # Mock artifact path
@@ -92,8 +92,8 @@ class TestRedditIngestAgent:
 class TestHackerNewsIngestAgent:
     """Test HackerNews ingest agent."""
     
-    @patch('agents.hackernews_ingest.requests.get')
-    def test_hackernews_agent_fetch_posts(self, mock_get):
+    @patch('agents.hackernews_ingest.get_http_session')
+    def test_hackernews_agent_fetch_posts(self, mock_get_session):
         """Test HackerNews agent fetches posts from Algolia API."""
         from agents.hackernews_ingest import HackerNewsIngestAgent
         
@@ -118,7 +118,7 @@ class TestHackerNewsIngestAgent:
             ]
         }
         mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get_session.return_value.get.return_value = mock_response
         
         agent = HackerNewsIngestAgent(settings)
         posts = agent.fetch_posts()
@@ -135,8 +135,8 @@ class TestHackerNewsIngestAgent:
         agent = HackerNewsIngestAgent(Mock())
         assert agent.source_name == "hackernews"
     
-    @patch('agents.hackernews_ingest.requests.get')
-    def test_hackernews_agent_handles_api_failure(self, mock_get):
+    @patch('agents.hackernews_ingest.get_http_session')
+    def test_hackernews_agent_handles_api_failure(self, mock_get_session):
         """Test HackerNews agent handles API failures gracefully."""
         from agents.hackernews_ingest import HackerNewsIngestAgent
         
@@ -145,7 +145,7 @@ class TestHackerNewsIngestAgent:
         settings.hn_post_limit = 20
         settings.hn_story_types = "ask_hn"
         
-        mock_get.side_effect = Exception("API error")
+        mock_get_session.return_value.get.side_effect = Exception("API error")
         
         agent = HackerNewsIngestAgent(settings)
         posts = agent.fetch_posts()
@@ -158,8 +158,8 @@ class TestHackerNewsIngestAgent:
 class TestRSSIngestAgent:
     """Test RSS ingest agent."""
     
-    @patch('agents.rss_ingest.requests.get')
-    def test_rss_agent_parses_rss_feed(self, mock_get):
+    @patch('agents.rss_ingest.get_http_session')
+    def test_rss_agent_parses_rss_feed(self, mock_get_session):
         """Test RSS agent parses RSS 2.0 feeds correctly."""
         from agents.rss_ingest import RSSIngestAgent
         
@@ -185,7 +185,7 @@ class TestRSSIngestAgent:
         mock_response = Mock()
         mock_response.content = rss_xml.encode('utf-8')
         mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get_session.return_value.get.return_value = mock_response
         
         agent = RSSIngestAgent(settings)
         posts = agent.fetch_posts()
@@ -202,6 +202,37 @@ class TestRSSIngestAgent:
         agent = RSSIngestAgent(Mock())
         assert agent.source_name == "rss"
     
+    @patch('agents.rss_ingest.get_http_session')
+    def test_rss_agent_skips_failed_feed(self, mock_get_session):
+        """Test a failing feed does not drop posts from the other feeds."""
+        from agents.rss_ingest import RSSIngestAgent
+        
+        settings = Mock()
+        settings.rss_feed_urls = "https://bad.example.com/feed.xml, https://example.com/feed.xml"
+        settings.rss_post_limit = 20
+        
+        rss_xml = b"""<?xml version="1.0"?>
+        <rss version="2.0"><channel><item>
+            <title>Good Article</title>
+            <link>https://example.com/good</link>
+        </item></channel></rss>
+        """
+        
+        def fake_get(url, timeout):
+            if 'bad' in url:
+                raise ConnectionError("unreachable")
+            response = Mock()
+            response.content = rss_xml
+            return response
+        
+        mock_get_session.return_value.get.side_effect = fake_get
+        
+        agent = RSSIngestAgent(settings)
+        posts = agent.fetch_posts()
+        
+        assert [p['title'] for p in posts] == ['Good Article']
+        assert mock_get_session.return_value.get.call_count == 2
+    
     def test_rss_agent_handles_empty_feed_urls(self):
         """Test RSS agent handles empty feed URLs."""
         from agents.rss_ingest import RSSIngestAgent
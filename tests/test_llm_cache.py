@@ -0,0 +1,44 @@
+"""Tests for llm_cache module."""
+import pytest
+from services.llm_cache import LLMCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create an LLMCache backed by a temporary database."""
+    return LLMCache(str(tmp_path / "cache.db"))
+
+
+@pytest.mark.unit
+class TestLLMCache:
+    """Test suite for LLMCache class."""
+
+    def test_miss_returns_none(self, cache):
+        """Test that an unknown key is a miss."""
+        assert cache.get("missing") is None
+
+    def test_set_then_get(self, cache):
+        """Test that a stored response is returned for its key."""
+        cache.set("abc", "gpt-4", '{"ok": true}')
+        assert cache.get("abc") == '{"ok": true}'
+
+    def test_set_replaces_existing(self, cache):
+        """Test that storing under the same key overwrites."""
+        cache.set("abc", "gpt-4", "first")
+        cache.set("abc", "gpt-4", "second")
+        assert cache.get("abc") == "second"
+
+    def test_make_key_is_stable(self):
+        """Test that identical requests produce identical keys."""
+        messages = [{"role": "user", "content": "hi"}]
+        key1 = LLMCache.make_key("gpt-4", messages, max_tokens=100)
+        key2 = LLMCache.make_key("gpt-4", list(messages), max_tokens=100)
+        assert key1 == key2
+
+    def test_make_key_depends_on_request(self):
+        """Test that any request difference changes the key."""
+        messages = [{"role": "user", "content": "hi"}]
+        base = LLMCache.make_key("gpt-4", messages, max_tokens=100)
+        assert LLMCache.make_key("gpt-3.5-turbo", messages, max_tokens=100) != base
+        assert LLMCache.make_key("gpt-4", messages, max_tokens=200) != base
+        assert LLMCache.make_key("gpt-4", [{"role": "user", "content": "hey"}], max_tokens=100) != base
@@ -98,6 +98,19 @@ class TestLLMClient:
         with pytest.raises(CostLimitExceeded):
             client.call_structured("System prompt", "User content")
 
+    @patch('services.llm_client.OpenAI')
+    def test_failed_call_releases_reservation(self, mock_openai_class, mock_cost_governor):
+        """Test that a call that fails after the limit check frees its reserved estimate."""
+        client = LLMClient(mock_cost_governor)
+        client.retry_handler = Mock()
+        client.retry_handler.with_retry.side_effect = RuntimeError("API down")
+        
+        with pytest.raises(RuntimeError):
+            client.call_text("System", "User")
+        
+        mock_cost_governor.release_reservation.assert_called_once()
+        mock_cost_governor.record_usage.assert_not_called()
+
     @patch('services.llm_client.OpenAI')
     def test_call_structured_json_parsing(self, mock_openai_class, mock_cost_governor):
         """Test that structured call properly parses JSON response."""
@@ -182,3 +195,98 @@ class TestLLMClient:
         # Verify response_format was set
         call_args = mock_client_instance.chat.completions.create.call_args
         assert call_args[1]["response_format"] == {"type": "json_object"}
+
+    @patch('services.llm_client.OpenAI')
+    def test_deterministic_call_served_from_cache(self, mock_openai_class, mock_cost_governor, tmp_path):
+        """Test that a repeated temperature-0 call skips the API."""
+        from services.llm_cache import LLMCache
+        
+        mock_response = MagicMock()
+        mock_response.choices[0].message.content = '{"key": "value"}'
+        mock_response.usage.prompt_tokens = 50
+        mock_response.usage.completion_tokens = 25
+        
+        mock_client_instance = MagicMock()
+        mock_client_instance.chat.completions.create.return_value = mock_response
+        mock_openai_class.return_value = mock_client_instance
+        
+        client = LLMClient(mock_cost_governor, cache=LLMCache(str(tmp_path / "cache.db")))
+        first = client.call_structured("System", "User", temperature=0)
+        second = client.call_structured("System", "User", temperature=0)
+        
+        assert first == second == {"key": "value"}
+        mock_client_instance.chat.completions.create.assert_called_once()
+        mock_cost_governor.record_usage.assert_called_once_with(50, 25)
+
+    @patch('services.llm_client.OpenAI')
+    def test_nonzero_temperature_bypasses_cache(self, mock_openai_class, mock_cost_governor, tmp_path):
+        """Test that sampled calls are never cached."""
+        from services.llm_cache import LLMCache
+        
+        mock_response = MagicMock()
+        mock_response.choices[0].message.content = "Text"
+        mock_response.usage.prompt_tokens = 50
+        mock_response.usage.completion_tokens = 25
+        
+        mock_client_instance = MagicMock()
+        mock_client_instance.chat.completions.create.return_value = mock_response
+        mock_openai_class.return_value = mock_client_instance
+        
+        client = LLMClient(mock_cost_governor, cache=LLMCache(str(tmp_path / "cache.db")))
+        client.call_text("System", "User")
+        client.call_text("System", "User")
+        
+        assert mock_client_instance.chat.completions.create.call_count == 2
+
+    @patch('services.llm_client.OpenAI')
+    def test_cached_prompt_tokens_recorded(self, mock_openai_class, mock_cost_governor):
+        """Test that provider prefix-cache hits are passed to the cost governor."""
+        mock_response = MagicMock()
+        mock_response.choices[0].message.content = "Text"
+        mock_response.usage.prompt_tokens = 1200
+        mock_response.usage.completion_tokens = 25
+        mock_response.usage.prompt_tokens_details.cached_tokens = 1024
+        
+        mock_client_instance = MagicMock()
+        mock_client_instance.chat.completions.create.return_value = mock_response
+        mock_openai_class.return_value = mock_client_instance
+        
+        client = LLMClient(mock_cost_governor)
+        client.call_text("System", "User")
+        
+        mock_cost_governor.record_usage.assert_called_once_with(1200, 25)
+        mock_cost_governor.record_cached_tokens.assert_called_once_with(1024)
+
+    @patch('services.llm_client.OpenAI')
+    def test_streaming_stops_at_early_result(self, mock_openai_class, mock_cost_governor):
+        """Test that the stream is closed once early_result returns a verdict."""
+        def chunk(text):
+            c = MagicMock()
+            c.usage = None
+            c.choices[0].delta.content = text
+            return c
+        
+        consumed = []
+        
+        def chunks():
+            for text in ['{"pass"', ': false', ', "reasons": ["long report"']:
+                consumed.append(text)
+                yield chunk(text)
+        
+        mock_stream = MagicMock()
+        mock_stream.__iter__.return_value = chunks()
+        mock_client_instance = MagicMock()
+        mock_client_instance.chat.completions.create.return_value = mock_stream
+        mock_openai_class.return_value = mock_client_instance
+        
+        def early_result(partial):
+            return {"pass": False} if '"pass": false' in partial else None
+        
+        client = LLMClient(mock_cost_governor)
+        result = client.call_structured_streaming("System", "User", early_result)
+        
+        assert result == {"pass": False}
+        assert len(consumed) == 2
+        mock_stream.close.assert_called_once()
+        # No usage chunk arrives on an aborted stream, so estimates are recorded
+        mock_cost_governor.record_usage.assert_called_once_with(100, 100)
@@ -47,6 +47,22 @@ class TestProblem:
         assert "who_has_it" in result
         assert "evidence_quotes" in result
 
+    def test_problem_has_no_instance_dict(self):
+        """Test Problem stores fields in slots rather than a __dict__."""
+        problem = Problem(
+            discard=False,
+            problem_summary="Slotted",
+            who_has_it="Users",
+            why_it_matters="Memory",
+            current_bad_solutions=[],
+            urgency_score=5,
+            evidence_quotes=[]
+        )
+        
+        assert not hasattr(problem, "__dict__")
+        with pytest.raises(AttributeError):
+            problem.unexpected = True
+
     def test_problem_with_empty_lists(self):
         """Test Problem with empty lists."""
         problem = Problem(
@@ -194,3 +194,19 @@ class TestConfigValidatorMultiSource:
         
         assert not is_valid
         assert any('invalid' in error.lower() or 'data source' in error.lower() for error in errors)
+    
+    def test_reports_invalid_and_missing_subreddit_names(self):
+        """Test subreddit names are checked and an all-blank list is rejected."""
+        settings = Mock()
+        settings.reddit_subreddits = "good_one, x, bad name,,"
+        validator = ConfigValidator(settings)
+        validator._validate_subreddit_list()
+        assert validator.errors == [
+            "Invalid subreddit name: x",
+            "Invalid subreddit name: bad name"
+        ]
+        
+        settings.reddit_subreddits = " , ,"
+        validator.errors = []
+        validator._validate_subreddit_list()
+        assert validator.errors == ["No valid subreddits configured"]
@@ -0,0 +1,88 @@
+"""Tests for problem extraction agent."""
+import pytest
+from unittest.mock import Mock
+
+
+def _post(post_id):
+    return {
+        'id': post_id,
+        'title': f'Title {post_id}',
+        'body': 'Body text',
+        'subreddit': 'Entrepreneur',
+        'author': 'user',
+        'score': 10
+    }
+
+
+def _llm_client(model='gpt-4o'):
+    """Mock LLM client with a real model name and a rough token estimate."""
+    llm_client = Mock()
+    llm_client.model = model
+    llm_client.cost_governor.estimate_tokens.side_effect = lambda text: len(text) // 3
+    return llm_client
+
+
+@pytest.mark.unit
+class TestExtractProblemsBatch:
+    """Test batched problem extraction."""
+    
+    def test_results_matched_by_id(self):
+        """Test that results map back to posts even when reordered."""
+        from agents.problem_agent import extract_problems_batch
+        
+        llm_client = _llm_client()
+        llm_client.call_structured.return_value = {
+            'results': [
+                {'id': 'p2', 'discard': False, 'problem_summary': 'second'},
+                {'id': 'p1', 'discard': True, 'problem_summary': 'first'}
+            ]
+        }
+        
+        problems = extract_problems_batch([_post('p1'), _post('p2')], llm_client)
+        
+        llm_client.call_structured.assert_called_once()
+        assert problems[0]['problem_summary'] == 'first'
+        assert problems[1]['problem_summary'] == 'second'
+    
+    def test_missing_results_are_none(self):
+        """Test that posts without a result are left for per-post extraction."""
+        from agents.problem_agent import extract_problems_batch
+        
+        llm_client = _llm_client()
+        llm_client.call_structured.return_value = {
+            'results': [{'id': 'p1', 'discard': True}]
+        }
+        
+        problems = extract_problems_batch([_post('p1'), _post('p2')], llm_client)
+        
+        assert problems[0] is not None
+        assert problems[1] is None
+    
+    def test_malformed_response_returns_all_none(self):
+        """Test that a response without a results list yields no problems."""
+        from agents.problem_agent import extract_problems_batch
+        
+        llm_client = _llm_client()
+        llm_client.call_structured.return_value = {'discard': True}
+        
+        assert extract_problems_batch([_post('p1'), _post('p2')], llm_client) == [None, None]
+    
+    def test_full_batch_fits_model_limits(self):
+        """Test a full batch on gpt-4 is trimmed to fit its token limits."""
+        from agents.problem_agent import extract_problems_batch, MODEL_TOKEN_LIMITS
+        
+        llm_client = _llm_client('gpt-4')
+        llm_client.call_structured.return_value = {'results': []}
+        posts = [dict(_post(f'p{i}'), body='word ' * 400) for i in range(6)]
+        
+        problems = extract_problems_batch(posts, llm_client)
+        
+        context_tokens, output_tokens = MODEL_TOKEN_LIMITS['gpt-4']
+        system_prompt = llm_client.call_structured.call_args.args[0]
+        max_tokens = llm_client.call_structured.call_args.kwargs['max_tokens']
+        prompt_tokens = llm_client.cost_governor.estimate_tokens(system_prompt)
+        assert max_tokens <= output_tokens
+        assert prompt_tokens + max_tokens <= context_tokens
+        # Posts left out of the call are returned for per-post extraction
+        assert 'Post ID: p5' not in system_prompt
+        assert problems == [None] * 6
@@ -0,0 +1,52 @@
+"""Tests for rate_limiter module."""
+import pytest
+from services.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    """Manually advanced clock whose sleep moves time forward."""
+    
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+    
+    def time(self):
+        return self.now
+    
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.mark.unit
+class TestRateLimiter:
+    """Test suite for RateLimiter class."""
+    
+    def test_disabled_never_waits(self):
+        """Test a zero limit does not pace calls."""
+        clock = FakeClock()
+        limiter = RateLimiter(0, clock=clock.time, sleep=clock.sleep)
+        
+        for _ in range(10):
+            assert limiter.acquire() == 0.0
+        assert clock.sleeps == []
+    
+    def test_calls_are_spaced_evenly(self):
+        """Test back-to-back calls wait one interval each."""
+        clock = FakeClock()
+        limiter = RateLimiter(60, clock=clock.time, sleep=clock.sleep)
+        
+        waits = [limiter.acquire() for _ in range(3)]
+        
+        assert waits == [0.0, 1.0, 1.0]
+    
+    def test_idle_time_is_not_banked(self):
+        """Test a long pause does not allow a later burst."""
+        clock = FakeClock()
+        limiter = RateLimiter(60, clock=clock.time, sleep=clock.sleep)
+        
+        limiter.acquire()
+        clock.now += 30
+        
+        assert limiter.acquire() == 0.0
+        assert limiter.acquire() == 1.0
@@ -244,3 +244,32 @@ class TestSalesFeedback:
         
         assert result["suppress"] is False
         assert result["reason"] == ""
+    
+    def test_get_feedback_snapshot_matches_individual_calls(self, storage):
+        """Test that the combined snapshot equals the separate queries."""
+        current_time = int(time.time())
+        storage.save_sales_metrics("prod1", "AI Tools", 20, 20000, 500, 2, current_time)
+        storage.save_sales_metrics("prod2", "Zero Sales", 0, 0, 50, 0, current_time)
+        
+        sales_feedback = SalesFeedback(storage)
+        snapshot = sales_feedback.get_feedback_snapshot(lookback_days=30)
+        
+        assert snapshot["summary"] == sales_feedback.generate_feedback_summary(lookback_days=30)
+        assert snapshot["top_categories"] == sales_feedback.get_top_performing_categories(lookback_days=30)
+        assert snapshot["zero_sale_categories"] == sales_feedback.get_zero_sale_categories(lookback_days=30)
+    
+    def test_get_feedback_text_cached_for_the_day(self, storage, monkeypatch, tmp_path):
+        """Test that feedback text is computed once and reused from disk."""
+        from services import sales_feedback as sales_feedback_module
+        monkeypatch.setattr(sales_feedback_module.settings, 'artifacts_path', str(tmp_path))
+        storage.save_sales_metrics("prod1", "AI Tools", 3, 3000, 50, 0, int(time.time()))
+        
+        sales_feedback = SalesFeedback(storage)
+        first = sales_feedback.get_feedback_text(lookback_days=30)
+        
+        assert "Top-performing categories: AI Tools" in first
+        
+        # New data is not picked up until the cached entry expires
+        storage.save_sales_metrics("prod2", "Other", 9, 9000, 50, 0, int(time.time()))
+        assert sales_feedback.get_feedback_text(lookback_days=30) == first
+        assert len(os.listdir(tmp_path / "_cache")) == 1
@@ -94,8 +94,8 @@ class TestRedditClient:
 class TestGumroadClient:
     """Test suite for GumroadClient class."""
 
-    @patch('services.gumroad_client.requests')
-    def test_gumroad_client_initialization(self, mock_requests):
+    @patch('services.gumroad_client.get_http_session')
+    def test_gumroad_client_initialization(self, mock_get_session):
         """Test GumroadClient initialization."""
         from services.gumroad_client import GumroadClient
         
@@ -104,8 +104,8 @@ class TestGumroadClient:
         assert client.base_url == "https://api.gumroad.com/v2"
         assert client.access_token is not None
 
-    @patch('services.gumroad_client.requests')
-    def test_create_product_success(self, mock_requests):
+    @patch('services.gumroad_client.get_http_session')
+    def test_create_product_success(self, mock_get_session):
         """Test successful product creation."""
         from services.gumroad_client import GumroadClient
         
@@ -120,7 +120,7 @@ class TestGumroadClient:
             }
         }
         mock_response.raise_for_status.return_value = None
-        mock_requests.post.return_value = mock_response
+        mock_get_session.return_value.post.return_value = mock_response
         
         client = GumroadClient()
         result = client.create_product(
@@ -133,15 +133,15 @@ class TestGumroadClient:
         assert result["id"] == "prod123"
         assert result["name"] == "Test Product"
 
-    @patch('services.gumroad_client.requests')
-    def test_create_product_with_permalink(self, mock_requests):
+    @patch('services.gumroad_client.get_http_session')
+    def test_create_product_with_permalink(self, mock_get_session):
         """Test product creation with custom permalink."""
         from services.gumroad_client import GumroadClient
         
         mock_response = Mock()
         mock_response.json.return_value = {"success": True, "product": {"id": "prod123"}}
         mock_response.raise_for_status.return_value = None
-        mock_requests.post.return_value = mock_response
+        mock_get_session.return_value.post.return_value = mock_response
         
         client = GumroadClient()
         client.create_product(
@@ -152,11 +152,11 @@ class TestGumroadClient:
         )
         
         # Verify custom_permalink was passed
-        call_args = mock_requests.post.call_args
+        call_args = mock_get_session.return_value.post.call_args
         assert "custom_permalink" in call_args[1]["data"]
 
-    @patch('services.gumroad_client.requests')
-    def test_create_product_invalid_price(self, mock_requests):
+    @patch('services.gumroad_client.get_http_session')
+    def test_create_product_invalid_price(self, mock_get_session):
         """Test that invalid price raises ValueError."""
         from services.gumroad_client import GumroadClient
         
@@ -168,8 +168,8 @@ class TestGumroadClient:
         with pytest.raises(ValueError):
             client.create_product("Product", "Desc", price_cents=0)
 
-    @patch('services.gumroad_client.requests')
-    def test_create_product_api_failure(self, mock_requests):
+    @patch('services.gumroad_client.get_http_session')
+    def test_create_product_api_failure(self, mock_get_session):
         """Test handling of API failures."""
         from services.gumroad_client import GumroadClient
         
@@ -177,15 +177,15 @@ class TestGumroadClient:
         mock_response = Mock()
         mock_response.json.return_value = {"success": False}
         mock_response.raise_for_status.return_value = None
-        mock_requests.post.return_value = mock_response
+        mock_get_session.return_value.post.return_value = mock_response
         
         client = GumroadClient()
         result = client.create_product("Product", "Desc", price_cents=2999)
         
         assert result is None
     
-    @patch('services.gumroad_client.requests')
-    def test_fetch_sales_data_success(self, mock_requests):
+    @patch('services.gumroad_client.get_http_session')
+    def test_fetch_sales_data_success(self, mock_get_session):
         """Test successful sales data fetching."""
         from services.gumroad_client import GumroadClient
         
@@ -213,7 +213,7 @@ class TestGumroadClient:
             ]
         }
         mock_response.raise_for_status.return_value = None
-        mock_requests.get.return_value = mock_response
+        mock_get_session.return_value.get.return_value = mock_response
         
         client = GumroadClient()
         result = client.fetch_sales_data()
@@ -224,30 +224,30 @@ class TestGumroadClient:
         assert result[0]["revenue_cents"] == 10000
         assert result[1]["product_id"] == "prod2"
     
-    @patch('services.gumroad_client.requests')
-    def test_fetch_sales_data_no_products(self, mock_requests):
+    @patch('services.gumroad_client.get_http_session')
+    def test_fetch_sales_data_no_products(self, mock_get_session):
         """Test sales data fetching with no products."""
         from services.gumroad_client import GumroadClient
         
         mock_response = Mock()
         mock_response.json.return_value = {"success": True, "products": []}
         mock_response.raise_for_status.return_value = None
-        mock_requests.get.return_value = mock_response
+        mock_get_session.return_value.get.return_value = mock_response
         
         client = GumroadClient()
         result = client.fetch_sales_data()
         
         assert result == []
     
-    @patch('services.gumroad_client.requests')
-    def test_fetch_sales_data_api_failure(self, mock_requests):
+    @patch('services.gumroad_client.get_http_session')
+    def test_fetch_sales_data_api_failure(self, mock_get_session):
         """Test sales data fetching when API fails."""
         from services.gumroad_client import GumroadClient
         
         mock_response = Mock()
         mock_response.json.return_value = {"success": False}
         mock_response.raise_for_status.return_value = None
-        mock_requests.get.return_value = mock_response
+        mock_get_session.return_value.get.return_value = mock_response
         
         client = GumroadClient()
         result = client.fetch_sales_data()
@@ -110,6 +110,31 @@ class TestStorage:
         assert retrieved['id'] == 'get123'
         assert retrieved['title'] == 'Get Test'
 
+    def test_save_posts_bulk_returns_new_ids(self, storage):
+        """Test bulk insert skips existing and repeated posts."""
+        def make_post(post_id):
+            return {
+                'id': post_id,
+                'title': f'Bulk {post_id}',
+                'body': 'Content',
+                'created_utc': 1234567890,
+                'author': 'testuser',
+                'score': 10,
+                'url': f'https://example.com/{post_id}',
+                'source': 'hackernews'
+            }
+        
+        storage.save_post(make_post('bulk0'))
+        
+        new_ids = storage.save_posts_bulk([
+            make_post('bulk0'), make_post('bulk1'), make_post('bulk2'), make_post('bulk1')
+        ])
+        
+        assert new_ids == ['bulk1', 'bulk2']
+        assert storage.get_post('bulk2')['source'] == 'hackernews'
+        assert storage.save_posts_bulk([make_post('bulk1')]) == []
+        assert storage.save_posts_bulk([]) == []
+
     def test_get_nonexistent_post(self, storage):
         """Test retrieving a post that doesn't exist."""
         result = storage.get_post('nonexistent')
@@ -229,6 +254,23 @@ class TestStorage:
         assert 'spec_generation' in stages
         assert 'content_generation' in stages
 
+    def test_pipeline_run_batch_writes_on_flush(self, storage):
+        """Test buffered pipeline runs are only written when flushed."""
+        storage.save_post({'id': 'batch123', 'title': 'Batch Test', 'timestamp': 1234567890})
+        
+        runs = storage.pipeline_run_batch()
+        runs.log('batch123', 'problem_extraction', 'completed', '/tmp/problem.json')
+        runs.log('batch123', 'spec_generation', 'rejected', None, 'low_confidence')
+        
+        assert storage.get_pipeline_runs('batch123') == []
+        assert runs.flush() == 2
+        assert runs.flush() == 0
+        
+        logged = storage.get_pipeline_runs('batch123')
+        assert [r['stage'] for r in logged] == ['problem_extraction', 'spec_generation']
+        assert logged[1]['error_message'] == 'low_confidence'
+        assert all(r['created_at'] for r in logged)
+
     def test_raw_json_storage(self, storage):
         """Test that raw JSON is stored correctly."""
         post_data = {
@@ -313,3 +355,14 @@ class TestStorage:
         recent_uploads = storage.get_recent_uploaded_products(limit=10)
         assert len(recent_uploads) == 3
         assert recent_uploads[0]['post_id'] == 'upload0'  # Most recent first
+
+    def test_cost_period_totals_use_covering_index(self, storage):
+        """Test the dashboard's cost totals are answered from the index alone."""
+        conn = sqlite3.connect(storage.db_path)
+        plan = conn.execute("""
+            EXPLAIN QUERY PLAN
+            SELECT SUM(usd_cost), SUM(tokens_sent), SUM(tokens_received), COUNT(*)
+            FROM cost_tracking WHERE timestamp >= ?
+        """, (0,)).fetchall()
+        conn.close()
+        assert 'COVERING INDEX idx_cost_tracking_timestamp_totals' in plan[0][3]